@@ -6,11 +6,11 @@ config       : load_config, Config
 database     : open_db, init_db, import_csv, claim_rows, update_status, get_stats
 csv_store    : inspect_csv, validate_csv
 locking      : file_lock
-selenium_client : build_driver, ensure_logged_in, send_prompt_and_wait
-processor    : process_row
+selenium_client : build_driver, ensure_logged_in, send_prompt_and_wait, open_chat_tabs
+processor    : process_row, process_rows_in_tabs
 output_writer: build_output, save_output
 
 Entry point
 -----------
-python -m apm.chatgpt_ui.run_batch [--config PATH] [--import-only] [--stats]
+python -m apm.chatgpt_ui.run_batch [--config PATH] [--import-only] [--force-import] [--tabs K] [--stats]
 """
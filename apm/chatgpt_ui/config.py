@@ -28,6 +28,7 @@ class ProcessingConfig:
     max_retries: int = 3
     stale_lock_hours: float = 2.0
     keyword_filter: str = ""   # SQL fragment AND-combined with status clause; empty = no filter
+    keyword_groups: bool = False  # only claim export_candidates.KEYWORD_GROUPS matches (full-text index)
 
 
 @dataclass
@@ -36,6 +37,7 @@ class SeleniumConfig:
     headless: bool = False
     wait_seconds: int = 300        # max seconds to wait for ChatGPT to respond (5 minutes)
     per_row_retries: int = 3       # retry attempts per row before raising ChatGPTServerError
+    tabs: int = 1                  # ChatGPT tabs per browser; >1 keeps that many prompts in flight
     chrome_exe: str = r"C:\Users\balan\AppData\Local\Google\Chrome\Application\chrome.exe"
     chrome_profile: str = r"C:\selenium\chrome-profile"
 
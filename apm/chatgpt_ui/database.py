@@ -7,12 +7,14 @@ from multiple machines sharing the same database file over a network drive.
 from __future__ import annotations
 
 import csv
+import hashlib
+import itertools
 import json
 import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 log = logging.getLogger(__name__)
 
@@ -36,12 +38,70 @@ CREATE TABLE IF NOT EXISTS articles (
     processed_at    TEXT,
     output_file     TEXT,
     error_message   TEXT,
-    retry_count     INTEGER NOT NULL DEFAULT 0
+    retry_count     INTEGER NOT NULL DEFAULT 0,
+    is_candidate    INTEGER NOT NULL DEFAULT 0
 );
 CREATE UNIQUE INDEX IF NOT EXISTS idx_doi_hash ON articles(doi_hash);
 CREATE INDEX IF NOT EXISTS idx_status       ON articles(status);
+CREATE TABLE IF NOT EXISTS imports (
+    csv_path        TEXT PRIMARY KEY,
+    size            INTEGER,
+    mtime_ns        INTEGER,
+    content_hash    TEXT NOT NULL,
+    rows_read       INTEGER NOT NULL,
+    rows_inserted   INTEGER NOT NULL,
+    imported_at     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key             TEXT PRIMARY KEY,
+    value           TEXT
+);
+"""
+
+# Indexes behind claim_rows: one range scan per claimable status, in id order
+# (optionally restricted to keyword-group candidates), plus the few rows
+# holding a lock for the stale-lock check.
+_CLAIM_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_claim ON articles(status, is_candidate, id);
+CREATE INDEX IF NOT EXISTS idx_stale_lock ON articles(locked_at)
+    WHERE status IN ('Already Processing', 'In Progress');
+"""
+
+# Full-text index over title + abstract for the keyword pre-filter (see
+# keyword_match_sql).  External-content table: the text stays in articles and
+# the triggers keep the index in step with every insert, delete and edit.
+_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, abstract, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, abstract)
+    VALUES ('delete', old.id, old.title, old.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, abstract ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, abstract)
+    VALUES ('delete', old.id, old.title, old.abstract);
+    INSERT INTO articles_fts(rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+END;
 """
 
+# Staging table for import_csv; TEMP, so it lives in this connection's local
+# temp store rather than in the (possibly network-mounted) database file.
+_STAGE_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS import_stage (
+    doi         TEXT,
+    doi_hash    TEXT NOT NULL,
+    title       TEXT,
+    abstract    TEXT,
+    raw_data    TEXT NOT NULL
+)
+"""
+
+IMPORT_CHUNK_ROWS = 5_000
+
 
 # ---------------------------------------------------------------------------
 # Connection
@@ -58,7 +118,27 @@ def open_db(db_path: Path, timeout: float = 30.0) -> sqlite3.Connection:
 
 def init_db(conn: sqlite3.Connection) -> None:
     conn.executescript(_DDL)
+    _init_fts(conn)
+    # is_candidate was added after the first release of the articles table
+    cols = {r["name"] for r in conn.execute("PRAGMA table_info(articles)")}
+    if "is_candidate" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN is_candidate INTEGER NOT NULL DEFAULT 0")
     conn.commit()
+    conn.executescript(_CLAIM_INDEX_DDL)
+
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """Create the full-text index, filling it from existing rows the first time."""
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    ).fetchone()
+    conn.executescript(_FTS_DDL)
+    if not existed:
+        n = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        if n:
+            log.info("Building full-text index over %d existing articles ...", n)
+            with conn:
+                conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
 
 
 # ---------------------------------------------------------------------------
@@ -66,7 +146,6 @@ def init_db(conn: sqlite3.Connection) -> None:
 # ---------------------------------------------------------------------------
 
 def _doi_hash(doi: Optional[str], title: Optional[str] = None) -> str:
-    import hashlib
     key = (doi or title or "unknown").strip()
     return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
 
@@ -79,60 +158,248 @@ def _find_col(headers: list[str], candidates: list[str]) -> Optional[str]:
     return None
 
 
+def _file_sha256(path: Path, block: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(block), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 # ---------------------------------------------------------------------------
-# CSV import
+# Keyword pre-filter (FTS5)
 # ---------------------------------------------------------------------------
 
-def import_csv(conn: sqlite3.Connection, csv_path: Path) -> int:
-    """Import new rows from a CSV file. Skips rows whose doi_hash already exists.
+def keyword_match_query(groups: list[tuple[str, list[str]]]) -> str:
+    """Compile keyword groups into an FTS5 MATCH expression.
 
-    Rows where every field is blank (common Excel export artifact) are silently
-    dropped before deduplication so they do not consume the 'unknown' hash slot.
+    A row must match at least one term from EACH group: the groups are
+    AND-combined, the terms within a group OR-combined, over title and
+    abstract.  Terms are prefix matches on word boundaries — ``"driver"``
+    matches *driver*, *drivers* and *co-driver* but not *screwdriver*.
     """
-    with open(csv_path, encoding="utf-8-sig", newline="") as fh:
-        reader = csv.DictReader(fh)
-        headers = list(reader.fieldnames or [])
-        all_rows = list(reader)
-
-    doi_col      = _find_col(headers, ["DOI", "doi", "Doi"])
-    title_col    = _find_col(headers, ["Title", "title", "TITLE", "Article Title"])
-    abstract_col = _find_col(headers, ["Abstract", "abstract", "ABSTRACT", "Abstract Note"])
-
-    # Drop blank rows produced by Excel when saving CSV
-    rows = [r for r in all_rows if any(v.strip() for v in r.values())]
-    blank_skipped = len(all_rows) - len(rows)
-    if blank_skipped:
-        log.info("Skipped %d blank rows in %s.", blank_skipped, csv_path.name)
-
-    existing: set[str] = {
-        row[0] for row in conn.execute("SELECT doi_hash FROM articles")
-    }
+    clauses = []
+    for label, terms in groups:
+        terms = [t.strip() for t in terms if t.strip()]
+        if not terms:
+            raise ValueError(f"Keyword group {label!r} has no terms")
+        clauses.append("(" + " OR ".join('"' + t.replace('"', '""') + '"*' for t in terms) + ")")
+    return " AND ".join(clauses)
+
+
+def keyword_match_sql(groups: list[tuple[str, list[str]]]) -> str:
+    """A WHERE fragment selecting the articles that match *groups* via the FTS index.
+
+    Self-contained (the MATCH expression is an SQL literal), for one-off
+    queries such as the candidates export or :func:`reset_completed`.  To
+    claim by keyword groups, store the match with :func:`refresh_candidates`
+    and filter on ``is_candidate = 1`` instead: :func:`claim_rows` evaluates
+    its ``keyword_filter`` once per claimable status, so a MATCH there runs
+    three full-text queries for every claim.
+    """
+    query = keyword_match_query(groups).replace("'", "''")
+    return f"id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH '{query}')"
 
-    inserted = 0
+
+def refresh_candidates(
+    conn: sqlite3.Connection,
+    groups: list[tuple[str, list[str]]],
+    rebuild: bool = False,
+) -> int:
+    """Store the keyword-group match of each article in ``is_candidate``.
+
+    Claiming can then filter on ``is_candidate = 1`` through ``idx_claim``
+    instead of evaluating the match for every claim.  Only articles added
+    since the last refresh are matched, unless *groups* changed since then
+    or *rebuild* is set, in which case every article is re-flagged.  The
+    compiled query and the highest article id flagged are kept in ``meta``.
+
+    Returns the number of candidate articles.
+    """
+    query = keyword_match_query(groups)
+    meta = dict(conn.execute(
+        "SELECT key, value FROM meta WHERE key IN ('candidate_query', 'candidate_max_id')"
+    ).fetchall())
+    full = rebuild or meta.get("candidate_query") != query
+    since = 0 if full else int(meta.get("candidate_max_id") or 0)
+
+    match = "id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH :q)"
     with conn:
-        for row in rows:
-            doi      = (row.get(doi_col, "")      if doi_col      else "").strip()
-            title    = (row.get(title_col, "")    if title_col    else "").strip()
-            abstract = (row.get(abstract_col, "") if abstract_col else "").strip()
+        max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM articles").fetchone()[0]
+        params = {"q": query, "lo": since, "hi": max_id}
+        cleared = conn.execute(
+            f"UPDATE articles SET is_candidate = 0 "
+            f"WHERE id > :lo AND id <= :hi AND is_candidate = 1 AND NOT {match}", params,
+        ).rowcount
+        flagged = conn.execute(
+            f"UPDATE articles SET is_candidate = 1 "
+            f"WHERE id > :lo AND id <= :hi AND is_candidate = 0 AND {match}", params,
+        ).rowcount
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("candidate_query", query), ("candidate_max_id", str(max_id))],
+        )
+    if full or flagged or cleared:
+        log.info("Candidate flags %s: %d set, %d cleared.",
+                 "rebuilt" if full else "updated", flagged, cleared)
+    return conn.execute("SELECT COUNT(*) FROM articles WHERE is_candidate = 1").fetchone()[0]
 
-            if not doi and not title:
-                log.debug("Skipping row with no DOI and no Title.")
-                continue
 
-            dh = _doi_hash(doi or None, title or None)
+# ---------------------------------------------------------------------------
+# CSV import
+# ---------------------------------------------------------------------------
+
+def _row_dict(headers: list[str], values: list[str]) -> dict:
+    """*values* keyed by *headers*, exactly as ``csv.DictReader`` builds rows."""
+    row: dict = dict(zip(headers, values))
+    if len(values) > len(headers):
+        row[None] = values[len(headers):]
+    elif len(values) < len(headers):
+        for h in headers[len(values):]:
+            row[h] = None
+    return row
+
+
+def _importable_rows(
+    fh, counts: dict[str, int],
+) -> Iterator[tuple[str, str, str, str, list[str]]]:
+    """``(doi, doi_hash, title, abstract, values)`` for each importable CSV row.
+
+    Rows are plain ``csv.reader`` lists; the dict for ``raw_data`` is only
+    built for rows that turn out to be new.  Tallies rows read and blank
+    rows dropped into *counts*.
+    """
+    reader  = csv.reader(fh)
+    headers = next(reader, [])
+    counts["headers"] = headers
+
+    def _index(candidates: list[str]) -> Optional[int]:
+        col = _find_col(headers, candidates)
+        return headers.index(col) if col is not None else None
+
+    doi_i      = _index(["DOI", "doi", "Doi"])
+    title_i    = _index(["Title", "title", "TITLE", "Article Title"])
+    abstract_i = _index(["Abstract", "abstract", "ABSTRACT", "Abstract Note"])
 
-            if dh in existing:
-                continue
+    def _get(values: list[str], i: Optional[int]) -> str:
+        return values[i].strip() if i is not None and i < len(values) else ""
 
+    for values in reader:
+        if not values:          # empty line; csv.DictReader skips these too
+            continue
+        counts["read"] += 1
+        # Drop blank rows produced by Excel when saving CSV
+        if not "".join(values).strip():
+            counts["blank"] += 1
+            continue
+
+        doi, title = _get(values, doi_i), _get(values, title_i)
+        if not doi and not title:
+            log.debug("Skipping row with no DOI and no Title.")
+            continue
+
+        yield doi, _doi_hash(doi or None, title or None), title, _get(values, abstract_i), values
+
+
+def import_csv(
+    conn: sqlite3.Connection,
+    csv_path: Path,
+    *,
+    chunk_rows: int = IMPORT_CHUNK_ROWS,
+    force: bool = False,
+) -> int:
+    """Import new rows from a CSV file. Skips rows whose doi_hash already exists.
+
+    Rows where every field is blank (common Excel export artifact) are silently
+    dropped before deduplication so they do not consume the 'unknown' hash slot.
+
+    The CSV is streamed in chunks of *chunk_rows*, one short transaction per
+    chunk: the chunk's hashes are looked up in ``idx_doi_hash``, only rows
+    not yet in ``articles`` are serialised and written to a temporary
+    staging table with ``executemany``, and the staged rows are copied into
+    ``articles`` with ``INSERT OR IGNORE`` (the first occurrence of a hash
+    within the CSV wins, as before).  Memory use is bounded by the chunk
+    size, not the CSV.
+
+    Each completed import is recorded in the ``imports`` table with the
+    file's size, mtime and SHA-256.  If size and mtime still match, the file
+    is not even read and 0 is returned in milliseconds; if only the mtime
+    moved (file touched or re-synced) the hash decides, and a matching hash
+    just refreshes the recorded size and mtime.  Pass ``force=True`` to
+    import regardless.
+    """
+    key = str(Path(csv_path).resolve())
+    st = csv_path.stat()  # before reading: a write during the import forces a re-check
+    last = conn.execute(
+        "SELECT size, mtime_ns, content_hash, imported_at FROM imports WHERE csv_path = ?",
+        (key,),
+    ).fetchone()
+    unchanged_stat = last is not None and (last["size"], last["mtime_ns"]) == (st.st_size, st.st_mtime_ns)
+    if not force and unchanged_stat:
+        log.info("%s unchanged since its import at %s; skipping import.",
+                 csv_path.name, last["imported_at"])
+        return 0
+
+    content_hash = _file_sha256(csv_path)
+    if not force and last is not None and last["content_hash"] == content_hash:
+        with conn:
             conn.execute(
-                """
-                INSERT INTO articles (doi, doi_hash, title, abstract, raw_data, status)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (doi, dh, title, abstract, json.dumps(dict(row)), STATUS_PENDING),
+                "UPDATE imports SET size = ?, mtime_ns = ? WHERE csv_path = ?",
+                (st.st_size, st.st_mtime_ns, key),
             )
-            existing.add(dh)
-            inserted += 1
+        log.info("%s content unchanged since its import at %s; skipping import.",
+                 csv_path.name, last["imported_at"])
+        return 0
+
+    conn.execute(_STAGE_DDL)
+    counts = {"read": 0, "blank": 0}
+    inserted = 0
+    with open(csv_path, encoding="utf-8-sig", newline="") as fh:
+        rows = _importable_rows(fh, counts)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_rows))
+            if not chunk:
+                break
+            headers = counts["headers"]
+            hashes = list({r[1] for r in chunk})
+            with conn:
+                existing = {
+                    r[0] for r in conn.execute(
+                        "SELECT doi_hash FROM articles "
+                        f"WHERE doi_hash IN ({','.join('?' * len(hashes))})",
+                        hashes,
+                    )
+                }
+                conn.executemany(
+                    "INSERT INTO import_stage (doi, doi_hash, title, abstract, raw_data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((doi, dh, title, abstract, json.dumps(_row_dict(headers, values)))
+                     for doi, dh, title, abstract, values in chunk if dh not in existing),
+                )
+                # rowcount, unlike total_changes, leaves out the FTS trigger writes
+                inserted += conn.execute(
+                    """
+                    INSERT OR IGNORE INTO articles (doi, doi_hash, title, abstract, raw_data, status)
+                    SELECT doi, doi_hash, title, abstract, raw_data, ?
+                    FROM import_stage ORDER BY rowid
+                    """,
+                    (STATUS_PENDING,),
+                ).rowcount
+                conn.execute("DELETE FROM import_stage")
+
+    if counts["blank"]:
+        log.info("Skipped %d blank rows in %s.", counts["blank"], csv_path.name)
+
+    with conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO imports
+                (csv_path, size, mtime_ns, content_hash, rows_read, rows_inserted, imported_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, st.st_size, st.st_mtime_ns, content_hash, counts["read"], inserted,
+             datetime.utcnow().isoformat()),
+        )
 
     if inserted:
         log.info("Imported %d new rows from %s.", inserted, csv_path.name)
@@ -162,11 +429,29 @@ def claim_rows(
 
     If *keyword_filter* is a non-empty SQL fragment (a WHERE sub-clause), it is
     AND-combined with the status conditions so only matching rows are claimed.
+    ``is_candidate = 1`` (see :func:`refresh_candidates`) is answered from
+    ``idx_claim`` directly; any other fragment is evaluated in each of the
+    three status branches below, so keep it cheap (no full-text MATCH).
+
+    Each status condition is queried separately for its first *batch_size*
+    ids, so every branch is an index range scan rather than one scan of the
+    whole table; the union is the same set of rows the single OR'd query
+    would return.
     """
     now          = datetime.utcnow().isoformat()
     stale_cutoff = (datetime.utcnow() - timedelta(hours=stale_lock_hours)).isoformat()
 
     extra = f"AND ({keyword_filter})" if keyword_filter and keyword_filter.strip() else ""
+    branches = [
+        ("status = 'Yet To Process'",                                     ()),
+        ("status = 'Failed' AND retry_count < ?",                         (max_retries,)),
+        ("status IN ('Already Processing', 'In Progress') AND locked_at < ?", (stale_cutoff,)),
+    ]
+    union = "\n            UNION ALL\n            ".join(
+        f"SELECT id FROM (SELECT id FROM articles WHERE {cond} {extra} ORDER BY id LIMIT ?)"
+        for cond, _ in branches
+    )
+    params = [p for _, args in branches for p in (*args, batch_size)] + [batch_size]
 
     original_isolation = conn.isolation_level
     conn.isolation_level = None          # switch to manual transaction control
@@ -176,17 +461,13 @@ def claim_rows(
             f"""
             SELECT id, doi, doi_hash, title, abstract, raw_data, retry_count
             FROM articles
-            WHERE
-            (
-                status = 'Yet To Process'
-                OR (status = 'Failed'                               AND retry_count < ?)
-                OR (status IN ('Already Processing','In Progress')  AND locked_at < ?)
+            WHERE id IN (
+            {union}
             )
-            {extra}
             ORDER BY id
             LIMIT ?
             """,
-            (max_retries, stale_cutoff, batch_size),
+            params,
         ).fetchall()
 
         if rows:
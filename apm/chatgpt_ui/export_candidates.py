@@ -1,7 +1,8 @@
 """Export keyword-filtered candidate papers from the SQLite database to CSV.
 
-Applies AND-combined keyword groups against title + abstract so you can
-review what the SQL pre-filter is catching before committing ChatGPT calls.
+Applies AND-combined keyword groups against title + abstract (through the
+database's full-text index) so you can review what the pre-filter is
+catching before committing ChatGPT calls.
 
 Usage
 -----
@@ -21,6 +22,7 @@ import logging
 import sqlite3
 import sys
 from pathlib import Path
+from typing import Optional
 
 log = logging.getLogger(__name__)
 
@@ -46,14 +48,33 @@ KEYWORD_GROUPS: list[tuple[str, list[str]]] = [
 
 def _build_filter_sql() -> str:
     """Return the WHERE clause that AND-combines all keyword groups."""
-    group_clauses = []
-    for _label, terms in KEYWORD_GROUPS:
-        term_clauses = []
-        for t in terms:
-            term_clauses.append(f'LOWER(title) LIKE "%{t}%"')
-            term_clauses.append(f'LOWER(abstract) LIKE "%{t}%"')
-        group_clauses.append("(" + " OR ".join(term_clauses) + ")")
-    return "\nAND ".join(group_clauses)
+    from .database import keyword_match_sql
+    return keyword_match_sql(KEYWORD_GROUPS)
+
+
+def update_candidate_flags(conn: sqlite3.Connection, rebuild: bool = False) -> int:
+    """Flag the articles matching ``KEYWORD_GROUPS`` as ``is_candidate``.
+
+    Run after each import; returns the number of candidates.
+    """
+    from .database import refresh_candidates
+    return refresh_candidates(conn, KEYWORD_GROUPS, rebuild=rebuild)
+
+
+def claim_filter_sql(processing) -> Optional[str]:
+    """The ``keyword_filter`` to claim (and rescreen) rows with under *processing*.
+
+    ``processing.keyword_groups`` restricts claiming to the rows this module
+    exports as candidates, through the ``is_candidate`` flag kept by
+    :func:`update_candidate_flags`; a ``processing.keyword_filter`` SQL
+    fragment is AND-combined with it.  ``None`` means no filter.
+    """
+    parts = []
+    if processing.keyword_groups:
+        parts.append("is_candidate = 1")
+    if processing.keyword_filter and processing.keyword_filter.strip():
+        parts.append(processing.keyword_filter)
+    return " AND ".join(f"({p})" for p in parts) or None
 
 
 _CSV_COLUMNS = [
@@ -6,6 +6,8 @@ import json
 import logging
 import sqlite3
 import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 
 from selenium import webdriver
@@ -18,13 +20,16 @@ from .database import (
     update_status,
 )
 from .output_writer import build_output, save_output
-from .selenium_client import navigate_to_new_chat, send_prompt_and_wait
+from .selenium_client import PendingResponse, navigate_to_new_chat, send_prompt_and_wait
 
 log = logging.getLogger(__name__)
 
 # Seconds to wait between per-row retry attempts
 _RETRY_PAUSE = 10
 
+# Seconds to sleep when no tab needed attention (multi-tab mode)
+_POLL_PAUSE = 0.5
+
 
 class ChatGPTServerError(RuntimeError):
     """Raised when ChatGPT returns no response after all per-row retry attempts.
@@ -43,6 +48,41 @@ def _build_prompt(template: str, title: str, abstract: str) -> str:
     return "\n".join(parts)
 
 
+@dataclass
+class _RowJob:
+    """A claimed row being sent to ChatGPT, with its retry state."""
+
+    row: sqlite3.Row
+    prompt: str
+    raw_data: dict
+    output_file: Path
+    attempt: int = 0
+    retry_at: float = 0.0
+    pending: PendingResponse | None = None
+
+
+def _start_row(
+    conn: sqlite3.Connection,
+    cfg: Config,
+    row: sqlite3.Row,
+    prompt_template: str,
+) -> _RowJob | None:
+    """Mark *row* In Progress and return its job, or ``None`` if its output already exists."""
+    output_file = cfg.output_path / f"{row['doi_hash']}.json"
+    if output_file.exists():
+        log.info("[%d] Output already exists (%s) — marking Completed.", row["id"], output_file.name)
+        update_status(conn, row["id"], STATUS_COMPLETED, output_file=str(output_file))
+        return None
+
+    update_status(conn, row["id"], STATUS_IN_PROGRESS)
+    try:
+        raw_data = json.loads(row["raw_data"]) if isinstance(row["raw_data"], str) else {}
+    except (json.JSONDecodeError, TypeError):
+        raw_data = {}
+    prompt = _build_prompt(prompt_template, row["title"] or "", row["abstract"] or "")
+    return _RowJob(row=row, prompt=prompt, raw_data=raw_data, output_file=output_file)
+
+
 def process_row(
     conn: sqlite3.Connection,
     driver: webdriver.Chrome,
@@ -63,24 +103,12 @@ def process_row(
     doi      = row["doi"] or ""
     doi_hash = row["doi_hash"]
     title    = row["title"] or ""
-    abstract = row["abstract"] or ""
 
-    output_dir  = cfg.output_path
-    output_file = output_dir / f"{doi_hash}.json"
-
-    if output_file.exists():
-        log.info("[%d] Output already exists (%s) — marking Completed.", row_id, output_file.name)
-        update_status(conn, row_id, STATUS_COMPLETED, output_file=str(output_file))
+    job = _start_row(conn, cfg, row, prompt_template)
+    if job is None:
         return True
+    output_file, raw_data, prompt = job.output_file, job.raw_data, job.prompt
 
-    update_status(conn, row_id, STATUS_IN_PROGRESS)
-
-    try:
-        raw_data = json.loads(row["raw_data"]) if isinstance(row["raw_data"], str) else {}
-    except (json.JSONDecodeError, TypeError):
-        raw_data = {}
-
-    prompt       = _build_prompt(prompt_template, title, abstract)
     max_attempts = cfg.selenium.per_row_retries
     last_error: Exception | None = None
 
@@ -135,3 +163,119 @@ def process_row(
         f"Row {row_id} ({title[:60]!r}): no response after {max_attempts} attempts. "
         "Server may be down or rate-limited. Terminating batch."
     )
+
+
+# ---------------------------------------------------------------------------
+# Multi-tab processing
+# ---------------------------------------------------------------------------
+
+def process_rows_in_tabs(
+    conn: sqlite3.Connection,
+    driver: webdriver.Chrome,
+    cfg: Config,
+    rows: list[sqlite3.Row],
+    prompt_template: str,
+    handles: list[str],
+    send_pause: float = 0.0,
+) -> tuple[int, int]:
+    """Process *rows* across the ChatGPT tabs *handles* of one driver.
+
+    Each idle tab takes the next row and sends its prompt in a new chat, at
+    most one send per *send_pause* seconds across all tabs.  Tabs waiting on
+    a response are polled in turn, so up to ``len(handles)`` responses are
+    generated at once.  Empty responses and errors are retried as in
+    :func:`process_row`.  When a row exhausts its attempts it is marked
+    Failed and no further rows are started; responses already underway in
+    other tabs are still collected.
+
+    Returns ``(completed, failed)``.
+    """
+    queue        = deque(rows)
+    jobs: dict[str, _RowJob | None] = dict.fromkeys(handles)
+    max_attempts = cfg.selenium.per_row_retries
+    completed    = 0
+    failed       = 0
+    stopped      = False
+    next_send    = 0.0
+
+    while (queue and not stopped) or any(jobs.values()):
+        progressed = False
+        for tab, handle in enumerate(handles, 1):
+            job = jobs[handle]
+            if job is None:
+                if stopped or not queue:
+                    continue
+                job = _start_row(conn, cfg, queue.popleft(), prompt_template)
+                if job is None:
+                    completed += 1
+                    continue
+                jobs[handle] = job
+
+            row_id   = job.row["id"]
+            response = None
+            error: Exception | None = None
+            try:
+                if job.pending is None:
+                    if time.monotonic() < max(job.retry_at, next_send):
+                        continue
+                    job.attempt += 1
+                    log.info("[%d] Tab %d, attempt %d/%d — sending to ChatGPT: %s",
+                             row_id, tab, job.attempt, max_attempts, (job.row["title"] or "")[:70])
+                    driver.switch_to.window(handle)
+                    navigate_to_new_chat(driver)
+                    next_send   = time.monotonic() + send_pause
+                    job.pending = PendingResponse(
+                        driver, job.prompt, wait_seconds=cfg.selenium.wait_seconds, handle=handle,
+                    )
+                    progressed = True
+                    continue
+
+                response = job.pending.poll()
+                if response is None:
+                    continue
+                if not response:
+                    raise ValueError("ChatGPT returned an empty response.")
+            except Exception as exc:
+                error = exc
+
+            progressed  = True
+            job.pending = None
+            if error is None:
+                output_data = build_output(
+                    row_id=row_id,
+                    doi=job.row["doi"] or "",
+                    doi_hash=job.row["doi_hash"],
+                    title=job.row["title"] or "",
+                    raw_data=job.raw_data,
+                    response_text=response,
+                    machine_id=cfg.processing.machine_id,
+                )
+                save_output(job.output_file, output_data)
+                update_status(conn, row_id, STATUS_COMPLETED, output_file=str(job.output_file))
+                log.info("[%d] Completed -> %s", row_id, job.output_file.name)
+                completed += 1
+                jobs[handle] = None
+            elif job.attempt < max_attempts:
+                log.warning(
+                    "[%d] Attempt %d/%d failed (%s: %s) — retrying in %ds ...",
+                    row_id, job.attempt, max_attempts, type(error).__name__, error, _RETRY_PAUSE,
+                )
+                job.retry_at = time.monotonic() + _RETRY_PAUSE
+            else:
+                log.error(
+                    "[%d] All %d attempts failed. Last error: %s: %s",
+                    row_id, max_attempts, type(error).__name__, error,
+                )
+                update_status(conn, row_id, STATUS_FAILED,
+                              error_message=f"{type(error).__name__}: {error}", increment_retry=True)
+                failed += 1
+                jobs[handle] = None
+                if not stopped:
+                    log.error("ChatGPT server unreachable — no further rows will be started; "
+                              "finishing the responses already underway.")
+                    stopped = True
+
+        if not progressed:
+            time.sleep(_POLL_PAUSE)
+
+    return completed, failed
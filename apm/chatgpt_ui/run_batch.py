@@ -11,6 +11,9 @@ python -m apm.chatgpt_ui.run_batch
 
 # Override settings
 python -m apm.chatgpt_ui.run_batch --config setting/chatgpt_ui/config.yaml --machine-id computer_2
+
+# Keep 3 prompts in flight at once, in 3 tabs of the same browser
+python -m apm.chatgpt_ui.run_batch --tabs 3
 """
 
 from __future__ import annotations
@@ -30,8 +33,9 @@ from .database import (
     claim_rows,
     get_stats,
 )
-from .processor import process_row, ChatGPTServerError
-from .selenium_client import build_driver, ensure_logged_in, navigate_to_new_chat
+from .export_candidates import claim_filter_sql, update_candidate_flags
+from .processor import process_row, process_rows_in_tabs, ChatGPTServerError
+from .selenium_client import build_driver, ensure_logged_in, navigate_to_new_chat, open_chat_tabs
 
 log = logging.getLogger(__name__)
 
@@ -82,7 +86,7 @@ def _claim_with_retry(conn, cfg, max_attempts: int = 5):
                 batch_size=cfg.processing.batch_size,
                 max_retries=cfg.processing.max_retries,
                 stale_lock_hours=cfg.processing.stale_lock_hours,
-                keyword_filter=cfg.processing.keyword_filter or None,
+                keyword_filter=claim_filter_sql(cfg.processing),
             )
         except sqlite3.OperationalError as exc:
             if "locked" in str(exc).lower() and attempt < max_attempts:
@@ -118,6 +122,23 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Import the CSV into the database and exit without processing.",
     )
+    parser.add_argument(
+        "--force-import",
+        action="store_true",
+        help="Re-read the CSV even if it is unchanged since the last import.",
+    )
+    parser.add_argument(
+        "--rebuild-candidates",
+        action="store_true",
+        help="Re-match every row against the keyword groups, not just new ones.",
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Override selenium.tabs: process K rows at once in K tabs of one browser.",
+    )
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -134,6 +155,8 @@ def main(argv: list[str] | None = None) -> int:
     cfg = load_config(args.config)
     if args.machine_id:
         cfg.processing.machine_id = args.machine_id
+    if args.tabs > 0:
+        cfg.selenium.tabs = args.tabs
 
     log.info("Machine ID : %s", cfg.processing.machine_id)
     log.info("Database   : %s", cfg.db_path)
@@ -149,7 +172,9 @@ def main(argv: list[str] | None = None) -> int:
         log.error("Master CSV not found: %s", cfg.master_csv_path)
         return 1
 
-    import_csv(conn, cfg.master_csv_path)
+    import_csv(conn, cfg.master_csv_path, force=args.force_import)
+    if cfg.processing.keyword_groups:
+        update_candidate_flags(conn, rebuild=args.rebuild_candidates)
 
     if args.import_only or args.stats:
         _print_stats(get_stats(conn))
@@ -191,20 +216,26 @@ def main(argv: list[str] | None = None) -> int:
         time.sleep(3)
         ensure_logged_in(driver)
 
-        for i, row in enumerate(rows, 1):
-            log.info("--- Row %d / %d (id=%d) ---", i, len(rows), row["id"])
-            try:
-                success = process_row(conn, driver, cfg, row, prompt_template)
-            except ChatGPTServerError as exc:
-                log.error("ChatGPT server unreachable — terminating batch early: %s", exc)
-                failed += 1
-                break
-            if success:
-                completed += 1
-            else:
-                failed += 1
-            if i < len(rows):
-                time.sleep(_ROW_PAUSE)
+        if cfg.selenium.tabs > 1:
+            handles = open_chat_tabs(driver, min(cfg.selenium.tabs, len(rows)))
+            completed, failed = process_rows_in_tabs(
+                conn, driver, cfg, rows, prompt_template, handles, send_pause=_ROW_PAUSE,
+            )
+        else:
+            for i, row in enumerate(rows, 1):
+                log.info("--- Row %d / %d (id=%d) ---", i, len(rows), row["id"])
+                try:
+                    success = process_row(conn, driver, cfg, row, prompt_template)
+                except ChatGPTServerError as exc:
+                    log.error("ChatGPT server unreachable — terminating batch early: %s", exc)
+                    failed += 1
+                    break
+                if success:
+                    completed += 1
+                else:
+                    failed += 1
+                if i < len(rows):
+                    time.sleep(_ROW_PAUSE)
 
     finally:
         try:
@@ -160,6 +160,23 @@ def navigate_to_new_chat(driver: webdriver.Chrome) -> None:
     time.sleep(2)
 
 
+def open_chat_tabs(driver: webdriver.Chrome, count: int) -> list[str]:
+    """Open ChatGPT in *count* tabs of *driver*, the current tab included.
+
+    Returns the tabs' window handles; the current tab comes first and is
+    left selected.  The tabs share the browser profile, so one login covers
+    them all.
+    """
+    handles = [driver.current_window_handle]
+    for _ in range(count - 1):
+        driver.switch_to.new_window("tab")
+        driver.get(CHATGPT_URL)
+        handles.append(driver.current_window_handle)
+    driver.switch_to.window(handles[0])
+    log.info("Opened %d ChatGPT tabs.", len(handles))
+    return handles
+
+
 # ---------------------------------------------------------------------------
 # Input box
 # ---------------------------------------------------------------------------
@@ -256,6 +273,62 @@ def _extract_last_response(driver: webdriver.Chrome) -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
+class PendingResponse:
+    """A prompt sent in one tab whose response is still being awaited.
+
+    Sending happens on construction; :meth:`poll` then checks the tab once
+    without blocking.  Each poll switches the driver to the tab first, so
+    responses in several tabs of one driver can be awaited side by side.
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        prompt: str,
+        wait_seconds: int = 120,
+        handle: str | None = None,
+    ) -> None:
+        self.driver       = driver
+        self.handle       = handle or driver.current_window_handle
+        self.wait_seconds = wait_seconds
+
+        driver.switch_to.window(self.handle)
+        input_box = _get_input_box(driver, wait_seconds=30)
+        _send_text_to_box(driver, input_box, prompt)
+
+        log.info("Waiting for ChatGPT to start responding (up to 90 s)...")
+        self._started   = False
+        self._deadline  = time.monotonic() + 90
+        self._settle_at: float | None = None
+
+    def poll(self) -> str | None:
+        """Return the response text once it is complete, otherwise ``None``.
+
+        A finished response that could not be extracted is returned as ``""``.
+        """
+        self.driver.switch_to.window(self.handle)
+        now = time.monotonic()
+        if self._settle_at is not None:
+            return _extract_last_response(self.driver) if now >= self._settle_at else None
+
+        if not self._started:
+            if not (_generation_started(self.driver) or _is_generating(self.driver)):
+                if now < self._deadline:
+                    return None
+                log.warning("ChatGPT did not start responding within 90 s — proceeding anyway.")
+            log.info("Response started — waiting for completion...")
+            self._started  = True
+            self._deadline = now + self.wait_seconds
+
+        if _is_generating(self.driver):
+            if now < self._deadline:
+                return None
+            log.warning("Timed out after %ds waiting for ChatGPT.", self.wait_seconds)
+
+        self._settle_at = now + 1   # allow DOM to settle
+        return None
+
+
 def send_prompt_and_wait(
     driver: webdriver.Chrome,
     prompt: str,
@@ -265,26 +338,7 @@ def send_prompt_and_wait(
 
     Returns the response text, or an empty string if nothing could be extracted.
     """
-    input_box = _get_input_box(driver, wait_seconds=30)
-    _send_text_to_box(driver, input_box, prompt)
-
-    log.info("Waiting for ChatGPT to start responding (up to 90 s)...")
-    start_deadline = time.monotonic() + 90
-    while time.monotonic() < start_deadline:
-        if _generation_started(driver) or _is_generating(driver):
-            break
+    pending = PendingResponse(driver, prompt, wait_seconds=wait_seconds)
+    while (response := pending.poll()) is None:
         time.sleep(0.5)
-    else:
-        log.warning("ChatGPT did not start responding within 90 s — proceeding anyway.")
-
-    log.info("Response started — waiting for completion...")
-    deadline = time.monotonic() + wait_seconds
-    while time.monotonic() < deadline:
-        if not _is_generating(driver):
-            break
-        time.sleep(1)
-    else:
-        log.warning("Timed out after %ds waiting for ChatGPT.", wait_seconds)
-
-    time.sleep(1)   # allow DOM to settle
-    return _extract_last_response(driver)
+    return response
@@ -34,9 +34,9 @@ import argparse
 import csv
 import logging
 import re
-import string
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # ── Path setup ────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -51,12 +51,12 @@ if hasattr(sys.stderr, "reconfigure"):
 from scopus_automation.browser import build_driver, set_download_dir
 from scopus_automation.config import ScopusConfig
 from scopus_automation.cited_by import download_cited_by, _extract_paper_id
-from scopus_automation.dedupe import (
-    combine_ris_directory,
-    _normalise_doi, _get_doi, _get_eid, _get_title, _get_year,
+from scopus_automation.dedupe import combine_ris_directory
+from scopus_automation.fingerprint import (
+    fp_doi, fp_title_year, ris_fingerprint,
 )
 from scopus_automation.logging_setup import setup_logging
-from scopus_automation.ris import parse_ris_file, write_ris_file
+from scopus_automation.ris import iter_ris_file, write_ris_file
 
 log = logging.getLogger(__name__)
 
@@ -113,57 +113,33 @@ def _build_masterlist_fingerprints(csv_path: Path) -> set[str]:
     with csv_path.open(encoding="utf-8") as fh:
         reader = csv.DictReader(fh)
         for row in reader:
-            doi = row.get("DOI", "").strip()
-            if doi:
-                fps.add("doi:" + _normalise_doi(doi))
-                continue
-
-            # Fall back to normalised title + year
-            title = row.get("Title", "").strip().lower()
-            title = title.translate(str.maketrans("", "", string.punctuation))
-            title = re.sub(r"\s+", " ", title).strip()
-
-            year_raw = row.get("Publication Year", "") or row.get("Date", "")
-            m = re.search(r"\d{4}", str(year_raw))
-            year = m.group(0) if m else ""
-
-            if title:
-                fps.add(f"title_year:{title}|{year}")
+            fp = fp_doi(row.get("DOI") or "")
+            if not fp:
+                # Fall back to normalised title + year
+                year_raw = row.get("Publication Year", "") or row.get("Date", "")
+                fp = fp_title_year(row.get("Title") or "", year_raw)
+            if fp:
+                fps.add(fp)
 
     log.info("Built %d masterlist fingerprints from %s", len(fps), csv_path.name)
     return fps
 
 
-def _ris_fingerprint(entry: dict) -> str:
-    """Return the same-style fingerprint for a RIS entry."""
-    doi = _get_doi(entry)
-    if doi:
-        return "doi:" + doi
-
-    title = _get_title(entry)
-    year  = _get_year(entry)
-    if title:
-        return f"title_year:{title}|{year}"
-
-    return "unknown:" + str(entry)
-
-
 def _filter_against_masterlist(
-    entries: list[dict],
+    entries: Iterable[dict],
     masterlist_fps: set[str],
-) -> tuple[list[dict], int]:
-    """Remove entries whose fingerprint is in masterlist_fps.
+    stats: dict,
+) -> Iterator[dict]:
+    """Yield the entries whose fingerprint is not in masterlist_fps.
 
-    Returns (kept_entries, removed_count).
+    The number of entries dropped is counted in ``stats["removed"]``.
     """
-    kept, removed = [], 0
+    stats["removed"] = 0
     for entry in entries:
-        fp = _ris_fingerprint(entry)
-        if fp in masterlist_fps:
-            removed += 1
+        if ris_fingerprint(entry) in masterlist_fps:
+            stats["removed"] += 1
         else:
-            kept.append(entry)
-    return kept, removed
+            yield entry
 
 
 # ── Input loading ─────────────────────────────────────────────────────────────
@@ -317,14 +293,16 @@ def run(force: bool = False) -> None:
 
     # ── Filter against masterlist ─────────────────────────────────────────────
     print(f"\nFiltering against masterlist ({len(masterlist_fps)} entries)...")
-    batch_entries = parse_ris_file(COMBINED_RIS)
-    kept_entries, removed_count = _filter_against_masterlist(batch_entries, masterlist_fps)
-    write_ris_file(kept_entries, NEW_ONLY_RIS)
+    filter_stats: dict = {}
+    kept_count = write_ris_file(
+        _filter_against_masterlist(iter_ris_file(COMBINED_RIS), masterlist_fps, filter_stats),
+        NEW_ONLY_RIS,
+    )
 
     print(f"\nDone.")
     print(f"  Unique in batch:          {unique_count}")
-    print(f"  Already in masterlist:    {removed_count}")
-    print(f"  Net-new for Zotero:       {len(kept_entries)}")
+    print(f"  Already in masterlist:    {filter_stats['removed']}")
+    print(f"  Net-new for Zotero:       {kept_count}")
     print(f"  Zotero-ready RIS:         {NEW_ONLY_RIS}")
     print()
     print("ZOTERO IMPORT:")
@@ -0,0 +1,168 @@
+"""
+Benchmark: claim_rows on a large screening database under contention.
+
+Builds a synthetic ``articles`` database (most rows already screened, a
+few percent keyword-group candidates, some failed rows and stale locks) and
+has several processes claim batches from it at once, the way several
+machines share one database file.  Each keyword-filter mode gets a fresh
+copy of the database:
+
+    like   the LOWER(...) LIKE "%term%" fragment the configs used to carry
+    fts    keyword_match_sql(KEYWORD_GROUPS), a full-text MATCH per claim
+    flag   is_candidate = 1, the precomputed keyword-group flag
+
+Claims that give up on the lock (SQLite busy timeout) are counted as
+``locked``; with no lock failures every mode claims the same rows.
+
+Usage:
+    python benchmarks/bench_claim_rows.py
+    python benchmarks/bench_claim_rows.py --rows 100000 --procs 2 --modes fts flag
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from apm.chatgpt_ui.database import (  # noqa: E402
+    claim_rows, init_db, keyword_match_sql, open_db, refresh_candidates,
+)
+from apm.chatgpt_ui.export_candidates import KEYWORD_GROUPS  # noqa: E402
+
+FILLER = ("signal model study method result analysis system data control design "
+          "network learning response performance measure effect").split()
+
+
+def _like_filter() -> str:
+    groups = []
+    for _label, terms in KEYWORD_GROUPS:
+        likes = [f'LOWER({col}) LIKE "%{t}%"' for t in terms for col in ("title", "abstract")]
+        groups.append("(" + " OR ".join(likes) + ")")
+    return " AND ".join(groups)
+
+
+MODES = {
+    "like": _like_filter,
+    "fts": lambda: keyword_match_sql(KEYWORD_GROUPS),
+    "flag": lambda: "is_candidate = 1",
+}
+
+
+def make_db(path: Path, n: int, seed: int = 0) -> int:
+    """Write the synthetic database; returns the number of candidate rows."""
+    rng = random.Random(seed)
+    stale = (datetime.utcnow() - timedelta(hours=6)).isoformat()
+
+    def _text(k: int, candidate: bool) -> str:
+        words = rng.choices(FILLER, k=k)
+        if candidate:
+            words[1:1] = ["EEG", "fatigue", "of", "drivers"]
+        return " ".join(words)
+
+    def _rows():
+        for i in range(n):
+            candidate = rng.random() < 0.05
+            status, locked_at = rng.choices(
+                [("Completed", None), ("Yet To Process", None), ("Failed", None),
+                 ("Already Processing", stale)],
+                weights=[60, 38, 1, 1],
+            )[0]
+            yield (f"10.1/{i}", f"h{i:012d}", _text(10, candidate), _text(60, candidate),
+                   "{}", status, locked_at)
+
+    conn = open_db(path)
+    init_db(conn)
+    with conn:
+        conn.executemany(
+            "INSERT INTO articles (doi, doi_hash, title, abstract, raw_data, status, locked_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _rows(),
+        )
+    n_cand = refresh_candidates(conn, KEYWORD_GROUPS)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return n_cand
+
+
+def _claimer(db: str, mode: str, index: int, claims: int, batch: int, start, out) -> None:
+    keyword_filter = MODES[mode]()
+    conn = open_db(Path(db))
+    start.wait()
+    latencies, ids, locked = [], [], 0
+    for _ in range(claims):
+        t0 = time.perf_counter()
+        try:
+            rows = claim_rows(conn, f"m{index}", batch, max_retries=3, stale_lock_hours=2,
+                              keyword_filter=keyword_filter)
+        except sqlite3.OperationalError as exc:  # busy_timeout ran out
+            if "locked" not in str(exc):
+                raise
+            locked += 1
+            continue
+        finally:
+            latencies.append(time.perf_counter() - t0)
+        ids.extend(r["id"] for r in rows)
+    conn.close()
+    out.put((latencies, ids, locked))
+
+
+def run(db: Path, mode: str, procs: int, claims: int, batch: int) -> tuple[list[float], float, list[int], int]:
+    ctx = mp.get_context("spawn")
+    start, out = ctx.Barrier(procs + 1), ctx.Queue()
+    workers = [ctx.Process(target=_claimer, args=(str(db), mode, i, claims, batch, start, out))
+               for i in range(procs)]
+    for w in workers:
+        w.start()
+    start.wait()
+    t0 = time.perf_counter()
+    results = [out.get() for _ in workers]
+    wall = time.perf_counter() - t0
+    for w in workers:
+        w.join()
+    latencies = [x for lat, _, _ in results for x in lat]
+    ids = sorted(i for _, got, _ in results for i in got)
+    return latencies, wall, ids, sum(n for _, _, n in results)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--rows", type=int, default=500_000)
+    ap.add_argument("--procs", type=int, default=4)
+    ap.add_argument("--claims", type=int, default=25, help="claims per process")
+    ap.add_argument("--batch", type=int, default=10)
+    ap.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template.db"
+        t0 = time.perf_counter()
+        n_cand = make_db(template, args.rows)
+        print(f"{args.rows:,} rows ({n_cand:,} candidates) built in {time.perf_counter() - t0:.0f} s; "
+              f"{args.procs} processes x {args.claims} claims of {args.batch}\n")
+        print(f"{'mode':>5}  {'mean ms':>8}  {'p95 ms':>8}  {'max ms':>8}  {'claims/s':>8}  "
+              f"{'locked':>6}  {'same rows':>9}")
+        first = None
+        for mode in args.modes:
+            db = Path(tmp) / f"{mode}.db"
+            shutil.copyfile(template, db)
+            lat, wall, ids, locked = run(db, mode, args.procs, args.claims, args.batch)
+            lat.sort()
+            first = ids if first is None else first
+            print(f"{mode:>5}  {statistics.mean(lat) * 1e3:>8.1f}  "
+                  f"{lat[int(0.95 * (len(lat) - 1))] * 1e3:>8.1f}  {lat[-1] * 1e3:>8.1f}  "
+                  f"{(len(lat) - locked) / wall:>8.1f}  {locked:>6}  {str(ids == first):>9}")
+
+
+if __name__ == "__main__":
+    main()
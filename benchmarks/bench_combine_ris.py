@@ -0,0 +1,74 @@
+"""
+Benchmark: combine_ris_directory, serial vs. process-pool parsing.
+
+Writes a synthetic ``cited_by_raw``-style folder (one small RIS export per
+parent paper, with overlapping citing papers) and times the full combine —
+parse, deduplicate, write — for each worker count.  Output bytes are checked
+to be identical across worker counts.
+
+Usage:
+    python benchmarks/bench_combine_ris.py
+    python benchmarks/bench_combine_ris.py --files 5000 --per-file 40 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scopus_automation.dedupe import combine_ris_directory  # noqa: E402
+from scopus_automation.ris import write_ris_file  # noqa: E402
+
+
+def make_folder(root: Path, files: int, per_file: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    pool = files * per_file // 3  # roughly a third of citing papers are unique
+    for f in range(files):
+        entries = []
+        for _ in range(per_file):
+            k = rng.randrange(pool)
+            entries.append({
+                "TY": "JOUR",
+                "TI": f"Citing paper number {k} on driver fatigue and EEG",
+                "AU": [f"Author{k % 97}, A.", f"Author{k % 89}, B."],
+                "PY": str(2000 + k % 25),
+                "DO": f"10.1000/cite.{k}" if k % 4 else "",
+                "AB": "Abstract text " * 30,
+                "KW": ["EEG", "fatigue", "driving"],
+            })
+        write_ris_file(entries, root / f"parent_{f:05d}" / "cited_by.ris")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--files", type=int, default=2_000)
+    ap.add_argument("--per-file", type=int, default=25)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "cited_by_raw"
+        make_folder(src, args.files, args.per_file)
+        print(f"{args.files:,} files x {args.per_file} entries, {os.cpu_count()} CPU(s)\n")
+        print(f"{'workers':>7}  {'wall s':>7}  {'unique':>7}  {'dups':>7}  {'same output':>11}")
+        reference = None
+        for workers in dict.fromkeys(args.workers):
+            out = Path(tmp) / f"out_{workers}" / "combined.ris"
+            t0 = time.perf_counter()
+            unique, dups = combine_ris_directory(src, out, workers=workers)
+            elapsed = time.perf_counter() - t0
+            data = out.read_bytes()
+            reference = reference or data
+            print(f"{workers:>7}  {elapsed:>7.2f}  {unique:>7,}  {dups:>7,}  "
+                  f"{str(data == reference):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark: dedup fingerprints, former per-module helpers vs. the shared
+``scopus_automation.fingerprint`` engine.
+
+The "old" column re-implements the helpers as they were before the shared
+module: a fresh ``str.maketrans`` table and uncompiled ``re`` calls per value,
+and the title normalised separately for each rule.  Inputs repeat papers the
+way overlapping cited-by exports do (``--unique`` distinct papers among
+``--records``).  Caches are cleared before every timed run.
+
+Usage:
+    python benchmarks/bench_fingerprint.py
+    python benchmarks/bench_fingerprint.py --records 200000 --unique 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scopus_automation import fingerprint as fpm  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Former implementations
+# ---------------------------------------------------------------------------
+
+def _old_norm_doi(doi):
+    doi = str(doi).strip().lower()
+    return re.sub(r"^https?://(dx\.)?doi\.org/", "", doi)
+
+
+def _old_norm_title(title):
+    t = str(title).lower()
+    t = t.translate(str.maketrans("", "", string.punctuation))
+    return re.sub(r"\s+", " ", t).strip()
+
+
+def old_rule_fingerprints(doi, eid, sid, pmid, isbn, title, year, author):
+    d = _old_norm_doi(doi)
+    e, s, p = str(eid).strip(), str(sid).strip(), str(pmid).strip()
+    i = re.sub(r"[\s\-]", "", str(isbn)).strip()
+    t = _old_norm_title(title)
+    y = re.search(r"\d{4}", str(year))
+    t2 = _old_norm_title(title)
+    a = str(author).split(",")[0].strip().lower()
+    a = a.translate(str.maketrans("", "", string.punctuation))
+    a = re.sub(r"\s+", " ", a).strip()
+    return (
+        f"doi:{d}" if d else "",
+        f"eid:{e}" if e and "2-s2.0" in e else "",
+        f"scopus_id:{s}" if s and s.isdigit() else "",
+        f"pmid:{p}" if p and p.isdigit() else "",
+        f"isbn:{i}" if i else "",
+        f"title_year:{t}|{y.group(0) if y else ''}" if t else "",
+        f"title_author:{t2}|{a}" if t2 and a else "",
+    )
+
+
+def old_ris_dedup_key(entry):
+    doi = entry.get("DO", "")
+    if doi:
+        return "doi", _old_norm_doi(doi)
+    n1 = str(entry.get("N1", ""))
+    m = re.search(r"2-s2\.0-\d+", n1)
+    if m:
+        return "eid", m.group(0)
+    title = _old_norm_title(entry.get("TI", ""))
+    m = re.search(r"\d{4}", str(entry.get("PY", "")).strip())
+    return "title_year", f"{title}|{m.group(0) if m else ''}"
+
+
+# ---------------------------------------------------------------------------
+# Data
+# ---------------------------------------------------------------------------
+
+def make_data(records: int, unique: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+             for _ in range(3_000)]
+    papers = []
+    for k in range(unique):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(6, 14))).title() + ": A Study."
+        doi = f"https://doi.org/10.{1000 + k % 500}/X.{k}" if k % 3 else ""
+        papers.append((doi, f"2-s2.0-{85000000000 + k}" if k % 5 else "", str(k),
+                       "", "", title, str(1990 + k % 35), f"Author{k % 400}, A. B."))
+    keys = [papers[rng.randrange(unique)] for _ in range(records)]
+    entries = [{"TY": "JOUR", "TI": t, "PY": y, "DO": d, "N1": f"Scopus EID {e}" if e else ""}
+               for d, e, _, _, _, t, y, _ in keys]
+    return keys, entries
+
+
+def _time(fn) -> float:
+    fpm._normalise_title.cache_clear()
+    fpm._normalise_doi.cache_clear()
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--records", type=int, default=100_000)
+    ap.add_argument("--unique", type=int, default=30_000)
+    args = ap.parse_args()
+
+    keys, entries = make_data(args.records, args.unique)
+    assert [old_rule_fingerprints(*k) for k in keys] == fpm.rule_fingerprints_many(keys)
+    assert [old_ris_dedup_key(e) for e in entries] == fpm.ris_dedup_keys(entries)
+
+    rows = [
+        ("reference rule fingerprints",
+         lambda: [old_rule_fingerprints(*k) for k in keys],
+         lambda: [fpm.rule_fingerprints(*k) for k in keys],
+         lambda: fpm.rule_fingerprints_many(keys)),
+        ("RIS dedup keys",
+         lambda: [old_ris_dedup_key(e) for e in entries],
+         lambda: [fpm.ris_dedup_key(e) for e in entries],
+         lambda: fpm.ris_dedup_keys(entries)),
+        ("title normalisation",
+         lambda: [_old_norm_title(k[5]) for k in keys],
+         lambda: [fpm.normalise_title(k[5]) for k in keys],
+         lambda: fpm.normalise_titles(k[5] for k in keys)),
+    ]
+    print(f"{args.records:,} records, {args.unique:,} distinct papers\n")
+    print(f"{'':<28}  {'old s':>6}  {'scalar s':>8}  {'batch s':>7}  {'speed-up':>8}")
+    for name, old, scalar, batch in rows:
+        t_old, t_scalar, t_batch = _time(old), _time(scalar), _time(batch)
+        print(f"{name:<28}  {t_old:>6.2f}  {t_scalar:>8.2f}  {t_batch:>7.2f}  "
+              f"{t_old / t_batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: MasterList fingerprint index build, row-wise vs. vectorised.
+
+Generates a synthetic master list shaped like a Zotero export (DOI, EID,
+Scopus ID, PMID, ISBN, title, year, author) and times both builders.
+
+Usage:
+    python benchmarks/bench_fingerprint_index.py
+    python benchmarks/bench_fingerprint_index.py --sizes 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pipeline.master_list import _frame_fingerprints, _row_fingerprints  # noqa: E402
+
+_WORDS = (
+    "eeg fatigue driver drowsiness detection deep learning network signal "
+    "analysis classification attention vigilance model feature spectral"
+).split()
+
+
+def make_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        title = " ".join(rng.choice(_WORDS) for _ in range(8)).title() + f": Part {i}"
+        rows.append({
+            "Title": title,
+            "Publication Year": str(rng.randint(1990, 2026)),
+            "Author": f"Author{rng.randint(0, n)}, A.; Other, B.",
+            "DOI": f"10.{1000 + i % 9000}/x.{i}" if rng.random() < 0.8 else "",
+            "ISBN": f"978-0-{i:06d}-1" if rng.random() < 0.05 else "",
+            "scopus_eid": f"2-s2.0-{85000000000 + i}" if rng.random() < 0.6 else "",
+            "scopus_id": str(85000000000 + i) if rng.random() < 0.6 else "",
+            "pmid": str(30000000 + i) if rng.random() < 0.2 else "",
+        })
+    return pd.DataFrame(rows).astype(str)
+
+
+def build_rowwise(df: pd.DataFrame) -> dict[str, int]:
+    cache: dict[str, int] = {}
+    for idx, row in df.iterrows():
+        for fp in _row_fingerprints(row):
+            if fp not in cache:
+                cache[fp] = int(idx)
+    return cache
+
+
+def _time(fn, df: pd.DataFrame) -> tuple[float, dict[str, int]]:
+    t0 = time.perf_counter()
+    out = fn(df)
+    return time.perf_counter() - t0, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    args = ap.parse_args()
+
+    print(f"{'rows':>9}  {'iterrows (s)':>13}  {'vectorised (s)':>15}  {'speed-up':>8}")
+    for n in args.sizes:
+        df = make_frame(n)
+        t_row, expected = _time(build_rowwise, df)
+        t_vec, actual = _time(_frame_fingerprints, df)
+        assert actual == expected, "vectorised index differs from row-wise index"
+        print(f"{n:>9,}  {t_row:>13.2f}  {t_vec:>15.2f}  {t_row / t_vec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
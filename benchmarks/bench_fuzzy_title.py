@@ -0,0 +1,109 @@
+"""
+Benchmark: near-duplicate title lookup, MinHash/LSH index vs. pairwise scan.
+
+Builds a synthetic master list of random multi-word titles, then looks up
+perturbed copies (one-character typo or an appended subtitle) of some of them
+plus unrelated titles.  Reports index build time, per-query time, recall on
+the perturbed copies, and agreement with the exact pairwise Jaccard scan.
+
+Usage:
+    python benchmarks/bench_fuzzy_title.py
+    python benchmarks/bench_fuzzy_title.py --sizes 10000 100000 --queries 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pipeline.fuzzy_title import (  # noqa: E402
+    DEFAULT_THRESHOLD, MIN_TITLE_LENGTH, TitleLSH, jaccard, shingles,
+)
+
+
+def make_titles(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    vocab = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+        for _ in range(5_000)
+    ]
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(6, 14))) for _ in range(n)]
+
+
+def make_queries(titles: list[str], n: int, seed: int = 1) -> list[tuple[str, int]]:
+    """``(query title, expected index or -1)`` pairs: half perturbed, half unrelated."""
+    rng = random.Random(seed)
+    unrelated = make_titles(n, seed=seed + 1)
+    queries = []
+    for i in range(n):
+        if i % 2:
+            queries.append((unrelated[i], -1))
+            continue
+        j = rng.randrange(len(titles))
+        t = titles[j]
+        if i % 4:
+            pos = rng.randrange(len(t))
+            t = t[:pos] + rng.choice(string.ascii_lowercase) + t[pos + 1:]
+        else:
+            t += " a review"
+        queries.append((t, j))
+    return queries
+
+
+def pairwise(titles: list[str], query: str, threshold: float):
+    q = shingles(query)
+    best = None
+    for i, t in enumerate(titles):
+        if len(t) < MIN_TITLE_LENGTH:
+            continue
+        sim = jaccard(q, shingles(t))
+        if sim >= threshold and (best is None or sim > best[1]):
+            best = (i, sim)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    ap.add_argument("--queries", type=int, default=1_000)
+    ap.add_argument("--pairwise-queries", type=int, default=20,
+                    help="queries also answered by the O(N) scan (it is slow)")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = ap.parse_args()
+
+    print(f"{'titles':>9}  {'build (s)':>9}  {'LSH ms/q':>9}  {'scan ms/q':>10}  "
+          f"{'recall':>7}  {'agree':>7}")
+    for n in args.sizes:
+        titles = make_titles(n)
+        queries = make_queries(titles, args.queries)
+
+        t0 = time.perf_counter()
+        index = TitleLSH()
+        index.add_many(enumerate(titles))
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        hits = [index.query(q, args.threshold) for q, _ in queries]
+        t_lsh = (time.perf_counter() - t0) / len(queries)
+
+        expected = [(hit, j) for hit, (q, j) in zip(hits, queries) if j >= 0]
+        found = sum(1 for hit, j in expected if hit is not None and hit[0] == j)
+
+        sample = queries[:args.pairwise_queries]
+        t0 = time.perf_counter()
+        exact = [pairwise(titles, q, args.threshold) for q, _ in sample]
+        t_scan = (time.perf_counter() - t0) / len(sample)
+        agree = sum(1 for a, b in zip(hits, exact) if a == b)
+
+        print(f"{n:>9,}  {t_build:>9.2f}  {t_lsh * 1e3:>9.2f}  {t_scan * 1e3:>10.1f}  "
+              f"{found / max(len(expected), 1):>7.1%}  {agree:>3}/{len(sample):<3}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: deduplicate_references, serial vs. process-pool fingerprinting.
+
+Generates a synthetic child batch (with repeats inside the batch and overlap
+with a synthetic master list) and times the dedup engine with increasing
+worker counts, checking every run returns exactly the serial result.
+
+Usage:
+    python benchmarks/bench_parallel_dedup.py
+    python benchmarks/bench_parallel_dedup.py --refs 100000 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_fingerprint_index import make_frame  # noqa: E402
+from pipeline.dedup_engine import deduplicate_references  # noqa: E402
+from pipeline.master_list import MasterList  # noqa: E402
+from pipeline.models import Reference  # noqa: E402
+
+
+def make_refs(n: int, master_rows: int, seed: int = 2) -> list[Reference]:
+    rng = random.Random(seed)
+    refs = []
+    for i in range(n):
+        j = rng.randrange(n)  # ~1/3 of refs repeat another ref in the batch
+        k = rng.randrange(master_rows * 2)  # ~1/2 of DOIs exist in the master list
+        refs.append(Reference(
+            title=f"Synthetic Child Paper On Driver Fatigue: Part {j}",
+            year=str(2000 + j % 25),
+            authors=[f"Author{j}, A.", "Other, B."],
+            doi=f"10.{1000 + k % 9000}/x.{k}" if rng.random() < 0.7 else "",
+            scopus_eid=f"2-s2.0-{90000000000 + j}" if rng.random() < 0.5 else "",
+        ))
+    return refs
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--refs", type=int, default=50_000)
+    ap.add_argument("--master-rows", type=int, default=50_000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--chunk-size", type=int, default=5_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "master.csv"
+        make_frame(args.master_rows).to_csv(path, index=False, encoding="utf-8-sig")
+        ml = MasterList.load(path, index_sidecar=False)
+        ml._get_cache()
+        refs = make_refs(args.refs, args.master_rows)
+
+        print(f"{'workers':>7}  {'dedup (s)':>9}  {'new':>7}  {'dupes':>7}")
+        baseline = None
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            res = deduplicate_references(refs, ml, workers=workers, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - t0
+            outcome = ([id(r) for r in res.new_references], res.duplicates)
+            if baseline is None:
+                baseline = outcome
+            assert outcome == baseline, "parallel result differs from serial result"
+            print(f"{workers:>7}  {elapsed:>9.2f}  {res.new_count:>7,}  {res.duplicate_count:>7,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: memoised vs. recomputed Reference fingerprints.
+
+Runs the lookup sequence a pipeline step performs for every child reference
+— dedup against the master list, bulk add, then mark_exported — once with
+the per-Reference fingerprint memo and once with it bypassed (fingerprints
+recomputed on every lookup, as before the memo existed).
+
+Usage:
+    python benchmarks/bench_reference_fingerprints.py
+    python benchmarks/bench_reference_fingerprints.py --refs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pipeline.dedup_engine as dedup_engine  # noqa: E402
+import pipeline.master_list as master_list  # noqa: E402
+from bench_fingerprint_index import make_frame  # noqa: E402
+from bench_parallel_dedup import make_refs  # noqa: E402
+from pipeline.master_list import MasterList  # noqa: E402
+
+
+def _recompute(ref):
+    fps = master_list._key_fingerprints(ref.identity_key())
+    ref._fingerprints = (None, fps, tuple(f for f in fps if f))
+    return fps
+
+
+def run(path: Path, n_refs: int, memo: bool) -> dict[str, float]:
+    patched = master_list._reference_rule_fingerprints if memo else _recompute
+    master_list._reference_rule_fingerprints = patched
+    dedup_engine._reference_rule_fingerprints = patched
+
+    ml = MasterList.load(path, index_sidecar=False)
+    ml._get_cache()
+    refs = make_refs(n_refs, ml.row_count)
+    times = {}
+
+    t0 = time.perf_counter()
+    result = dedup_engine.deduplicate_references(refs, ml)
+    times["dedup"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ml.bulk_add_or_update(result.new_references)
+    times["bulk_add"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for ref in result.new_references:
+        ml.mark_exported(ref)
+    times["mark_exported"] = time.perf_counter() - t0
+    times["total"] = sum(times.values())
+    return times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--refs", type=int, default=50_000)
+    ap.add_argument("--master-rows", type=int, default=50_000)
+    args = ap.parse_args()
+
+    original = master_list._reference_rule_fingerprints
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "master.csv"
+        make_frame(args.master_rows).to_csv(path, index=False, encoding="utf-8-sig")
+        try:
+            recomputed = run(path, args.refs, memo=False)
+        finally:
+            master_list._reference_rule_fingerprints = original
+            dedup_engine._reference_rule_fingerprints = original
+        memoised = run(path, args.refs, memo=True)
+
+    print(f"{'step':<14}  {'recompute (s)':>13}  {'memoised (s)':>12}  {'speed-up':>8}")
+    for step in recomputed:
+        a, b = recomputed[step], memoised[step]
+        print(f"{step:<14}  {a:>13.2f}  {b:>12.2f}  {a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
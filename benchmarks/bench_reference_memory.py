@@ -0,0 +1,110 @@
+"""
+Benchmark: resident memory of child References built from RIS entries.
+
+Builds N References the way the citation-discovery ingest does
+(``Reference.from_ris_entry`` on freshly parsed RIS dicts, abstracts
+included) and reports the traced heap they hold, the time to build them
+(untraced) and the time to turn them back into RIS entries for export.  ``--raw dict``
+keeps each original entry as a plain dict on the Reference (the behaviour
+before raw entries were packed) for comparison.
+
+Usage:
+    python benchmarks/bench_reference_memory.py
+    python benchmarks/bench_reference_memory.py --refs 20000 --raw dict
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pipeline.models import Reference  # noqa: E402
+from pipeline.ris_exporter import _reference_to_ris_entry  # noqa: E402
+
+WORDS = ("driver fatigue EEG drowsiness detection alpha theta power spectral "
+         "vigilance simulator steering lane departure classifier").split()
+
+
+def make_entries(n: int, seed: int = 0) -> Iterator[dict]:
+    """Scopus-like RIS entries, generated lazily so only the References hold memory."""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield {
+            "TY": "JOUR",
+            "AU": [f"Author{rng.randrange(5000)}, {chr(65 + k)}." for k in range(rng.randint(1, 6))],
+            "TI": " ".join(rng.choices(WORDS, k=12)) + f" {i}",
+            "T2": f"Journal of {rng.choice(WORDS).title()} Research",
+            "PY": str(rng.randint(1990, 2025)),
+            "VL": str(rng.randint(1, 80)),
+            "SP": str(rng.randint(1, 900)),
+            "DO": f"10.1000/j.{i}",
+            "UR": f"https://www.scopus.com/inward/record.uri?eid=2-s2.0-{85000000000 + i}",
+            "AB": " ".join(rng.choices(WORDS, k=rng.randint(150, 300))),
+            "KW": rng.sample(WORDS, 5),
+            "SN": f"{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+            "PB": "Elsevier Ltd",
+            "LA": "English",
+            "N1": f"Export Date: 1 January 2025; Cited By: {rng.randrange(300)}",
+            "C7": f"2-s2.0-{85000000000 + i}",
+        }
+
+
+def _build(entries, raw_mode: str) -> list[Reference]:
+    refs = []
+    for entry in entries:
+        ref = Reference.from_ris_entry(entry, source_file="cited_by.ris", query="REFEID(x)")
+        if raw_mode == "dict":
+            ref._raw = entry
+        refs.append(ref)
+    return refs
+
+
+def run(n: int, raw_mode: str) -> dict[str, float]:
+    # heap held by the References (entries generated lazily, traced)
+    gc.collect()
+    tracemalloc.start()
+    refs = _build(make_entries(n), raw_mode)
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    for ref in refs:
+        _reference_to_ris_entry(ref)
+    export = time.perf_counter() - t0
+    del refs
+
+    # build time without tracing overhead, entry generation excluded
+    entries = list(make_entries(n))
+    gc.collect()
+    t0 = time.perf_counter()
+    _build(entries, raw_mode)
+    build = time.perf_counter() - t0
+    return {"held": held, "peak": peak, "build": build, "export": export}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--refs", type=int, default=100_000)
+    ap.add_argument("--raw", choices=("packed", "dict", "both"), default="both")
+    args = ap.parse_args()
+
+    modes = ("dict", "packed") if args.raw == "both" else (args.raw,)
+    print(f"{args.refs:,} references\n")
+    print(f"{'raw':>7}  {'held MB':>8}  {'B/ref':>7}  {'peak MB':>8}  {'build s':>8}  {'export s':>8}")
+    for mode in modes:
+        r = run(args.refs, mode)
+        print(f"{mode:>7}  {r['held'] / 2**20:>8.1f}  {r['held'] / args.refs:>7,.0f}  "
+              f"{r['peak'] / 2**20:>8.1f}  {r['build']:>8.2f}  {r['export']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
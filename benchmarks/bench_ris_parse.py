@@ -0,0 +1,123 @@
+"""
+Benchmark: RIS parsing and writing, whole-file vs. streaming.
+
+Writes a synthetic Scopus-style export (abstracts, several authors and
+keywords per record) and reports wall time and peak traced memory for
+building the full entry list versus iterating ``iter_ris_file``, then for
+re-writing the export by joining one big string versus streaming it through
+``write_ris_file`` (plain and gzip).
+
+Usage:
+    python benchmarks/bench_ris_parse.py
+    python benchmarks/bench_ris_parse.py --records 5000 20000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scopus_automation.ris import (  # noqa: E402
+    _parse_ris_manual, iter_ris_file, write_ris_file,
+)
+
+_WORDS = (
+    "eeg fatigue driver drowsiness detection deep learning network signal "
+    "analysis classification attention vigilance model feature spectral"
+).split()
+
+
+def write_export(path: Path, n: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as fh:
+        for i in range(n):
+            fh.write("TY  - JOUR\n")
+            for a in range(rng.randint(2, 8)):
+                fh.write(f"AU  - Author{a}, X.\n")
+            fh.write(f"TI  - {' '.join(rng.choice(_WORDS) for _ in range(10))}\n")
+            fh.write(f"PY  - {rng.randint(1990, 2026)}\n")
+            fh.write(f"DO  - 10.{1000 + i % 9000}/x.{i}\n")
+            fh.write(f"AB  - {' '.join(rng.choice(_WORDS) for _ in range(250))}\n")
+            for _ in range(5):
+                fh.write(f"KW  - {rng.choice(_WORDS)}\n")
+            fh.write(f"N1  - Export Date: 1 January 2026; EID 2-s2.0-{85000000000 + i}\n")
+            fh.write("ER  - \n\n")
+
+
+def whole_file(path: Path) -> int:
+    entries = _parse_ris_manual(path.read_text(encoding="utf-8", errors="replace"))
+    return len(entries)
+
+
+def streaming(path: Path) -> int:
+    return sum(1 for _ in iter_ris_file(path))
+
+
+def write_joined(src: Path, dst: Path) -> int:
+    """The pre-streaming writer: every line in a list, one string, one write."""
+    entries = _parse_ris_manual(src.read_text(encoding="utf-8", errors="replace"))
+    lines: list[str] = []
+    for entry in entries:
+        for tag, value in entry.items():
+            if isinstance(value, list):
+                lines.extend(f"{tag}  - {v}" for v in value)
+            else:
+                lines.append(f"{tag}  - {value}")
+        lines.append("ER  - ")
+        lines.append("")
+    dst.write_text("\n".join(lines), encoding="utf-8")
+    return len(entries)
+
+
+def _measure(fn, *paths: Path) -> tuple[float, float, int]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    n = fn(*paths)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--records", type=int, nargs="+", default=[5_000, 20_000])
+    args = ap.parse_args()
+
+    print(f"{'records':>8}  {'file MB':>7}  {'list s':>7}  {'list peak MB':>12}  "
+          f"{'iter s':>7}  {'iter peak MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.records:
+            path = Path(tmp) / f"export_{n}.ris"
+            write_export(path, n)
+            t_list, m_list, n_list = _measure(whole_file, path)
+            t_iter, m_iter, n_iter = _measure(streaming, path)
+            assert n_list == n_iter == n
+            size = path.stat().st_size / 1e6
+            print(f"{n:>8,}  {size:>7.1f}  {t_list:>7.2f}  {m_list:>12.1f}  "
+                  f"{t_iter:>7.2f}  {m_iter:>12.2f}")
+
+        print(f"\n{'records':>8}  {'join s':>7}  {'join peak MB':>12}  {'stream s':>8}  "
+              f"{'stream peak MB':>14}  {'gzip s':>7}  {'gzip MB':>7}")
+        for n in args.records:
+            src = Path(tmp) / f"export_{n}.ris"
+            out, gz = Path(tmp) / "joined.ris", Path(tmp) / "streamed.ris.gz"
+            t_join, m_join, _ = _measure(write_joined, src, out)
+            t_stream, m_stream, _ = _measure(
+                lambda s, d: write_ris_file(iter_ris_file(s), d), src, Path(tmp) / "streamed.ris",
+            )
+            assert (Path(tmp) / "streamed.ris").read_bytes() == out.read_bytes()
+            t_gz, _, _ = _measure(lambda s, d: write_ris_file(iter_ris_file(s), d), src, gz)
+            print(f"{n:>8,}  {t_join:>7.2f}  {m_join:>12.1f}  {t_stream:>8.2f}  "
+                  f"{m_stream:>14.2f}  {t_gz:>7.2f}  {gz.stat().st_size / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
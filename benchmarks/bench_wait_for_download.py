@@ -0,0 +1,82 @@
+"""
+Benchmark: download completion latency of ``wait_for_download`` vs. the former
+fixed one-second polling loop.
+
+Simulates Chrome: a ``.crdownload`` file is renamed to ``.ris`` after a random
+delay, and the time from the rename to the wait returning is measured.  Uses
+file events when ``watchdog`` is installed, else the polling fallback.
+
+Usage:
+    python benchmarks/bench_wait_for_download.py
+    python benchmarks/bench_wait_for_download.py --downloads 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scopus_automation import browser  # noqa: E402
+
+
+def old_wait_for_download(download_dir: Path, timeout_sec: int = 120, min_mtime: float = 0):
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        partial = list(download_dir.glob("*.crdownload"))
+        ris_files = list(download_dir.glob("*.ris"))
+        if min_mtime > 0:
+            ris_files = [f for f in ris_files if f.stat().st_mtime >= min_mtime]
+        if ris_files and not partial:
+            return max(ris_files, key=lambda p: p.stat().st_mtime)
+        time.sleep(1)
+    return None
+
+
+def _one(wait, root: Path, i: int, rng: random.Random) -> float:
+    d = root / f"dl{i}"
+    d.mkdir()
+    partial = d / "export.ris.crdownload"
+    partial.write_text("TY  - JOUR\n" * 1000)
+    landed = {}
+
+    def _finish():
+        partial.rename(d / "export.ris")
+        landed["t"] = time.monotonic()
+
+    threading.Timer(rng.uniform(0.5, 2.0), _finish).start()
+    wait(d, 10, min_mtime=time.time() - 1)
+    return time.monotonic() - landed["t"]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--downloads", type=int, default=20)
+    args = ap.parse_args()
+
+    try:
+        import watchdog  # noqa: F401
+        mode = "file events (watchdog)"
+    except ImportError:
+        mode = "polling fallback (watchdog not installed)"
+    print(f"{args.downloads} simulated downloads; new detector: {mode}\n")
+    print(f"{'':<22}  {'mean ms':>8}  {'p95 ms':>8}  {'max ms':>8}")
+    for name, wait in (("old 1 s polling", old_wait_for_download),
+                       ("wait_for_download", browser.wait_for_download)):
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as tmp:
+            lat = sorted(_one(wait, Path(tmp), i, rng) for i in range(args.downloads))
+        p95 = lat[min(len(lat) - 1, int(0.95 * len(lat)))]
+        print(f"{name:<22}  {statistics.mean(lat) * 1e3:>8.0f}  {p95 * 1e3:>8.0f}  "
+              f"{lat[-1] * 1e3:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -164,9 +164,14 @@ def cmd_search(ctx, query, queries_file, output_dir, config_file, profile_path,
     help="Column name containing the Scopus paper URLs.",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-download already processed papers.")
+@click.option(
+    "--refresh-days", type=float, default=None,
+    help="Refresh papers fetched at least this many days ago with an incremental "
+         "(PUBYEAR-restricted) query merged into the cached RIS.",
+)
 @_common_options
 @click.pass_context
-def cmd_cited_by(ctx, input_file, output_dir, link_column, force,
+def cmd_cited_by(ctx, input_file, output_dir, link_column, force, refresh_days,
                  config_file, profile_path, profile_name, chromedriver, headless):
     """Download cited-by papers for each paper in a CSV/Excel file."""
     cfg = _build_config(config_file, profile_path, profile_name, chromedriver, headless)
@@ -183,6 +188,7 @@ def cmd_cited_by(ctx, input_file, output_dir, link_column, force,
             output_dir=out,
             force=force,
             link_column=link_column,
+            max_age_days=refresh_days,
         )
         click.echo(f"Done. Combined RIS: {combined_ris}")
     finally:
@@ -207,8 +213,12 @@ def cmd_cited_by(ctx, input_file, output_dir, link_column, force,
     "--report", default=None,
     help="Path for the duplicates report CSV (default: same dir as output).",
 )
+@click.option(
+    "--workers", "-w", default=1, show_default=True, type=int,
+    help="Processes used to parse the RIS files; above 1, files are parsed whole instead of streamed.",
+)
 @click.pass_context
-def cmd_combine_ris(ctx, input_dir, output, report):
+def cmd_combine_ris(ctx, input_dir, output, report, workers):
     """Combine all .ris files in a directory and remove duplicates."""
     from scopus_automation.dedupe import combine_ris_directory
 
@@ -218,7 +228,9 @@ def cmd_combine_ris(ctx, input_dir, output, report):
     out_file = Path(output) if output else cfg.combined_output_dir() / "combined_unique.ris"
     report_file = Path(report) if report else out_file.parent / "duplicates_report.csv"
 
-    unique_count, dup_count = combine_ris_directory(input_dir, out_file, report_file)
+    unique_count, dup_count = combine_ris_directory(
+        input_dir, out_file, report_file, workers=workers,
+    )
     click.echo(f"Combined: {unique_count} unique entries, {dup_count} duplicates removed.")
     click.echo(f"Output  : {out_file}")
     click.echo(f"Report  : {report_file}")
@@ -59,8 +59,7 @@ def update_master_list(
     records: list[Reference],
 ) -> None:
     """Add or update records in the master list and save."""
-    for ref in records:
-        master_list.add_or_update(ref)
+    master_list.bulk_add_or_update(records)
     master_list.save()
 
 
@@ -87,7 +86,7 @@ def get_scopus_citing_children(
         Re-download even if the RIS file already exists.
     """
     from scopus_automation.cited_by import download_cited_by
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.ris import iter_ris_file
 
     url = (
         f"https://www.scopus.com/pages/publications/{parent_reference.scopus_id}"
@@ -109,7 +108,6 @@ def get_scopus_citing_children(
     if not ris_path or not Path(ris_path).exists():
         return []
 
-    raw_entries = parse_ris_file(ris_path)
     return [
         Reference.from_ris_entry(
             e,
@@ -117,7 +115,7 @@ def get_scopus_citing_children(
             parent=parent_reference,
             query=f"REFEID({parent_reference.scopus_eid})",
         )
-        for e in raw_entries
+        for e in iter_ris_file(ris_path)
     ]
 
 
@@ -140,7 +138,7 @@ def search_scopus_by_keyword(
     output_dir:
         Directory to save the raw RIS download.
     """
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.ris import iter_ris_file
     from scopus_automation.search_export import search_and_export
 
     meta = search_and_export(
@@ -154,7 +152,6 @@ def search_scopus_by_keyword(
     if not ris_path or not Path(ris_path).exists():
         return []
 
-    raw_entries = parse_ris_file(ris_path)
     return [
         Reference.from_ris_entry(
             e,
@@ -162,7 +159,7 @@ def search_scopus_by_keyword(
             query=keyword,
             query_keyword=keyword,
         )
-        for e in raw_entries
+        for e in iter_ris_file(ris_path)
     ]
 
 
@@ -0,0 +1,106 @@
+"""Checkpoint of a citation-discovery run, so a crashed run resumes without re-querying.
+
+The master list is only saved once a run has deduplicated and exported the
+children of every parent, so a crash at parent 400 of 500 used to lose the
+whole Scopus phase.  While the browser loop runs, each finished parent is
+appended to ``<output dir>/citation_discovery.checkpoint.jsonl``:
+
+    {"scopus_id": "85012345678", "result": {"cited_by_ris_file": "...", ...}}
+
+``result`` is what :func:`~scopus_automation.cited_by.download_cited_by`
+returned; the children themselves are the RIS file it names, which is
+already on disk.  Lines are buffered and written (and fsynced) every
+``every`` parents or ``interval_sec`` seconds, whichever comes first, and on
+close.
+
+The next run reads the checkpoint back and takes those parents' results from
+it instead of querying Scopus again.  A completed run deletes the file.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "citation_discovery.checkpoint.jsonl"
+
+
+class RunCheckpoint:
+    """Append-only JSON-lines record of the parents a run has finished."""
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        every: int = 10,
+        interval_sec: float = 60.0,
+    ) -> None:
+        self._path = Path(output_dir) / CHECKPOINT_FILENAME
+        self._every = max(1, int(every))
+        self._interval = float(interval_sec)
+        self._pending: list[str] = []
+        self._last_flush = time.monotonic()
+        self.results: dict[str, dict[str, Any]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> int:
+        """Read a checkpoint left by an earlier run; returns the parents it holds.
+
+        A truncated last line (crash mid-write) is skipped with a warning.
+        """
+        self.results = {}
+        if not self._path.exists():
+            return 0
+        with self._path.open(encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self.results[str(entry["scopus_id"])] = entry["result"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    log.warning("Skipping unreadable checkpoint line %d in %s",
+                                lineno, self._path.name)
+        log.info("Checkpoint %s: %d parent(s) already queried", self._path, len(self.results))
+        return len(self.results)
+
+    def get(self, scopus_id: str) -> dict[str, Any] | None:
+        return self.results.get(str(scopus_id))
+
+    def record(self, scopus_id: str, result: dict[str, Any]) -> None:
+        """Remember a finished parent; written out on the next flush."""
+        self.results[str(scopus_id)] = result
+        self._pending.append(json.dumps(
+            {"scopus_id": str(scopus_id), "result": result}, ensure_ascii=False, default=str,
+        ))
+        if (len(self._pending) >= self._every
+                or time.monotonic() - self._last_flush >= self._interval):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as fh:
+            fh.write("\n".join(self._pending) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        log.info("Checkpoint: %d parent(s) written to %s", len(self._pending), self._path.name)
+        self._pending = []
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the run's results are safely saved."""
+        self._pending = []
+        self.results = {}
+        if self._path.exists():
+            self._path.unlink()
@@ -5,16 +5,20 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .checkpoint import RunCheckpoint
 from .config import PipelineConfig
-from .dedup_engine import deduplicate_references
+from .dedup_engine import StreamingDeduplicator
 from .input_loader import load_from_config
 from .master_list import MasterList
-from .models import Reference, RunSummary
+from .models import DeduplicationResult, Reference, RunSummary
 from .ris_exporter import export_to_ris, generate_output_filename
 from .run_history import append_run
 
@@ -63,7 +67,13 @@ def run_citation_discovery(
         ml_path = base_dir / ml_path
 
     print(f"\n[1/7] Loading master list: {ml_path}")
-    ml = MasterList.load(ml_path, reuse_existing=config.master_list.reuse_existing)
+    ml = MasterList.load(
+        ml_path,
+        reuse_existing=config.master_list.reuse_existing,
+        index_sidecar=config.master_list.index_sidecar,
+        journal=config.master_list.journal,
+        journal_max_entries=config.master_list.journal_max_entries,
+    )
     _ml_rows_at_load = ml.row_count  # guard: never save fewer rows than we loaded
     print(f"      {ml.summary()}")
     summary.master_list_path = str(ml_path)
@@ -91,11 +101,24 @@ def run_citation_discovery(
     to_process: list[Reference] = []
     already_processed = 0
 
-    for ref in parents:
-        extra = ref._raw  # original Zotero CSV row for pass-through
-        ml.add_or_update(ref, extra_zotero_row=extra)
+    # original Zotero CSV rows for pass-through
+    ml.bulk_add_or_update(parents, extra_zotero_rows=[ref.raw_entry() for ref in parents])
+
+    from scopus_automation.cited_by_cache import CitedByCache
 
+    download_dir = output_dir / "cited_by_raw"
+    cache = CitedByCache.in_dir(download_dir)
+    refresh_days = config.run.cited_by_refresh_days
+    refreshing = 0
+
+    for ref in parents:
         already_done = ml.get_parent_processed_status(ref)
+        if already_done and ref.scopus_id and cache.is_stale(
+            ref.scopus_id, download_dir / f"{ref.scopus_id}_cited_by.ris", refresh_days,
+        ):
+            # older than run.cited_by_refresh_days: re-query for new citations only
+            already_done = False
+            refreshing += 1
         if already_done and not config.run.force_rerun:
             already_processed += 1
             log.info("Skipping (already processed): %s", ref.title[:60])
@@ -107,6 +130,8 @@ def run_citation_discovery(
 
     print(f"      Already processed (skipped): {already_processed}")
     print(f"      To process now:              {len(to_process)}")
+    if refreshing:
+        print(f"      Incremental refresh (> {refresh_days:g} days old): {refreshing}")
 
     if not to_process:
         print("\n      All parents already processed.  Use force_rerun=true to rerun.")
@@ -141,36 +166,108 @@ def run_citation_discovery(
         return summary
 
     # Real Scopus queries via browser automation
-    from scopus_automation.browser import build_driver, set_download_dir
     from scopus_automation.cited_by import download_cited_by
     from scopus_automation.config import ScopusConfig
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.driver_pool import DriverPool
 
     scopus_cfg_path = Path(config.scopus_config_path)
     if not scopus_cfg_path.is_absolute():
         scopus_cfg_path = base_dir / scopus_cfg_path
     scopus_cfg = ScopusConfig.from_file(str(scopus_cfg_path))
 
-    download_dir = output_dir / "cited_by_raw"
     download_dir.mkdir(parents=True, exist_ok=True)
 
     scopus_cfg.output_dir = str(download_dir)
 
-    driver = build_driver(scopus_cfg, download_dir=download_dir)
-    set_download_dir(driver, download_dir)
-
-    all_children: list[Reference] = []
+    def _query_parent(worker, parent: Reference, slice_pool=None) -> dict:
+        """Runs on a pool worker; everything else stays on this thread.
+
+        Without *slice_pool* a parent over the export cap comes back
+        unexported (``over_cap``); it is retried once the pool is free.
+        """
+        if not parent.scopus_id:
+            return {}
+        result = download_cited_by(
+            driver=worker.driver,
+            paper_link=f"https://www.scopus.com/pages/publications/{parent.scopus_id}",
+            config=scopus_cfg,
+            output_dir=download_dir,
+            force=config.run.force_rerun,
+            download_dir=worker.download_dir,
+            cache=cache,
+            max_age_days=refresh_days,
+            split_over_cap=slice_pool is not None,
+            slice_pool=slice_pool,
+        )
+        result["worker"] = worker.index
+        if result.get("cited_by_error") and not result.get("over_cap"):
+            worker.errors += 1
+        return result
+
+    checkpoint = RunCheckpoint(
+        output_dir,
+        every=config.run.checkpoint_every,
+        interval_sec=config.run.checkpoint_interval_sec,
+    )
+    if config.run.resume:
+        checkpoint.load()
+    else:
+        checkpoint.remove()
+    resumed = {p.scopus_id for p in to_process if p.scopus_id and checkpoint.get(p.scopus_id)}
+    pending = [p for p in to_process if p.scopus_id not in resumed]
+    if resumed:
+        print(f"      Resuming: {len(resumed)} parent(s) taken from {checkpoint.path.name}")
+
+    def _query_all(pool: DriverPool):
+        """Yield ``(i, parent, result)`` in to_process order; parents in the
+        checkpoint are not queried again.
+
+        A parent over the export cap is exported in year slices on every
+        driver of the pool, which needs the pool to itself.  With more than
+        one driver, results from that parent on are held back until the
+        remaining queries finish; the sliced parents are then exported and
+        everything is yielded in order.  Status rows, checkpoint records and
+        the order children are merged in are therefore the same whether or
+        not a parent was over the cap."""
+        results = pool.map(_query_parent, pending) if pending else iter(())
+        held: list[tuple[int, Reference, Optional[dict]]] = []
+        for i, parent in enumerate(to_process, 1):
+            if parent.scopus_id in resumed:
+                result = dict(checkpoint.get(parent.scopus_id), resumed=True)
+            else:
+                result = next(results)
+                if result.get("over_cap"):
+                    result = None if pool.size > 1 else _query_over_cap(pool, parent)
+            if held or result is None:
+                held.append((i, parent, result))
+            else:
+                yield i, parent, result
+        for i, parent, result in held:
+            yield i, parent, result if result is not None else _query_over_cap(pool, parent)
+
+    def _query_over_cap(pool: DriverPool, parent: Reference) -> dict:
+        log.info("Parent %s is over the export cap — exporting by year.", parent.record_id)
+        return _query_parent(pool.workers[0], parent, slice_pool=pool)
+
+    # Children are parsed and deduplicated on a background thread as each
+    # parent's RIS lands, while the browser moves on to the next parent
+    ingest = _ChildIngest(StreamingDeduplicator(
+        ml,
+        fuzzy_titles=config.zotero.fuzzy_title_dedup,
+        fuzzy_threshold=config.zotero.fuzzy_title_threshold,
+        workers=config.zotero.dedup_workers,
+    ))
     per_paper_status: list[dict] = []
     total_results = 0
 
+    pool = DriverPool(scopus_cfg, download_dir, size=config.run.scopus_workers)
     try:
-        for i, parent in enumerate(to_process, 1):
-            url = (
-                f"https://www.scopus.com/pages/publications/{parent.scopus_id}"
-                if parent.scopus_id
-                else ""
-            )
-            if not url:
+        if pending:
+            pool.start()
+        # Results arrive in the same order whatever the pool size, so the
+        # children, status rows and master list updates match a serial run
+        for i, parent, result in _query_all(pool):
+            if not result:
                 msg = f"Parent {parent.record_id} has no Scopus URL — skipping."
                 log.warning(msg)
                 summary.warnings.append(msg)
@@ -186,31 +283,13 @@ def run_citation_discovery(
             print(f"\n      [{i}/{len(to_process)}] {parent.title[:65]}")
             print(f"        EID: {parent.scopus_eid or '—'}")
 
-            result = download_cited_by(
-                driver=driver,
-                paper_link=url,
-                config=scopus_cfg,
-                output_dir=download_dir,
-                force=config.run.force_rerun,
-            )
-
             n = result.get("cited_by_result_count", 0)
             ris_path = result.get("cited_by_ris_file", "")
             err = result.get("cited_by_error", "")
             total_results += n
 
             if ris_path and Path(ris_path).exists():
-                raw_entries = parse_ris_file(ris_path)
-                children = [
-                    Reference.from_ris_entry(
-                        e,
-                        source_file=ris_path,
-                        parent=parent,
-                        query=f"REFEID({parent.scopus_eid})",
-                    )
-                    for e in raw_entries
-                ]
-                all_children.extend(children)
+                ingest.submit(parent, ris_path)
                 print(f"        → {n} citing papers found.")
                 per_paper_status.append({
                     "record_id": parent.record_id,
@@ -219,6 +298,7 @@ def run_citation_discovery(
                     "result_count": n,
                     "ris_file": ris_path,
                     "error": "",
+                    "worker": result["worker"],
                 })
             else:
                 print(f"        → {'ERROR: ' + err if err else '0 citing papers.'}")
@@ -228,6 +308,7 @@ def run_citation_discovery(
                     "status": "error" if err else "no_results",
                     "result_count": 0,
                     "error": err,
+                    "worker": result["worker"],
                 })
 
             ml.mark_parent_processed(
@@ -236,9 +317,15 @@ def run_citation_discovery(
                 exported_count=0,
                 timestamp=datetime.now().isoformat(),
             )
+            if not result.get("resumed"):
+                checkpoint.record(parent.scopus_id, result)
 
     finally:
-        driver.quit()
+        checkpoint.flush()
+        ingest.close()
+        if pool.size > 1:
+            _write_worker_status(pool.status_rows(), output_dir)
+        pool.close()
 
     summary.total_scopus_results = total_results
     _write_per_paper_status(per_paper_status, output_dir)
@@ -246,8 +333,9 @@ def run_citation_discovery(
     # ------------------------------------------------------------------
     # Step 5: Deduplicate children against master list
     # ------------------------------------------------------------------
-    print(f"\n[5/7] Deduplicating {len(all_children)} child references...")
-    dedup = deduplicate_references(all_children, ml)
+    dedup = ingest.finish()
+    print(f"\n[5/7] Deduplicated {dedup.total_input} child references "
+          f"(alongside the Scopus queries, {ingest.busy_sec:.1f} s)...")
     summary.duplicates_detected = dedup.duplicate_count
     print(f"      New (not in master list): {dedup.new_count}")
     print(f"      Duplicates skipped:       {dedup.duplicate_count}")
@@ -275,8 +363,8 @@ def run_citation_discovery(
     # Step 7: Update master list with new children + export status
     # ------------------------------------------------------------------
     print(f"\n[7/7] Updating master list...")
+    ml.bulk_add_or_update(dedup.new_references)
     for ref in dedup.new_references:
-        ml.add_or_update(ref)
         ml.mark_exported(ref)
     # Update children_exported_count on parents
     for parent in to_process:
@@ -295,6 +383,7 @@ def run_citation_discovery(
             timestamp=datetime.now().isoformat(),
         )
     ml.save()
+    checkpoint.remove()  # everything it held is now in the master list
     rows_added = ml.row_count - _ml_rows_at_load
     print(f"      Master list saved: {ml.path} ({ml.row_count} rows, +{rows_added} new)")
 
@@ -326,6 +415,68 @@ def run_citation_discovery(
     return summary
 
 
+# ---------------------------------------------------------------------------
+# Background child ingest
+# ---------------------------------------------------------------------------
+
+class _ChildIngest:
+    """Parse, build and deduplicate each parent's cited-by RIS on a worker thread.
+
+    The browser loop calls :meth:`submit` as each parent's RIS lands and
+    moves straight on to the next Scopus query.  Files are handled in
+    submission order, so :meth:`finish` returns exactly what deduplicating
+    all children at the end would.  An error on the worker thread is
+    re-raised by :meth:`finish`.
+    """
+
+    def __init__(self, dedup: StreamingDeduplicator) -> None:
+        from scopus_automation.ris import iter_ris_file
+
+        self._iter_ris_file = iter_ris_file
+        self._dedup = dedup
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self.busy_sec = 0.0
+        self._thread = threading.Thread(target=self._run, name="child-ingest", daemon=True)
+        self._thread.start()
+
+    def submit(self, parent: Reference, ris_path: str) -> None:
+        self._queue.put((parent, ris_path))
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if self._error is not None:
+                continue  # drain after a failure
+            parent, ris_path = item
+            t0 = time.perf_counter()
+            try:
+                self._dedup.add([
+                    Reference.from_ris_entry(
+                        e,
+                        source_file=ris_path,
+                        parent=parent,
+                        query=f"REFEID({parent.scopus_eid})",
+                    )
+                    for e in self._iter_ris_file(ris_path)
+                ])
+            except BaseException as exc:
+                log.error("Could not ingest %s: %s", ris_path, exc)
+                self._error = exc
+            self.busy_sec += time.perf_counter() - t0
+
+    def close(self) -> None:
+        """Wait for the files already submitted; idempotent."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def finish(self) -> DeduplicationResult:
+        self.close()
+        if self._error is not None:
+            raise self._error
+        return self._dedup.finish()
+
+
 # ---------------------------------------------------------------------------
 # Helper writers
 # ---------------------------------------------------------------------------
@@ -334,7 +485,7 @@ def _write_per_paper_status(rows: list[dict], output_dir: Path) -> None:
     if not rows:
         return
     path = output_dir / "cited_by_per_paper_status.csv"
-    fields = ["record_id", "title", "status", "result_count", "ris_file", "error"]
+    fields = ["record_id", "title", "status", "result_count", "ris_file", "error", "worker"]
     try:
         with path.open("w", newline="", encoding="utf-8") as fh:
             w = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
@@ -345,11 +496,25 @@ def _write_per_paper_status(rows: list[dict], output_dir: Path) -> None:
         log.warning("Could not write per-paper status: %s", exc)
 
 
+def _write_worker_status(rows: list[dict], output_dir: Path) -> None:
+    path = output_dir / "cited_by_worker_status.csv"
+    fields = ["worker", "download_dir", "tasks", "errors", "busy_sec"]
+    try:
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            w = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
+            w.writeheader()
+            w.writerows(rows)
+        log.info("Worker status saved: %s", path)
+    except Exception as exc:
+        log.warning("Could not write worker status: %s", exc)
+
+
 def _write_duplicates_report(duplicates: list[dict], output_dir: Path) -> None:
     if not duplicates:
         return
     path = output_dir / "duplicates_report.csv"
-    fields = ["title", "year", "doi", "scopus_eid", "matched_rule", "matched_fingerprint", "duplicate_of"]
+    fields = ["title", "year", "doi", "scopus_eid", "matched_rule", "matched_fingerprint",
+              "duplicate_of", "similarity"]
     try:
         with path.open("w", newline="", encoding="utf-8") as fh:
             w = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
@@ -14,6 +14,11 @@ class RunConfig:
     mode: str = "citation_discovery"  # "citation_discovery" | "keyword_search"
     force_rerun: bool = False
     output_filename: Optional[str] = None
+    scopus_workers: int = 1  # concurrent Chrome instances for cited-by queries
+    cited_by_refresh_days: Optional[float] = None  # incremental refresh of older cited-by lists
+    resume: bool = True  # take parents finished by a crashed run from its checkpoint
+    checkpoint_every: int = 10  # write the checkpoint every N parents ...
+    checkpoint_interval_sec: float = 60.0  # ... or after this many seconds
 
 
 @dataclass
@@ -36,12 +41,18 @@ class InputConfig:
 class ZoteroExportConfig:
     deduplicate_against_master_list: bool = True
     export_format: str = "ris"
+    fuzzy_title_dedup: bool = False  # rule 8: near-duplicate titles (MinHash/LSH)
+    fuzzy_title_threshold: float = 0.8  # minimum title Jaccard similarity
+    dedup_workers: int = 1  # >1 fingerprints large batches in a process pool
 
 
 @dataclass
 class MasterListConfig:
     path: str = "complete_file_available_in_zotero.csv"
     reuse_existing: bool = True
+    index_sidecar: bool = True  # persist the fingerprint index next to the CSV
+    journal: bool = False  # append changes to <path>.journal.jsonl on save
+    journal_max_entries: int = 10_000  # compact once the journal grows past this
 
 
 @dataclass
@@ -82,6 +93,14 @@ def load_config(config_path: str) -> PipelineConfig:
             mode=run_d.get("mode", "citation_discovery"),
             force_rerun=bool(run_d.get("force_rerun", False)),
             output_filename=run_d.get("output_filename") or None,
+            scopus_workers=int(run_d.get("scopus_workers", 1)),
+            cited_by_refresh_days=(
+                float(run_d["cited_by_refresh_days"])
+                if run_d.get("cited_by_refresh_days") is not None else None
+            ),
+            resume=bool(run_d.get("resume", True)),
+            checkpoint_every=int(run_d.get("checkpoint_every", 10)),
+            checkpoint_interval_sec=float(run_d.get("checkpoint_interval_sec", 60.0)),
         )
 
     if inp_d := data.get("input"):
@@ -106,12 +125,18 @@ def load_config(config_path: str) -> PipelineConfig:
                 z_d.get("deduplicate_against_master_list", True)
             ),
             export_format=z_d.get("export_format", "ris"),
+            fuzzy_title_dedup=bool(z_d.get("fuzzy_title_dedup", False)),
+            fuzzy_title_threshold=float(z_d.get("fuzzy_title_threshold", 0.8)),
+            dedup_workers=int(z_d.get("dedup_workers", 1)),
         )
 
     if ml_d := data.get("master_list"):
         cfg.master_list = MasterListConfig(
             path=ml_d.get("path", "complete_file_available_in_zotero.csv"),
             reuse_existing=bool(ml_d.get("reuse_existing", True)),
+            index_sidecar=bool(ml_d.get("index_sidecar", True)),
+            journal=bool(ml_d.get("journal", False)),
+            journal_max_entries=int(ml_d.get("journal_max_entries", 10_000)),
         )
 
     if out_d := data.get("output"):
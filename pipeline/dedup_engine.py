@@ -1,20 +1,16 @@
-"""7-rule deduplication engine for References against a MasterList."""
+"""8-rule deduplication engine for References against a MasterList."""
 
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
-from .models import Reference, DeduplicationResult
-from .master_list import (
-    _fp_doi,
-    _fp_eid,
-    _fp_scopus_id,
-    _fp_pmid,
-    _fp_isbn,
-    _fp_title_year,
-    _fp_title_author,
-)
+from scopus_automation.fingerprint import RULE_NAMES, rule_fingerprints_many
+
+from .fuzzy_title import DEFAULT_THRESHOLD, TitleLSH
+from .models import Reference, DeduplicationResult, _norm_title
+from .master_list import _reference_rule_fingerprints, _remember_fingerprints
 
 if TYPE_CHECKING:
     from .master_list import MasterList
@@ -22,57 +18,105 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-# ---------------------------------------------------------------------------
-# Priority-ordered fingerprint builders (Rule 1..7)
-# ---------------------------------------------------------------------------
+DEFAULT_CHUNK_SIZE = 5_000
 
-_RULE_BUILDERS = [
-    ("doi",          lambda r: [_fp_doi(r.doi)]),
-    ("eid",          lambda r: [_fp_eid(r.scopus_eid)]),
-    ("scopus_id",    lambda r: [_fp_scopus_id(r.scopus_id)]),
-    ("pmid",         lambda r: [_fp_pmid(r.pmid)]),
-    ("isbn",         lambda r: [_fp_isbn(r.isbn)]),
-    ("title_year",   lambda r: [_fp_title_year(r.title, r.year)]),
-    ("title_author", lambda r: [
-        _fp_title_author(r.title, r.authors[0] if r.authors else "")
-    ]),
-]
 
+def _key_chunk(keys: list[tuple[str, ...]]) -> list[tuple[str, ...]]:
+    """Process-pool worker: per-rule fingerprints for a chunk of identity keys."""
+    return rule_fingerprints_many(keys)
 
-def deduplicate_references(
-    references: list[Reference],
-    master_list: "MasterList",
-) -> DeduplicationResult:
-    """Check each reference against the master list and against each other.
 
-    Deduplication rules (priority order):
-      1. DOI exact match
-      2. Scopus EID exact match
-      3. Scopus ID exact match
-      4. PMID exact match
-      5. ISBN exact match
-      6. Normalised title + year
-      7. Normalised title + first author last name
-
-    A reference is considered a duplicate if ANY rule matches.
-    The first matching rule is logged for diagnostics.
+def _compute_fingerprints(
+    references: list[Reference],
+    workers: int,
+    chunk_size: int,
+) -> list[tuple[str, ...]]:
+    """Per-rule fingerprints of every reference, in input order.
+
+    Fingerprints are memoised on each Reference, so later master list
+    lookups for the same references reuse them.  With ``workers > 1`` and
+    more than one chunk of input, the references without a valid memo are
+    fingerprinted in a process pool: only their identity keys are shipped to
+    the workers and ``Executor.map`` returns chunks in submission order, so
+    the result is identical to the serial computation.
+    """
+    if workers <= 1 or len(references) <= chunk_size:
+        return [_reference_rule_fingerprints(ref) for ref in references]
+
+    keys = [ref.identity_key() for ref in references]
+    todo = [
+        i for i, (ref, key) in enumerate(zip(references, keys))
+        if ref._fingerprints is None or ref._fingerprints[0] != key
+    ]
+    chunks = [
+        [keys[i] for i in todo[start:start + chunk_size]]
+        for start in range(0, len(todo), chunk_size)
+    ]
+    if chunks:
+        log.info("Fingerprinting %d references in %d chunks on %d processes.",
+                 len(todo), len(chunks), workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = (fps for chunk in pool.map(_key_chunk, chunks) for fps in chunk)
+            for i, rule_fps in zip(todo, computed):
+                _remember_fingerprints(references[i], keys[i], rule_fps)
+    return [ref._fingerprints[1] for ref in references]
+
+
+class StreamingDeduplicator:
+    """Deduplicate references batch by batch, as they become available.
+
+    Feeding batches to :meth:`add` and calling :meth:`finish` gives exactly
+    the result of :func:`deduplicate_references` on their concatenation;
+    the citation-discovery pipeline uses it to deduplicate each parent's
+    children while the browser fetches the next parent.  See
+    :func:`deduplicate_references` for the rules and parameters.
+
+    The master list must not gain rows between :meth:`add` calls.
     """
-    result = DeduplicationResult(total_input=len(references))
-
-    # Fingerprints from the master list (already built on load)
-    ml_cache = master_list._get_cache()
-
-    # Fingerprints seen within this batch (to catch cross-reference duplicates)
-    batch_seen: dict[str, int] = {}  # fingerprint → index in result.new_references
-
-    for ref in references:
-        matched_fp = ""
-        matched_rule = ""
-        duplicate_of = ""
 
-        for rule_name, fp_fn in _RULE_BUILDERS:
-            fps = [f for f in fp_fn(ref) if f]
-            for fp in fps:
+    def __init__(
+        self,
+        master_list: "MasterList",
+        fuzzy_titles: bool = False,
+        fuzzy_threshold: float = DEFAULT_THRESHOLD,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.result = DeduplicationResult()
+        self._fuzzy_titles = fuzzy_titles
+        self._fuzzy_threshold = fuzzy_threshold
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+        # Fingerprints from the master list (already built on load)
+        self._ml_cache = master_list._get_cache()
+
+        # Fingerprints seen within this batch (to catch cross-reference duplicates)
+        self._batch_seen: dict[str, int] = {}  # fingerprint → index in result.new_references
+
+        # Rule 8 indexes: master list titles (cached on the MasterList) and the
+        # titles of references accepted so far in this batch
+        self._ml_titles = master_list._get_title_index() if fuzzy_titles else None
+        self._batch_titles = TitleLSH() if fuzzy_titles else None
+
+    def add(self, references: list[Reference]) -> None:
+        """Deduplicate *references* against the master list and everything added so far."""
+        result = self.result
+        result.total_input += len(references)
+        ml_cache, batch_seen = self._ml_cache, self._batch_seen
+        fuzzy_titles, batch_titles = self._fuzzy_titles, self._batch_titles
+
+        all_fps = _compute_fingerprints(references, self._workers, self._chunk_size)
+
+        for ref, rule_fps in zip(references, all_fps):
+            matched_fp = ""
+            matched_rule = ""
+            duplicate_of = ""
+            similarity = ""
+
+            for rule_name, fp in zip(RULE_NAMES, rule_fps):
+                if not fp:
+                    continue
                 if fp in ml_cache:
                     matched_fp = fp
                     matched_rule = rule_name
@@ -83,37 +127,90 @@ def deduplicate_references(
                     matched_rule = rule_name
                     duplicate_of = f"batch[{batch_seen[fp]}]"
                     break
+
+            norm_title = _norm_title(ref.title) if fuzzy_titles and not matched_fp else ""
+            if not matched_fp and fuzzy_titles:
+                for index, label in ((self._ml_titles, "master_list"), (batch_titles, "batch")):
+                    hit = index.query(norm_title, self._fuzzy_threshold)
+                    if hit is not None:
+                        matched_fp = f"fuzzy_title:{index.title(hit[0])}"
+                        matched_rule = "fuzzy_title"
+                        duplicate_of = label if label == "master_list" else f"batch[{hit[0]}]"
+                        similarity = f"{hit[1]:.3f}"
+                        break
+
             if matched_fp:
-                break
-
-        if matched_fp:
-            result.duplicates.append({
-                "title": ref.title[:80],
-                "year": ref.year,
-                "doi": ref.doi,
-                "scopus_eid": ref.scopus_eid,
-                "matched_rule": matched_rule,
-                "matched_fingerprint": matched_fp,
-                "duplicate_of": duplicate_of,
-            })
-            log.debug(
-                "DUPLICATE [%s] '%s' — %s matched: %s",
-                matched_rule, ref.title[:60], duplicate_of, matched_fp,
-            )
-        else:
-            # Register all fingerprints in batch_seen
-            for _, fp_fn in _RULE_BUILDERS:
-                for fp in [f for f in fp_fn(ref) if f]:
-                    if fp not in batch_seen:
+                result.duplicates.append({
+                    "title": ref.title[:80],
+                    "year": ref.year,
+                    "doi": ref.doi,
+                    "scopus_eid": ref.scopus_eid,
+                    "matched_rule": matched_rule,
+                    "matched_fingerprint": matched_fp,
+                    "duplicate_of": duplicate_of,
+                    "similarity": similarity,
+                })
+                log.debug(
+                    "DUPLICATE [%s] '%s' — %s matched: %s",
+                    matched_rule, ref.title[:60], duplicate_of, matched_fp,
+                )
+            else:
+                # Register all fingerprints in batch_seen
+                for fp in rule_fps:
+                    if fp and fp not in batch_seen:
                         batch_seen[fp] = len(result.new_references)
+                if batch_titles is not None:
+                    batch_titles.add(len(result.new_references), norm_title)
+
+                result.new_references.append(ref)
 
-            result.new_references.append(ref)
+        result.new_count = len(result.new_references)
+        result.duplicate_count = len(result.duplicates)
 
-    result.new_count = len(result.new_references)
-    result.duplicate_count = len(result.duplicates)
+    def finish(self) -> DeduplicationResult:
+        result = self.result
+        log.info(
+            "Deduplication: %d total → %d new, %d duplicates.",
+            result.total_input, result.new_count, result.duplicate_count,
+        )
+        return result
 
-    log.info(
-        "Deduplication: %d total → %d new, %d duplicates.",
-        result.total_input, result.new_count, result.duplicate_count,
+
+def deduplicate_references(
+    references: list[Reference],
+    master_list: "MasterList",
+    fuzzy_titles: bool = False,
+    fuzzy_threshold: float = DEFAULT_THRESHOLD,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> DeduplicationResult:
+    """Check each reference against the master list and against each other.
+
+    Deduplication rules (priority order):
+      1. DOI exact match
+      2. Scopus EID exact match
+      3. Scopus ID exact match
+      4. PMID exact match
+      5. ISBN exact match
+      6. Normalised title + year
+      7. Normalised title + first author last name
+      8. Near-duplicate title (only with ``fuzzy_titles=True``): character
+         shingle Jaccard similarity >= *fuzzy_threshold*, found through a
+         MinHash/LSH index (see :mod:`pipeline.fuzzy_title`)
+
+    A reference is considered a duplicate if ANY rule matches.
+    The first matching rule is logged for diagnostics; rule 8 matches also
+    record their similarity score.
+
+    Fingerprints are memoised on each Reference (see
+    :meth:`Reference.identity_key`).  With ``workers > 1``, fingerprints of
+    large batches are computed in a process pool, *chunk_size* references
+    per task.  Matching against the
+    master list and the within-batch merge stay sequential in input order,
+    so the result is the same as with ``workers=1``.
+    """
+    dedup = StreamingDeduplicator(
+        master_list, fuzzy_titles, fuzzy_threshold, workers, chunk_size,
     )
-    return result
+    dedup.add(references)
+    return dedup.finish()
@@ -0,0 +1,233 @@
+"""Persistent SQLite sidecar for the master list fingerprint index.
+
+The sidecar lives next to the master list file
+(``complete_file_available_in_zotero.csv`` →
+``complete_file_available_in_zotero.csv.fpindex.sqlite``) and stores the
+``fingerprint → row index`` map together with the size, mtime and SHA-256 of
+the file it was built from (and of the master list journal, if one is in
+use).  When the files on disk still match that signature, the index is loaded
+straight from SQLite instead of being rebuilt from every row.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".fpindex.sqlite"
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    fp      TEXT PRIMARY KEY,
+    row_idx INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+# ---------------------------------------------------------------------------
+# File signature
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FileSignature:
+    size: int = 0
+    mtime_ns: int = 0
+    sha256: str = ""
+
+    @classmethod
+    def of(cls, path: Optional[Path], with_hash: bool = True) -> "FileSignature":
+        """Signature of *path*; a missing file has the all-empty signature."""
+        if path is None or not path.exists():
+            return cls()
+        st = path.stat()
+        return cls(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            sha256=file_sha256(path) if with_hash else "",
+        )
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def sidecar_path(master_path: Path) -> Path:
+    return master_path.with_name(master_path.name + SIDECAR_SUFFIX)
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class FingerprintStore:
+    """SQLite-backed ``fingerprint → row index`` map for one master list file.
+
+    *journal_path*, if given, is signed alongside the master list so that an
+    appended journal entry invalidates the stored index just like an edit to
+    the base file does.
+    """
+
+    def __init__(
+        self,
+        master_path: str | Path,
+        journal_path: Optional[str | Path] = None,
+    ) -> None:
+        self._master_path = Path(master_path)
+        self._journal_path = Path(journal_path) if journal_path else None
+        self._path = sidecar_path(self._master_path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _signed_files(self) -> list[tuple[str, Optional[Path]]]:
+        return [("master", self._master_path), ("journal", self._journal_path)]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the sidecar, commit on success, and always close the handle."""
+        conn = sqlite3.connect(str(self._path))
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_DDL)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Signature checks
+    # ------------------------------------------------------------------
+
+    def _read_signature(
+        self, conn: sqlite3.Connection,
+    ) -> Optional[tuple[dict[str, FileSignature], int]]:
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        try:
+            sigs = {
+                label: FileSignature(
+                    size=int(meta[f"{label}.size"]),
+                    mtime_ns=int(meta[f"{label}.mtime_ns"]),
+                    sha256=meta[f"{label}.sha256"],
+                )
+                for label, _ in self._signed_files()
+            }
+            return sigs, int(meta["row_count"])
+        except (KeyError, ValueError):
+            return None
+
+    def _write_signature(
+        self,
+        conn: sqlite3.Connection,
+        sigs: dict[str, FileSignature],
+        row_count: int,
+    ) -> None:
+        rows = [("row_count", str(row_count))]
+        for label, sig in sigs.items():
+            rows += [
+                (f"{label}.size", str(sig.size)),
+                (f"{label}.mtime_ns", str(sig.mtime_ns)),
+                (f"{label}.sha256", sig.sha256),
+            ]
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", rows)
+
+    def is_current(self, row_count: int) -> bool:
+        """True if the sidecar was built from the files as they are on disk now.
+
+        Size + mtime is the fast path.  If only the mtime moved (file copied or
+        touched), the content hash decides and the stored mtime is refreshed.
+        """
+        if not self._path.exists() or not self._master_path.exists():
+            return False
+        try:
+            with self._connect() as conn:
+                stored = self._read_signature(conn)
+                if stored is None or stored[1] != row_count:
+                    return False
+                sigs = stored[0]
+                refreshed = False
+                for label, path in self._signed_files():
+                    old = sigs[label]
+                    now = FileSignature.of(path, with_hash=False)
+                    if now.size != old.size:
+                        return False
+                    if now.mtime_ns == old.mtime_ns:
+                        continue
+                    if file_sha256(path) != old.sha256:
+                        return False
+                    old.mtime_ns = now.mtime_ns
+                    refreshed = True
+                if refreshed:
+                    self._write_signature(conn, sigs, row_count)
+                return True
+        except sqlite3.DatabaseError as exc:
+            log.warning("Fingerprint sidecar %s unreadable: %s", self._path, exc)
+            return False
+
+    # ------------------------------------------------------------------
+    # Read / write
+    # ------------------------------------------------------------------
+
+    def load(self) -> dict[str, int]:
+        with self._connect() as conn:
+            cache = dict(conn.execute("SELECT fp, row_idx FROM fingerprints"))
+        log.info("Fingerprint index loaded from sidecar %s (%d fingerprints).",
+                 self._path.name, len(cache))
+        return cache
+
+    def _current_signatures(self, conn: sqlite3.Connection) -> dict[str, FileSignature]:
+        """Signatures of the files now, hashing only those whose size or mtime moved.
+
+        A journal-only save leaves the master list untouched, so its stored
+        hash is carried over instead of re-reading the whole file.
+        """
+        stored = self._read_signature(conn)
+        sigs = {}
+        for label, path in self._signed_files():
+            now = FileSignature.of(path, with_hash=False)
+            old = stored[0][label] if stored else None
+            if old is not None and (old.size, old.mtime_ns) == (now.size, now.mtime_ns):
+                now.sha256 = old.sha256
+            elif path is not None and path.exists():
+                now.sha256 = file_sha256(path)
+            sigs[label] = now
+        return sigs
+
+    def write(
+        self,
+        fingerprints: Iterable[tuple[str, int]],
+        row_count: int,
+        replace: bool = False,
+    ) -> None:
+        """Record the current file signatures and store *fingerprints*.
+
+        With ``replace=False`` only new fingerprints are inserted (existing
+        entries keep their first-seen row index); ``replace=True`` rewrites the
+        whole table.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            sigs = self._current_signatures(conn)
+            if replace:
+                conn.execute("DELETE FROM fingerprints")
+            conn.executemany(
+                "INSERT OR IGNORE INTO fingerprints (fp, row_idx) VALUES (?, ?)",
+                fingerprints,
+            )
+            self._write_signature(conn, sigs, row_count)
+        log.debug("Fingerprint sidecar updated: %s", self._path)
@@ -0,0 +1,195 @@
+"""MinHash / LSH index for near-duplicate title detection.
+
+Titles are normalised (see :func:`pipeline.models._norm_title`), cut into
+overlapping character shingles and summarised by a MinHash signature.  The
+signature is split into bands; two titles become candidates when any band
+hashes identically, so a lookup only touches the handful of rows sharing a
+band bucket instead of every row in the master list.  Candidates are then
+confirmed with the exact Jaccard similarity of their shingle sets.
+
+With the defaults (100 permutations, 20 bands of 5 rows) a pair with Jaccard
+similarity 0.8 becomes a candidate with probability > 0.999 (0.7: ~0.97),
+while a pair at 0.3 does so with probability ~0.05; the exact check then
+filters out the false candidates.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+NUM_PERM = 100
+NUM_BANDS = 20
+DEFAULT_THRESHOLD = 0.8
+MIN_TITLE_LENGTH = 20  # shorter titles ("Introduction", "Editorial") never fuzzy-match
+
+_CHUNK_TITLES = 2_000  # titles hashed per numpy batch (bounds peak memory)
+_FNV_PRIME = np.uint32(16777619)
+_FNV_OFFSET = np.uint32(2166136261)
+
+
+def shingles(norm_title: str, k: int = SHINGLE_SIZE) -> set[str]:
+    """Character k-shingles of an already normalised title."""
+    if len(norm_title) < k:
+        return {norm_title} if norm_title else set()
+    return {norm_title[i:i + k] for i in range(len(norm_title) - k + 1)}
+
+
+def _shingle_codes(titles: list[str], k: int = SHINGLE_SIZE) -> tuple[np.ndarray, np.ndarray]:
+    """Hash every character k-shingle of every title in one vectorised pass.
+
+    Returns ``(codes, offsets)``: a uint32 FNV-1a hash per shingle position
+    and the index of each title's first shingle.  Repeated shingles are kept;
+    they do not change a MinHash minimum.  Titles must have >= k characters.
+    """
+    lengths = np.fromiter(map(len, titles), dtype=np.int64, count=len(titles))
+    chars = np.frombuffer("".join(titles).encode("utf-32-le"), dtype=np.uint32)
+    counts = lengths - (k - 1)
+    offsets = np.cumsum(counts) - counts
+    starts = np.cumsum(lengths) - lengths
+    pos = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+    codes = np.full(len(pos), _FNV_OFFSET, dtype=np.uint32)
+    for j in range(k):
+        codes ^= chars[pos + j]
+        codes *= _FNV_PRIME
+    return codes, offsets
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class TitleLSH:
+    """LSH index of normalised titles keyed by an integer id (e.g. row index).
+
+    Titles indexed in bulk with :meth:`add_many` are stored as one sorted
+    array of bucket keys per band (binary-searched at query time); titles
+    added one by one with :meth:`add` go to small per-band dicts.
+
+    Signatures are computed deterministically (fixed seed, FNV-1a shingle
+    hashes), so the same titles always produce the same buckets.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = NUM_PERM,
+        num_bands: int = NUM_BANDS,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be a multiple of num_bands")
+        self.threshold = threshold
+        self._num_bands = num_bands
+        self._rows_per_band = num_perm // num_bands
+        rng = np.random.default_rng(seed)
+        # h_i(x) = (a_i * x + b_i) mod 2**32 with odd a_i, one per permutation
+        self._a = (rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint32) * 2 + 1)[:, None]
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint32)[:, None]
+        self._band_mix = rng.integers(0, 1 << 63, size=self._rows_per_band, dtype=np.uint64) * 2 + 1
+        # bulk segments: (sorted keys per band, ids in the same order per band)
+        self._segments: list[tuple[np.ndarray, np.ndarray]] = []
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(num_bands)]
+        self._titles: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def title(self, item_id: int) -> str:
+        """The normalised title indexed under *item_id*."""
+        return self._titles[item_id]
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def _signatures(self, titles: list[str]) -> np.ndarray:
+        """MinHash signatures of *titles* (each >= SHINGLE_SIZE chars), shape (n, num_perm)."""
+        sigs = np.empty((len(titles), len(self._a)), dtype=np.uint32)
+        for start in range(0, len(titles), _CHUNK_TITLES):
+            codes, offsets = _shingle_codes(titles[start:start + _CHUNK_TITLES])
+            # universal hashing mod 2**32, one row per permutation
+            h = codes[None, :] * self._a
+            h += self._b
+            sigs[start:start + len(offsets)] = np.minimum.reduceat(h, offsets, axis=1).T
+        return sigs
+
+    def _band_keys(self, sigs: np.ndarray) -> np.ndarray:
+        """Collapse each band of each signature to one uint64 bucket key."""
+        bands = sigs.astype(np.uint64).reshape(len(sigs), self._num_bands, self._rows_per_band)
+        return (bands * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    # ------------------------------------------------------------------
+    # Build / query
+    # ------------------------------------------------------------------
+
+    def add_many(self, items: Iterable[tuple[int, str]]) -> None:
+        """Index ``(id, normalised title)`` pairs in bulk; short titles are skipped."""
+        items = [(i, t) for i, t in items if len(t) >= MIN_TITLE_LENGTH]
+        if not items:
+            return
+        ids = np.fromiter((i for i, _ in items), dtype=np.int64, count=len(items))
+        keys = self._band_keys(self._signatures([t for _, t in items])).T
+        order = np.argsort(keys, axis=1, kind="stable")
+        self._segments.append(
+            (np.take_along_axis(keys, order, axis=1), ids[order])
+        )
+        self._titles.update(items)
+
+    def add(self, item_id: int, norm_title: str) -> None:
+        """Index a single title (cheap; meant for incremental additions)."""
+        if len(norm_title) < MIN_TITLE_LENGTH:
+            return
+        keys = self._band_keys(self._signatures([norm_title]))[0].tolist()
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(item_id)
+        self._titles[item_id] = norm_title
+
+    def _candidates(self, keys: np.ndarray) -> set[int]:
+        found: set[int] = set()
+        for sorted_keys, ids in self._segments:
+            for band in range(self._num_bands):
+                row = sorted_keys[band]
+                lo = np.searchsorted(row, keys[band], side="left")
+                hi = np.searchsorted(row, keys[band], side="right")
+                if hi > lo:
+                    found.update(ids[band, lo:hi].tolist())
+        for bucket, key in zip(self._buckets, keys.tolist()):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def query(
+        self, norm_title: str, threshold: Optional[float] = None,
+    ) -> Optional[tuple[int, float]]:
+        """Return ``(id, similarity)`` of the most similar indexed title.
+
+        Only titles at or above *threshold* (default: the index threshold)
+        count; ties go to the lowest id so results do not depend on bucket
+        order.  None if nothing matches.
+        """
+        if threshold is None:
+            threshold = self.threshold
+        if len(norm_title) < MIN_TITLE_LENGTH or not self._titles:
+            return None
+        candidates = self._candidates(self._band_keys(self._signatures([norm_title]))[0])
+        if not candidates:
+            return None
+
+        query_sh = shingles(norm_title)
+        best: Optional[tuple[int, float]] = None
+        for item_id in sorted(candidates):
+            sim = jaccard(query_sh, shingles(self._titles[item_id]))
+            if sim >= threshold and (best is None or sim > best[1]):
+                best = (item_id, sim)
+        return best
@@ -71,7 +71,13 @@ def run_keyword_search(
         ml_path = base_dir / ml_path
 
     print(f"\n[1/6] Loading master list: {ml_path}")
-    ml = MasterList.load(ml_path, reuse_existing=config.master_list.reuse_existing)
+    ml = MasterList.load(
+        ml_path,
+        reuse_existing=config.master_list.reuse_existing,
+        index_sidecar=config.master_list.index_sidecar,
+        journal=config.master_list.journal,
+        journal_max_entries=config.master_list.journal_max_entries,
+    )
     _ml_rows_at_load = ml.row_count
     print(f"      {ml.summary()}")
     summary.master_list_path = str(ml_path)
@@ -103,7 +109,7 @@ def run_keyword_search(
     # ------------------------------------------------------------------
     from scopus_automation.browser import build_driver, set_download_dir
     from scopus_automation.config import ScopusConfig
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.ris import iter_ris_file
     from scopus_automation.search_export import search_and_export
 
     scopus_cfg_path = Path(config.scopus_config_path)
@@ -141,7 +147,6 @@ def run_keyword_search(
             total_results += n
 
             if ris_path and Path(ris_path).exists():
-                raw_entries = parse_ris_file(ris_path)
                 refs = [
                     Reference.from_ris_entry(
                         e,
@@ -149,7 +154,7 @@ def run_keyword_search(
                         query=keyword,
                         query_keyword=keyword,
                     )
-                    for e in raw_entries
+                    for e in iter_ris_file(ris_path)
                 ]
                 all_refs.extend(refs)
                 print(f"        → {n} results found.")
@@ -180,7 +185,12 @@ def run_keyword_search(
     # Step 4: Deduplicate
     # ------------------------------------------------------------------
     print(f"\n[4/6] Deduplicating {len(all_refs)} references...")
-    dedup = deduplicate_references(all_refs, ml)
+    dedup = deduplicate_references(
+        all_refs, ml,
+        fuzzy_titles=config.zotero.fuzzy_title_dedup,
+        fuzzy_threshold=config.zotero.fuzzy_title_threshold,
+        workers=config.zotero.dedup_workers,
+    )
     summary.duplicates_detected = dedup.duplicate_count
     print(f"      New (not in master list): {dedup.new_count}")
     print(f"      Duplicates skipped:       {dedup.duplicate_count}")
@@ -208,8 +218,8 @@ def run_keyword_search(
     # Step 6: Update master list
     # ------------------------------------------------------------------
     print(f"\n[6/6] Updating master list...")
+    ml.bulk_add_or_update(dedup.new_references)
     for ref in dedup.new_references:
-        ml.add_or_update(ref)
         ml.mark_exported(ref)
     ml.save()
     rows_added = ml.row_count - _ml_rows_at_load
@@ -265,7 +275,7 @@ def _write_duplicates_report(duplicates: list[dict], output_dir: Path) -> None:
         return
     path = output_dir / "keyword_duplicates_report.csv"
     fields = ["title", "year", "doi", "scopus_eid", "matched_rule",
-              "matched_fingerprint", "duplicate_of"]
+              "matched_fingerprint", "duplicate_of", "similarity"]
     try:
         with path.open("w", newline="", encoding="utf-8") as fh:
             w = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
@@ -0,0 +1,78 @@
+"""Append-only change journal for the master list.
+
+With journaling enabled, ``MasterList.save()`` no longer rewrites the whole
+master list.  It appends one JSON line per changed row to
+``<master list>.journal.jsonl``:
+
+    {"op": "add",    "values": {"Title": "...", "record_id": "...", ...}}
+    {"op": "update", "record_id": "...", "values": {"already_exported": "True"}}
+
+Updates to rows that have no usable ``record_id`` (blank or shared by several
+rows) carry the row position instead: ``{"op": "update", "row": 12, ...}``.
+Rows are never removed from the master list, so positions are stable.
+
+``MasterList.load()`` replays the journal on top of the base file and
+``MasterList.compact()`` folds it back into the base file and deletes it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterator
+
+log = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path(master_path: Path) -> Path:
+    return master_path.with_name(master_path.name + JOURNAL_SUFFIX)
+
+
+class MasterListJournal:
+    """JSON-lines journal of row additions and column updates."""
+
+    def __init__(self, master_path: str | Path) -> None:
+        self._path = journal_path(Path(master_path))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def exists(self) -> bool:
+        return self._path.exists()
+
+    def read(self) -> Iterator[dict[str, Any]]:
+        """Yield journal entries in the order they were written.
+
+        A truncated last line (crash mid-append) is skipped with a warning.
+        """
+        if not self._path.exists():
+            return
+        with self._path.open(encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning("Skipping unreadable journal line %d in %s",
+                                lineno, self._path.name)
+
+    def append(self, entries: list[dict[str, Any]]) -> None:
+        if not entries:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as fh:
+            for entry in entries:
+                fh.write(json.dumps(entry, ensure_ascii=False))
+                fh.write("\n")
+        log.info("Master list journal: appended %d entries to %s",
+                 len(entries), self._path.name)
+
+    def remove(self) -> None:
+        if self._path.exists():
+            self._path.unlink()
@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 import logging
-import re
-import string
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
-from .models import Reference, TRACKING_COLUMNS, _norm_doi, _norm_title
+from .fingerprint_store import FingerprintStore
+from .fuzzy_title import TitleLSH
+from .master_journal import MasterListJournal
+from .models import Reference, TRACKING_COLUMNS, _norm_title
+from scopus_automation.fingerprint import (
+    DOI_PREFIX_RE,
+    ISBN_STRIP_RE,
+    PUNCT_TABLE,
+    WHITESPACE_RE,
+    YEAR_RE,
+    fp_doi,
+    fp_eid,
+    fp_isbn,
+    fp_pmid,
+    fp_scopus_id,
+    fp_title_author,
+    fp_title_year,
+    rule_fingerprints,
+)
 
 log = logging.getLogger(__name__)
 
@@ -30,94 +46,220 @@ _ZOTERO_PASS_THROUGH = [
 # All master-list columns (Zotero pass-through + tracking)
 _ALL_COLUMNS = _ZOTERO_PASS_THROUGH + TRACKING_COLUMNS
 
+# Columns the fingerprint index is built from
+_FINGERPRINT_COLUMNS = [
+    "DOI", "scopus_eid", "scopus_id", "pmid", "ISBN",
+    "Title", "Publication Year", "Author",
+]
+
+# Columns read eagerly from columnar storage; everything else is deferred
+_CORE_COLUMNS = _FINGERPRINT_COLUMNS + [
+    c for c in TRACKING_COLUMNS if c not in _FINGERPRINT_COLUMNS
+]
+
 
 # ---------------------------------------------------------------------------
-# Fingerprint helpers
+# Storage backends
 # ---------------------------------------------------------------------------
 
-def _fp_doi(doi: str) -> str:
-    d = _norm_doi(doi)
-    return f"doi:{d}" if d else ""
+# File suffix → storage format; anything else is read and written as CSV
+_COLUMNAR_FORMATS = {".parquet": "parquet", ".feather": "feather"}
 
 
-def _fp_eid(eid: str) -> str:
-    e = str(eid).strip()
-    return f"eid:{e}" if e and "2-s2.0" in e else ""
+def _storage_format(path: Path) -> str:
+    return _COLUMNAR_FORMATS.get(path.suffix.lower(), "csv")
 
 
-def _fp_scopus_id(sid: str) -> str:
-    s = str(sid).strip()
-    return f"scopus_id:{s}" if s and s.isdigit() else ""
+def _require_pyarrow():
+    try:
+        import pyarrow  # type: ignore  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for a Parquet/Feather master list.  "
+            "Install it with:  pip install pyarrow"
+        ) from exc
 
 
-def _fp_pmid(pmid: str) -> str:
-    p = str(pmid).strip()
-    return f"pmid:{p}" if p and p.isdigit() else ""
+def _columnar_columns(path: Path, fmt: str) -> list[str]:
+    """Column names stored in a Parquet/Feather file, without reading any data."""
+    _require_pyarrow()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq  # type: ignore
+        return list(pq.read_schema(path).names)
+    import pyarrow.ipc as ipc  # type: ignore
+    with ipc.open_file(path) as reader:
+        return list(reader.schema.names)
 
 
-def _fp_isbn(isbn: str) -> str:
-    i = re.sub(r"[\s\-]", "", str(isbn)).strip()
-    return f"isbn:{i}" if i else ""
+def _read_columnar(path: Path, fmt: str, columns: list[str]) -> pd.DataFrame:
+    _require_pyarrow()
+    if fmt == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+    # Match read_csv(dtype=object): plain object columns, NaN for missing cells
+    df = df.astype(object)
+    return df.where(df.notna(), float("nan"))
 
 
-def _fp_title_year(title: str, year: str) -> str:
-    t = _norm_title(title)
-    if not t:
-        return ""
-    y = re.search(r"\d{4}", str(year))
-    year_s = y.group(0) if y else ""
-    return f"title_year:{t}|{year_s}"
+def _write_columnar(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    _require_pyarrow()
+    # Tracking flags/counters are held as bool/int in memory; store every
+    # column as nullable strings, exactly as they round-trip through CSV.
+    out = df.reset_index(drop=True).astype("string")
+    if fmt == "parquet":
+        out.to_parquet(path, index=False)
+    else:
+        out.to_feather(path)
 
 
-def _fp_title_author(title: str, author: str) -> str:
-    t = _norm_title(title)
-    if not t:
-        return ""
-    # Last name of first author (before first comma)
-    a = str(author).split(",")[0].strip().lower()
-    a = a.translate(str.maketrans("", "", string.punctuation))
-    a = re.sub(r"\s+", " ", a).strip()
-    return f"title_author:{t}|{a}" if a else ""
+def _add_empty_column(df: pd.DataFrame, col: str) -> None:
+    # Explicit object dtype: a bare "" would become a "str" column under
+    # pandas 3, which then rejects the bool/int tracking values.
+    df[col] = pd.Series("", index=df.index, dtype=object)
 
 
-def _reference_fingerprints(ref: Reference) -> list[str]:
-    fps: list[str] = []
-    for f in [
-        _fp_doi(ref.doi),
-        _fp_eid(ref.scopus_eid),
-        _fp_scopus_id(ref.scopus_id),
-        _fp_pmid(ref.pmid),
-        _fp_isbn(ref.isbn),
-        _fp_title_year(ref.title, ref.year),
-        _fp_title_author(ref.title, ref.authors[0] if ref.authors else ""),
-    ]:
-        if f:
-            fps.append(f)
-    return fps
+def _journal_value(val) -> str:
+    """Cell value as it would read back from CSV ("" for missing)."""
+    return "" if pd.isna(val) else str(val)
+
+
+def _unique_record_ids(ids: pd.Series) -> dict[str, int]:
+    """``record_id → row index`` for ids that are non-empty and not shared."""
+    ids = ids.fillna("").astype(str)
+    ids = ids[(ids != "") & ~ids.duplicated(keep=False)]
+    return {rid: int(idx) for idx, rid in ids.items()}
+
+
+def _write_frame(df: pd.DataFrame, path: Path) -> None:
+    fmt = _storage_format(path)
+    if fmt == "csv":
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+    else:
+        _write_columnar(df, path, fmt)
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint helpers (rules live in scopus_automation.fingerprint)
+# ---------------------------------------------------------------------------
+
+def _key_fingerprints(key: tuple[str, ...]) -> tuple[str, ...]:
+    """One fingerprint per dedup rule for a :meth:`Reference.identity_key`.
+
+    Rules that do not apply give "".  Rule order matches the dedup engine.
+    """
+    return rule_fingerprints(*key)
+
+
+def _remember_fingerprints(
+    ref: Reference, key: tuple[str, ...], rule_fps: tuple[str, ...],
+) -> tuple[str, ...]:
+    ref._fingerprints = (key, rule_fps, tuple(f for f in rule_fps if f))
+    return rule_fps
+
+
+def _reference_rule_fingerprints(ref: Reference) -> tuple[str, ...]:
+    """Per-rule fingerprints of *ref*, memoised on the reference itself."""
+    key = ref.identity_key()
+    cached = ref._fingerprints
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    return _remember_fingerprints(ref, key, _key_fingerprints(key))
+
+
+def _reference_fingerprints(ref: Reference) -> tuple[str, ...]:
+    """Non-empty fingerprints of *ref* in rule priority order (memoised)."""
+    _reference_rule_fingerprints(ref)
+    return ref._fingerprints[2]
+
+
+def _cell(row: pd.Series, col: str) -> str:
+    val = row.get(col, "")
+    return "" if pd.isna(val) else str(val)
 
 
 def _row_fingerprints(row: pd.Series) -> list[str]:
     fps: list[str] = []
     for f in [
-        _fp_doi(str(row.get("DOI", "") or "")),
-        _fp_eid(str(row.get("scopus_eid", "") or "")),
-        _fp_scopus_id(str(row.get("scopus_id", "") or "")),
-        _fp_pmid(str(row.get("pmid", "") or "")),
-        _fp_isbn(str(row.get("ISBN", "") or "")),
-        _fp_title_year(
-            str(row.get("Title", "") or ""),
-            str(row.get("Publication Year", "") or ""),
-        ),
-        _fp_title_author(
-            str(row.get("Title", "") or ""),
-            str(row.get("Author", "") or ""),
-        ),
+        fp_doi(_cell(row, "DOI")),
+        fp_eid(_cell(row, "scopus_eid")),
+        fp_scopus_id(_cell(row, "scopus_id")),
+        fp_pmid(_cell(row, "pmid")),
+        fp_isbn(_cell(row, "ISBN")),
+        fp_title_year(_cell(row, "Title"), _cell(row, "Publication Year")),
+        fp_title_author(_cell(row, "Title"), _cell(row, "Author")),
     ]:
         if f:
             fps.append(f)
     return fps
 
 
+# ---------------------------------------------------------------------------
+# Vectorised (column-wise) fingerprint builders
+#
+# Each builder mirrors its scalar fp_* counterpart using pandas string ops
+# and the same compiled patterns, returning one fingerprint per row ("" where
+# the rule does not apply).
+# ---------------------------------------------------------------------------
+
+
+def _col(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str)
+
+
+def _prefixed(prefix: str, values: pd.Series, valid: pd.Series) -> pd.Series:
+    return (prefix + values).where(valid, "")
+
+
+def _norm_text_col(s: pd.Series) -> pd.Series:
+    s = s.str.lower().str.translate(PUNCT_TABLE)
+    return s.str.replace(WHITESPACE_RE, " ", regex=True).str.strip()
+
+
+def _frame_fingerprint_columns(df: pd.DataFrame) -> list[pd.Series]:
+    """Return one fingerprint Series per dedup rule, in rule priority order."""
+    doi = _col(df, "DOI").str.strip().str.lower()
+    doi = doi.str.replace(DOI_PREFIX_RE, "", regex=True)
+
+    eid = _col(df, "scopus_eid").str.strip()
+    sid = _col(df, "scopus_id").str.strip()
+    pmid = _col(df, "pmid").str.strip()
+    isbn = _col(df, "ISBN").str.replace(ISBN_STRIP_RE, "", regex=True).str.strip()
+
+    title = _norm_text_col(_col(df, "Title"))
+    year = _col(df, "Publication Year").str.extract(f"({YEAR_RE.pattern})", expand=False).fillna("")
+    author = _norm_text_col(_col(df, "Author").str.split(",", n=1).str[0].str.strip())
+    has_title = title != ""
+
+    return [
+        _prefixed("doi:", doi, doi != ""),
+        _prefixed("eid:", eid, eid.str.contains("2-s2.0", regex=False)),
+        _prefixed("scopus_id:", sid, sid.str.isdigit() & (sid != "")),
+        _prefixed("pmid:", pmid, pmid.str.isdigit() & (pmid != "")),
+        _prefixed("isbn:", isbn, isbn != ""),
+        _prefixed("title_year:", title + "|" + year, has_title),
+        _prefixed("title_author:", title + "|" + author, has_title & (author != "")),
+    ]
+
+
+def _frame_fingerprints(df: pd.DataFrame) -> dict[str, int]:
+    """Build the ``fingerprint -> row index`` map for a whole frame at once.
+
+    Equivalent to calling :func:`_row_fingerprints` on every row and keeping
+    the first row index seen for each fingerprint.
+    """
+    cache: dict[str, int] = {}
+    if df.empty:
+        return cache
+    for fps in _frame_fingerprint_columns(df):
+        fps = fps[fps != ""]
+        fps = fps[~fps.duplicated(keep="first")]
+        cache.update(zip(fps.tolist(), (int(i) for i in fps.index)))
+    return cache
+
+
 # ---------------------------------------------------------------------------
 # MasterList
 # ---------------------------------------------------------------------------
@@ -126,24 +268,83 @@ class MasterList:
     """Pandas-backed master reference list.
 
     Preserves all existing Zotero CSV columns and appends tracking columns.
+    When an index store is attached, the fingerprint cache is persisted in a
+    sidecar next to the CSV and reloaded from there while the CSV is unchanged.
+
+    The storage format follows the file suffix: ``.parquet`` / ``.feather``
+    select a columnar backend (requires pyarrow) that reads only the
+    fingerprint and tracking columns up front; the remaining Zotero columns
+    are read on demand, when a row update touches them or on save/export.
+
+    With journaling enabled, :meth:`save` appends only the rows added and the
+    cells changed since the last save to an append-only journal (see
+    :mod:`pipeline.master_journal`); :meth:`compact` folds it back into the
+    base file.  A journal left on disk is always replayed on load.
     """
 
-    def __init__(self, df: pd.DataFrame, path: Path) -> None:
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        path: Path,
+        index_store: Optional[FingerprintStore] = None,
+        journal: bool = False,
+        journal_max_entries: int = 10_000,
+    ) -> None:
         self._df = df
         self._path = path
+        self._journal = MasterListJournal(path)
+        self._journal_enabled = journal
+        self._journal_max_entries = journal_max_entries  # compact beyond this; 0 = never
+        self._journal_entries = 0
+        self._base_loaded = False  # _df was read from (or last written to) _path
+        # Persistence state: rows [0, _persisted_rows) are on disk; _dirty
+        # holds the changed columns of those rows, _orig_ids their record_id
+        # as last persisted (when it has changed since).
+        self._persisted_rows = len(df)
+        self._dirty: dict[int, set[str]] = {}
+        self._orig_ids: dict[int, str] = {}
         self._fp_cache: dict[str, int] | None = None  # fingerprint → row index
+        self._index_store = index_store
+        self._index_store_current = False  # sidecar matches the CSV _df was read from
+        # Fingerprints added since the sidecar was last written;
+        # None means the sidecar must be rewritten in full on save.
+        self._fp_pending: dict[str, int] | None = None
+        self._title_index: TitleLSH | None = None  # built on first fuzzy lookup
+        self._format = _storage_format(path)
+        self._disk_columns: list[str] = list(df.columns)  # on-disk column order
+        self._deferred: list[str] = []  # on-disk columns not read yet
 
     # ------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------
 
     @classmethod
-    def load(cls, path: str | Path, reuse_existing: bool = True) -> "MasterList":
+    def load(
+        cls,
+        path: str | Path,
+        reuse_existing: bool = True,
+        index_sidecar: bool = True,
+        journal: bool = False,
+        journal_max_entries: int = 10_000,
+    ) -> "MasterList":
         path = Path(path)
+        fmt = _storage_format(path)
+        from_disk = False
+        disk_columns: list[str] = []
         if path.exists() and reuse_existing:
             try:
-                df = pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+                if fmt == "csv":
+                    df = pd.read_csv(path, dtype=object, encoding="utf-8-sig")
+                    disk_columns = list(df.columns)
+                else:
+                    disk_columns = _columnar_columns(path, fmt)
+                    df = _read_columnar(
+                        path, fmt, [c for c in disk_columns if c in _CORE_COLUMNS]
+                    )
+                from_disk = True
                 log.info("Loaded master list: %s (%d rows)", path, len(df))
+            except ImportError:
+                raise
             except Exception as exc:
                 log.warning("Could not read %s: %s — starting fresh.", path, exc)
                 df = pd.DataFrame()
@@ -154,10 +355,23 @@ class MasterList:
         # Add missing tracking columns
         for col in TRACKING_COLUMNS:
             if col not in df.columns:
-                df[col] = ""
+                _add_empty_column(df, col)
 
-        ml = cls(df, path)
+        ml = cls(
+            df, path,
+            journal=journal,
+            journal_max_entries=journal_max_entries,
+        )
+        if index_sidecar:
+            ml._index_store = FingerprintStore(path, journal_path=ml._journal.path)
         ml._invalidate_cache()
+        if from_disk:
+            ml._base_loaded = True
+            ml._disk_columns = disk_columns
+            ml._deferred = [c for c in disk_columns if c not in df.columns]
+            ml._replay_journal()
+        if ml._index_store is not None and from_disk:
+            ml._index_store_current = ml._index_store.is_current(ml.row_count)
         return ml
 
     # ------------------------------------------------------------------
@@ -166,21 +380,172 @@ class MasterList:
 
     def _invalidate_cache(self) -> None:
         self._fp_cache = None
+        self._fp_pending = None
+        self._index_store_current = False
+        self._title_index = None
 
     def _build_cache(self) -> None:
-        cache: dict[str, int] = {}
-        for idx, row in self._df.iterrows():
-            for fp in _row_fingerprints(row):
-                if fp not in cache:
-                    cache[fp] = int(idx)
+        if self._index_store is not None and self._index_store_current:
+            self._fp_cache = self._index_store.load()
+            self._fp_pending = {}
+            return
+        cache = _frame_fingerprints(self._df)
         self._fp_cache = cache
+        self._fp_pending = None
         log.debug("Fingerprint cache built: %d fingerprints from %d rows.", len(cache), len(self._df))
 
+    def _register_fingerprints(self, fps: list[str], idx: int) -> None:
+        """Add *fps* → *idx* to the cache, keeping any existing (earlier) entry."""
+        if self._fp_cache is None:
+            return
+        for fp in fps:
+            if fp not in self._fp_cache:
+                self._fp_cache[fp] = idx
+                if self._fp_pending is not None:
+                    self._fp_pending[fp] = idx
+
+    # ------------------------------------------------------------------
+    # Deferred columns (columnar backends)
+    # ------------------------------------------------------------------
+
+    def _hydrate(self, columns) -> None:
+        """Read deferred on-disk *columns* into the frame before they are used."""
+        cols = [c for c in columns if c in self._deferred]
+        if not cols:
+            return
+        extra = _read_columnar(self._path, self._format, cols)
+        for col in cols:
+            # Rows appended since load have no on-disk value
+            self._df[col] = extra[col].reindex(self._df.index)
+            self._deferred.remove(col)
+        log.debug("Read deferred columns from %s: %s", self._path.name, cols)
+
+    def _full_frame(self) -> pd.DataFrame:
+        """All columns, in on-disk order followed by any added in memory."""
+        self._hydrate(list(self._deferred))
+        order = [c for c in self._disk_columns if c in self._df.columns]
+        order += [c for c in self._df.columns if c not in order]
+        return self._df[order]
+
+    # ------------------------------------------------------------------
+    # Change journal
+    # ------------------------------------------------------------------
+
+    def _set(self, idx: int, col: str, val) -> None:
+        """Set one cell, remembering the change for the journal."""
+        if idx < self._persisted_rows:
+            if col == "record_id" and idx not in self._orig_ids:
+                self._orig_ids[idx] = self._df.at[idx, col] if col in self._df.columns else ""
+            self._dirty.setdefault(idx, set()).add(col)
+        self._df.at[idx, col] = val
+        if col == "Title":
+            self._title_index = None
+
+    def _append_rows(self, rows: list[dict], fill_value="") -> int:
+        """Append *rows* in one concatenation; returns the index of the first."""
+        for col in {col for row in rows for col in row}:
+            if col not in self._df.columns:
+                _add_empty_column(self._df, col)
+        new_df = pd.DataFrame(rows).reindex(columns=self._df.columns, fill_value=fill_value)
+        base = len(self._df)
+        self._df = pd.concat([self._df, new_df], ignore_index=True)
+        if self._title_index is not None:
+            for i, row in enumerate(rows, base):
+                self._title_index.add(i, _norm_title(_cell(row, "Title")))
+        return base
+
+    def _replay_journal(self) -> None:
+        """Apply the on-disk journal to the frame just read from the base file."""
+        adds: list[dict] = []
+        id_index: dict[str, int] | None = None
+        applied = 0
+
+        for entry in self._journal.read():
+            values = entry.get("values") or {}
+            self._hydrate(values.keys())
+            if entry.get("op") == "add":
+                adds.append(values)
+            elif entry.get("op") == "update":
+                if adds:
+                    self._append_rows(adds, fill_value=float("nan"))
+                    adds, id_index = [], None
+                if id_index is None:
+                    id_index = _unique_record_ids(self._df["record_id"])
+                idx = entry.get("row")
+                if idx is None:
+                    idx = id_index.get(str(entry.get("record_id", "")))
+                if idx is None or not 0 <= int(idx) < len(self._df):
+                    log.warning("Journal update for unknown row skipped: %s", entry)
+                    continue
+                for col, val in values.items():
+                    if col not in self._df.columns:
+                        _add_empty_column(self._df, col)
+                    self._df.at[int(idx), col] = float("nan") if val in (None, "") else val
+                    if col == "record_id":
+                        id_index = None
+            applied += 1
+        if adds:
+            self._append_rows(adds, fill_value=float("nan"))
+
+        self._journal_entries = applied
+        self._persisted_rows = len(self._df)
+        if applied:
+            log.info("Replayed %d journal entries from %s (%d rows).",
+                     applied, self._journal.path.name, len(self._df))
+
+    def _journal_changes(self) -> list[dict]:
+        """Journal entries for everything changed since the last save.
+
+        Updates are written before additions so that, on replay, each update
+        is resolved against exactly the rows that existed when it was made.
+        """
+        entries: list[dict] = []
+        if self._dirty:
+            ids = self._df["record_id"].iloc[: self._persisted_rows].copy()
+            for idx, old in self._orig_ids.items():
+                ids.iat[idx] = old
+            id_index = _unique_record_ids(ids)
+            for idx in sorted(self._dirty):
+                values = {
+                    col: _journal_value(self._df.at[idx, col])
+                    for col in sorted(self._dirty[idx])
+                }
+                key = _journal_value(ids.iat[idx])
+                if key and id_index.get(key) == idx:
+                    entries.append({"op": "update", "record_id": key, "values": values})
+                else:
+                    entries.append({"op": "update", "row": idx, "values": values})
+
+        for idx in range(self._persisted_rows, len(self._df)):
+            row = self._df.iloc[idx]
+            values = {
+                col: v for col, v in
+                ((col, _journal_value(row[col])) for col in self._df.columns)
+                if v
+            }
+            entries.append({"op": "add", "values": values})
+        return entries
+
+    def _mark_persisted(self) -> None:
+        self._persisted_rows = len(self._df)
+        self._dirty = {}
+        self._orig_ids = {}
+
     def _get_cache(self) -> dict[str, int]:
         if self._fp_cache is None:
             self._build_cache()
         return self._fp_cache
 
+    def _get_title_index(self) -> TitleLSH:
+        """MinHash/LSH index of the normalised titles, built once on demand."""
+        if self._title_index is None:
+            titles = _norm_text_col(_col(self._df, "Title"))
+            index = TitleLSH()
+            index.add_many(zip(titles.index.tolist(), titles.tolist()))
+            self._title_index = index
+            log.debug("Title LSH index built: %d titles.", len(index))
+        return self._title_index
+
     # ------------------------------------------------------------------
     # Lookup
     # ------------------------------------------------------------------
@@ -219,29 +584,38 @@ class MasterList:
     # Mutation
     # ------------------------------------------------------------------
 
-    def add_or_update(self, ref: Reference, extra_zotero_row: Optional[dict] = None) -> int:
-        """Add a new row or update an existing matching row.
-
-        Returns the row index.
-        """
-        idx = self.find_row_index(ref)
+    @staticmethod
+    def _row_data(ref: Reference, extra_zotero_row: Optional[dict] = None) -> dict:
         row_data = ref.to_master_list_row()
-
         if extra_zotero_row:
             # Preserve all original Zotero CSV columns not in our row_data
             for col, val in extra_zotero_row.items():
                 if col not in row_data or not row_data[col]:
                     row_data[col] = val
+        return row_data
+
+    def _update_row(self, idx: int, row_data: dict) -> None:
+        for col, val in row_data.items():
+            if col in self._df.columns:
+                # Only update tracking columns; preserve Zotero cols if present
+                if col in TRACKING_COLUMNS or not self._df.at[idx, col]:
+                    self._set(idx, col, val)
+            else:
+                self._set(idx, col, val)
+        # Filling previously-empty identifier columns can add fingerprints
+        self._register_fingerprints(_row_fingerprints(self._df.loc[idx]), idx)
+
+    def add_or_update(self, ref: Reference, extra_zotero_row: Optional[dict] = None) -> int:
+        """Add a new row or update an existing matching row.
+
+        Returns the row index.
+        """
+        idx = self.find_row_index(ref)
+        row_data = self._row_data(ref, extra_zotero_row)
+        self._hydrate(row_data.keys())
 
         if idx is not None:
-            for col, val in row_data.items():
-                if col in self._df.columns:
-                    # Only update tracking columns; preserve Zotero cols if present
-                    if col in TRACKING_COLUMNS or not self._df.at[idx, col]:
-                        self._df.at[idx, col] = val
-                else:
-                    self._df.at[idx, col] = val
-            # Updating an existing row doesn't add new fingerprints — no cache rebuild
+            self._update_row(int(idx), row_data)
             return int(idx)
         else:
             # Ensure all columns exist
@@ -249,7 +623,7 @@ class MasterList:
                 if col not in row_data:
                     row_data[col] = ""
                 if col not in self._df.columns:
-                    self._df[col] = ""
+                    _add_empty_column(self._df, col)
 
             new_row = pd.Series({c: row_data.get(c, "") for c in self._df.columns})
             self._df = pd.concat(
@@ -257,13 +631,95 @@ class MasterList:
             )
             new_idx = len(self._df) - 1
             # Incrementally add new fingerprints to the cache rather than full rebuild
-            if self._fp_cache is not None:
-                for fp in _reference_fingerprints(ref):
-                    if fp not in self._fp_cache:
-                        self._fp_cache[fp] = new_idx
+            self._register_fingerprints(_reference_fingerprints(ref), new_idx)
+            self._register_fingerprints(_row_fingerprints(self._df.loc[new_idx]), new_idx)
+            if self._title_index is not None:
+                self._title_index.add(new_idx, _norm_title(row_data.get("Title", "")))
             log.debug("Added new record at row %d: %s", new_idx, ref.title[:60])
             return new_idx
 
+    def bulk_add_or_update(
+        self,
+        refs: list[Reference],
+        extra_zotero_rows: Optional[list[Optional[dict]]] = None,
+    ) -> tuple[int, int]:
+        """Add or update many references with a single concatenation.
+
+        Same result as calling :meth:`add_or_update` on each reference in
+        order, including references in *refs* that match one another, but
+        new rows are built into one frame and appended once instead of one
+        ``pd.concat`` per row.
+
+        Returns ``(added, updated)``.
+        """
+        cache = self._get_cache()
+        if extra_zotero_rows is None:
+            extra_zotero_rows = [None] * len(refs)
+
+        new_rows: list[dict] = []
+        new_refs: list[Reference] = []
+        # fingerprint → position in new_rows; kept disjoint from the cache so
+        # each fingerprint points at the row that claimed it first, as it
+        # would after sequential add_or_update calls
+        new_fps: dict[str, int] = {}
+
+        def _claim(fps, pos: int) -> None:
+            for fp in fps:
+                if fp not in cache:
+                    new_fps.setdefault(fp, pos)
+
+        # 1. Resolve every reference against the index (master list + this batch).
+        #    Existing rows are updated in place straight away, so identifiers
+        #    they gain are visible to the references that follow.
+        updated = 0
+        for ref, extra in zip(refs, extra_zotero_rows):
+            row_data = self._row_data(ref, extra)
+            fps = _reference_fingerprints(ref)
+            idx: Optional[int] = None
+            pos: Optional[int] = None
+            for fp in fps:
+                if fp in new_fps:
+                    pos = new_fps[fp]
+                    break
+                if fp in cache:
+                    idx = cache[fp]
+                    break
+
+            if idx is not None:
+                self._hydrate(row_data.keys())
+                self._update_row(int(idx), row_data)
+                updated += 1
+            elif pos is not None:
+                pending = new_rows[pos]
+                for col, val in row_data.items():
+                    if col in TRACKING_COLUMNS or not pending.get(col):
+                        pending[col] = val
+                # Filling previously-empty identifier columns can add fingerprints
+                _claim(_row_fingerprints(pending), pos)
+                updated += 1
+            else:
+                _claim(fps, len(new_rows))
+                _claim(_row_fingerprints(row_data), len(new_rows))
+                new_rows.append(row_data)
+                new_refs.append(ref)
+
+        # 2. Append all new rows at once
+        if new_rows:
+            self._hydrate({col for row_data in new_rows for col in row_data})
+            base = self._append_rows(new_rows)
+            for fp, pos in new_fps.items():
+                cache[fp] = base + pos
+                if self._fp_pending is not None:
+                    self._fp_pending[fp] = base + pos
+            for pos, ref in enumerate(new_refs):
+                self._register_fingerprints(_reference_fingerprints(ref), base + pos)
+            for fp, idx in _frame_fingerprints(self._df.iloc[base:]).items():
+                self._register_fingerprints([fp], idx)
+
+        added = len(new_rows)
+        log.info("Master list bulk update: %d added, %d updated.", added, updated)
+        return added, updated
+
     def mark_parent_processed(
         self,
         ref: Reference,
@@ -275,24 +731,82 @@ class MasterList:
         if idx is None:
             idx = self.add_or_update(ref)
 
-        self._df.at[idx, "has_been_processed_for_children"] = True
-        self._df.at[idx, "children_last_run_at"] = timestamp
-        self._df.at[idx, "children_result_count"] = result_count
-        self._df.at[idx, "children_exported_count"] = exported_count
+        self._set(idx, "has_been_processed_for_children", True)
+        self._set(idx, "children_last_run_at", timestamp)
+        self._set(idx, "children_result_count", result_count)
+        self._set(idx, "children_exported_count", exported_count)
 
     def mark_exported(self, ref: Reference) -> None:
         idx = self.find_row_index(ref)
         if idx is not None:
-            self._df.at[idx, "already_exported"] = True
+            self._set(idx, "already_exported", True)
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
     def save(self) -> None:
+        """Persist the master list.
+
+        Rewrites the base file, or with journaling enabled (and a base file
+        already on disk) appends just the changes since the last save to the
+        journal, compacting once it grows past ``journal_max_entries``.
+        """
+        if not self._journal_enabled or not self._base_loaded:
+            self.compact()
+            return
+
+        entries = self._journal_changes()
+        self._journal.append(entries)
+        self._journal_entries += len(entries)
+        self._mark_persisted()
+        log.info("Master list saved: %s (%d rows, %d journal entries)",
+                 self._path, len(self._df), self._journal_entries)
+
+        if 0 < self._journal_max_entries < self._journal_entries:
+            self.compact()
+        else:
+            self._save_index()
+
+    def compact(self) -> None:
+        """Rewrite the base file with every change and delete the journal."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._df.to_csv(self._path, index=False, encoding="utf-8-sig")
+        _write_frame(self._full_frame(), self._path)
+        self._journal.remove()
+        self._journal_entries = 0
+        self._base_loaded = True
+        self._mark_persisted()
         log.info("Master list saved: %s (%d rows)", self._path, len(self._df))
+        self._save_index()
+
+    def export(self, path: str | Path) -> Path:
+        """Write the full master list to *path* without changing where it is saved.
+
+        The format follows the suffix, so ``export("library.csv")`` produces a
+        Zotero-compatible CSV from a Parquet/Feather master list.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_frame(self._full_frame(), path)
+        log.info("Master list exported: %s (%d rows)", path, len(self._df))
+        return path
+
+    def _save_index(self) -> None:
+        """Bring the fingerprint sidecar in line with the file just written."""
+        if self._index_store is None:
+            return
+        cache = self._get_cache()
+        try:
+            if self._fp_pending is None:
+                self._index_store.write(cache.items(), len(self._df), replace=True)
+            else:
+                self._index_store.write(self._fp_pending.items(), len(self._df))
+        except Exception as exc:
+            log.warning("Could not update fingerprint sidecar %s: %s",
+                        self._index_store.path, exc)
+            return
+        self._fp_pending = {}
+        self._index_store_current = True
 
     # ------------------------------------------------------------------
     # Info
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import pickle
 import re
-import string
 import uuid
+import zlib
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from scopus_automation.fingerprint import extract_eid, extract_year
+from scopus_automation.fingerprint import normalise_doi as _norm_doi
+from scopus_automation.fingerprint import normalise_title as _norm_title
+
 
 # ---------------------------------------------------------------------------
 # Tracking columns appended to the master list CSV
@@ -38,21 +43,10 @@ TRACKING_COLUMNS = [
 
 
 # ---------------------------------------------------------------------------
-# Normalisation helpers (module-level so models.py is self-contained)
+# Normalisation helpers (_norm_doi / _norm_title come from
+# scopus_automation.fingerprint, shared with the RIS dedup code)
 # ---------------------------------------------------------------------------
 
-def _norm_doi(doi: str) -> str:
-    doi = str(doi).strip().lower()
-    doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", doi)
-    return doi
-
-
-def _norm_title(title: str) -> str:
-    t = str(title).lower()
-    t = t.translate(str.maketrans("", "", string.punctuation))
-    return re.sub(r"\s+", " ", t).strip()
-
-
 def _extract_scopus_id_from_url(url: str) -> str:
     m = re.search(r"scopus\.com/pages/publications/(\d+)", str(url))
     return m.group(1) if m else ""
@@ -63,13 +57,51 @@ def _extract_pmid_from_extra(extra: str) -> str:
     return m.group(1) if m else ""
 
 
+# ---------------------------------------------------------------------------
+# Packed raw entries
+# ---------------------------------------------------------------------------
+
+class PackedRaw:
+    """A raw RIS entry kept zlib-compressed until the exporter needs it.
+
+    Child references keep their original RIS entry (keywords, URLs, notes,
+    every tag Scopus exported) only so the RIS exporter can write it back
+    out.  The abstract — the bulk of most entries — is already held by
+    ``Reference.abstract``, so it is left out of the blob and put back on
+    :meth:`unpack`.  Each unpack builds a fresh dict; nothing is cached.
+    """
+
+    __slots__ = ("_blob", "_has_abstract")
+
+    def __init__(self, entry: dict[str, Any], abstract: str = "") -> None:
+        entry = dict(entry)
+        self._has_abstract = bool(abstract) and entry.get("AB") == abstract
+        if self._has_abstract:
+            entry["AB"] = None  # keeps the tag's position in the entry
+        self._blob = zlib.compress(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL), 1)
+
+    def unpack(self, abstract: str = "") -> dict[str, Any]:
+        entry = pickle.loads(zlib.decompress(self._blob))
+        if self._has_abstract:
+            entry["AB"] = abstract
+        return entry
+
+    def __repr__(self) -> str:
+        return f"PackedRaw({len(self._blob)} bytes)"
+
+
 # ---------------------------------------------------------------------------
 # Reference
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Reference:
-    """Internal representation of a single bibliographic reference."""
+    """Internal representation of a single bibliographic reference.
+
+    Slotted: tens of thousands of these are alive during multi-generation
+    citation expansion.  References built from RIS entries keep the entry
+    as a :class:`PackedRaw`; use :meth:`raw_entry` to read it.
+    """
 
     record_id: str = ""
     reference_role: str = ""       # "parent" | "child"
@@ -102,8 +134,14 @@ class Reference:
     abstract: str = ""
     publication_title: str = ""
     item_type: str = ""
-    # Original raw data (not written to master list CSV)
-    _raw: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    # Original raw data (not written to master list CSV); a plain dict, or a
+    # PackedRaw for references built from RIS entries
+    _raw: dict[str, Any] | PackedRaw = field(default_factory=dict, repr=False, compare=False)
+    # Memoised dedup fingerprints: (identity_key() they were built from, per-rule
+    # fingerprints, non-empty fingerprints).  See master_list._reference_rule_fingerprints.
+    _fingerprints: Optional[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self) -> None:
         if not self.record_id:
@@ -117,6 +155,25 @@ class Reference:
         if self.doi:
             self.doi = _norm_doi(self.doi)
 
+    def raw_entry(self) -> dict[str, Any]:
+        """The original RIS entry or Zotero row as a dict (unpacked if packed)."""
+        raw = self._raw
+        if isinstance(raw, PackedRaw):
+            return raw.unpack(self.abstract)
+        return raw or {}
+
+    def identity_key(self) -> tuple[str, ...]:
+        """The fields the dedup fingerprints are built from.
+
+        Cached fingerprints are reused only while this key is unchanged, so
+        editing an identity field (even in place, e.g. ``authors[0]``)
+        invalidates them.
+        """
+        return (
+            self.doi, self.scopus_eid, self.scopus_id, self.pmid, self.isbn,
+            self.title, self.year, self.authors[0] if self.authors else "",
+        )
+
     # ------------------------------------------------------------------
     # Factory: from Zotero CSV row
     # ------------------------------------------------------------------
@@ -174,8 +231,7 @@ class Reference:
             authors = [authors]
 
         year_raw = _first(entry.get("PY") or entry.get("Y1") or "")
-        year_m = re.search(r"\d{4}", year_raw)
-        year = year_m.group(0) if year_m else ""
+        year = extract_year(year_raw)
 
         doi = _first(entry.get("DO") or "")
 
@@ -187,10 +243,7 @@ class Reference:
                 eid = v
                 break
         if not eid:
-            n1 = _first(entry.get("N1") or "")
-            m = re.search(r"2-s2\.0-\d+", n1)
-            if m:
-                eid = m.group(0)
+            eid = extract_eid(_first(entry.get("N1") or ""))
 
         sn = entry.get("SN") or ""
         if isinstance(sn, list):
@@ -214,7 +267,7 @@ class Reference:
             item_type="journalArticle",
             query=query,
             query_keyword=query_keyword,
-            _raw=entry,
+            _raw=PackedRaw(entry, ab),
         )
 
         if parent:
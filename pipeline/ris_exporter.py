@@ -5,7 +5,9 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+from scopus_automation.ris import RISWriter
 
 from .models import Reference
 
@@ -26,11 +28,11 @@ _TY_MAP = {
 def _reference_to_ris_entry(ref: Reference) -> dict:
     """Convert a Reference to an RIS entry dict.
 
-    If the Reference was created from a RIS entry (_raw is a RIS dict),
-    the original entry is returned with tracking fields patched in.
+    If the Reference was created from a RIS entry (_raw holds the packed
+    entry), the original entry is returned with tracking fields patched in.
     Otherwise, a new entry is built from Reference fields.
     """
-    raw = ref._raw or {}
+    raw = ref.raw_entry()
 
     # If the raw dict looks like a parsed RIS entry (has TY or TI tag), use it
     if raw.get("TY") or raw.get("TI"):
@@ -67,34 +69,22 @@ def _reference_to_ris_entry(ref: Reference) -> dict:
     return entry
 
 
-def _ris_entries_to_text(entries: list[dict]) -> str:
-    """Convert a list of RIS entry dicts to a RIS-format string."""
-    lines: list[str] = []
-    for entry in entries:
-        for tag, value in entry.items():
-            if isinstance(value, list):
-                for v in value:
-                    lines.append(f"{tag}  - {v}")
-            elif value:
-                lines.append(f"{tag}  - {value}")
-        lines.append("ER  - ")
-        lines.append("")
-    return "\n".join(lines)
-
-
 def export_to_ris(
-    references: list[Reference],
+    references: Iterable[Reference],
     output_path: str | Path,
+    compress: Optional[bool] = None,
 ) -> str:
-    """Write references to a RIS file.  Returns the absolute path string."""
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    """Write references to a RIS file.  Returns the absolute path string.
 
-    entries = [_reference_to_ris_entry(r) for r in references]
-    text = _ris_entries_to_text(entries)
-    output_path.write_text(text, encoding="utf-8")
+    References are converted and written one at a time, so the output is
+    never held in memory as a whole.  A ``.gz`` suffix (or
+    ``compress=True``) writes gzip-compressed RIS.
+    """
+    output_path = Path(output_path)
+    with RISWriter(output_path, compress=compress, skip_empty=True) as writer:
+        writer.write_all(_reference_to_ris_entry(r) for r in references)
 
-    log.info("Exported %d references to %s", len(references), output_path)
+    log.info("Exported %d references to %s", writer.count, output_path)
     return str(output_path.resolve())
 
 
@@ -38,12 +38,19 @@ def get_completed(db_path: Path, keyword_filter: str) -> int:
 
 
 def load_db_path_and_filter():
-    import yaml
-    cfg = yaml.safe_load(CONFIG.read_text(encoding="utf-8"))
-    root = Path(cfg["project_root"])
-    db_path = root / cfg["output"]["db_file"]
-    kf = cfg["processing"].get("keyword_filter", "1=1")
-    return db_path, kf
+    from apm.chatgpt_ui.config import load_config
+    from apm.chatgpt_ui.database import init_db, open_db
+    from apm.chatgpt_ui.export_candidates import claim_filter_sql, update_candidate_flags
+    cfg = load_config(CONFIG)
+    if cfg.processing.keyword_groups and cfg.db_path.exists():
+        # the pending count reads is_candidate before the first batch imports
+        conn = open_db(cfg.db_path)
+        try:
+            init_db(conn)
+            update_candidate_flags(conn)
+        finally:
+            conn.close()
+    return cfg.db_path, claim_filter_sql(cfg.processing) or "1=1"
 
 
 def main():
@@ -13,8 +13,10 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
 from pathlib import Path
+from typing import Callable, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -74,24 +76,28 @@ def build_driver(
     config: ScopusConfig,
     download_dir: Path,
     remote_port: int = 9222,   # kept for API compatibility
+    profile_dir: str | Path | None = None,
 ) -> webdriver.Chrome:
     """
     Open Chrome with the dedicated Selenium profile.
 
     The profile lives at C:\\selenium\\chrome-profile and is completely
     separate from your main Chrome — both can run at the same time.
+    *profile_dir* selects another profile; two Chrome instances cannot share
+    one (see :mod:`scopus_automation.driver_pool`).
 
     First run: log in to Scopus and tick "Keep me signed in".
     Subsequent runs: the saved cookie means no re-login is needed.
     """
+    profile_dir = str(profile_dir or SELENIUM_PROFILE_DIR)
     download_dir.mkdir(parents=True, exist_ok=True)
-    Path(SELENIUM_PROFILE_DIR).mkdir(parents=True, exist_ok=True)
+    Path(profile_dir).mkdir(parents=True, exist_ok=True)
 
     options = Options()
     options.binary_location = CHROME_EXE
 
     # Dedicated profile — parent dir + profile name, split correctly
-    options.add_argument(f"--user-data-dir={SELENIUM_PROFILE_DIR}")
+    options.add_argument(f"--user-data-dir={profile_dir}")
     options.add_argument("--profile-directory=Default")
 
     prefs = {
@@ -125,7 +131,7 @@ def build_driver(
         print(
             f"\nERROR: Chrome could not start.\n"
             f"Chrome binary: {CHROME_EXE}\n"
-            f"Profile dir:   {SELENIUM_PROFILE_DIR}\n"
+            f"Profile dir:   {profile_dir}\n"
             f"Error: {exc}\n"
         )
         raise RuntimeError("Chrome failed to start.") from exc
@@ -135,11 +141,59 @@ def build_driver(
 
     log.info(
         "Chrome started. Profile=%s  Download=%s",
-        SELENIUM_PROFILE_DIR, download_dir.resolve(),
+        profile_dir, download_dir.resolve(),
     )
     return driver
 
 
+# Download detection: directory re-check interval without watchdog, the
+# safety-net re-check interval with it, and how long a .ris file that did not
+# arrive by a .crdownload rename must keep the same size to count as complete
+_POLL_SEC = 0.25
+_EVENT_RECHECK_SEC = 1.0
+_SETTLE_SEC = 0.2
+
+
+def _watch_directory(
+    download_dir: Path,
+    wake: threading.Event,
+    renamed: set[str],
+) -> Optional[Callable[[], None]]:
+    """Set *wake* on every file event in *download_dir* (needs ``watchdog``).
+
+    Targets of ``*.crdownload`` renames are added to *renamed*.  Returns a
+    function that stops watching, or None when file events are unavailable
+    (watchdog not installed, or the OS refused the watch).
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler  # type: ignore
+        from watchdog.observers import Observer  # type: ignore
+    except ImportError:
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            if event.is_directory:
+                return
+            if event.event_type == "moved" and str(event.src_path).endswith(".crdownload"):
+                renamed.add(str(Path(event.dest_path)))
+            wake.set()
+
+    observer = Observer()
+    try:
+        observer.schedule(_Handler(), str(download_dir), recursive=False)
+        observer.start()
+    except Exception as exc:
+        log.debug("File events unavailable for %s (%s); polling.", download_dir, exc)
+        return None
+
+    def _stop() -> None:
+        observer.stop()
+        observer.join(timeout=5)
+
+    return _stop
+
+
 def wait_for_download(
     download_dir: Path,
     timeout_sec: int = 120,
@@ -147,18 +201,58 @@ def wait_for_download(
 ) -> Path | None:
     """Wait for a new .ris file (no .crdownload present).
     `min_mtime`: only consider files modified at or after this Unix timestamp.
+
+    With ``watchdog`` installed the directory is watched for file events and
+    the wait ends as soon as Chrome renames its ``.crdownload`` file to the
+    final ``.ris``; without it the directory is re-checked every 0.25 s.  A
+    ``.ris`` file that appears any other way must keep the same size for
+    0.2 s.  The time taken is logged.
     """
-    deadline = time.monotonic() + timeout_sec
-    while time.monotonic() < deadline:
-        partial   = list(download_dir.glob("*.crdownload"))
-        ris_files = list(download_dir.glob("*.ris"))
-        if min_mtime > 0:
-            ris_files = [f for f in ris_files if f.stat().st_mtime >= min_mtime]
-        if ris_files and not partial:
-            latest = max(ris_files, key=lambda p: p.stat().st_mtime)
-            log.info("Download complete: %s", latest)
-            return latest
-        time.sleep(1)
+    download_dir.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    deadline = started + timeout_sec
+    wake = threading.Event()
+    renamed: set[str] = set()
+    stop_watch = _watch_directory(download_dir, wake, renamed)
+    interval = _EVENT_RECHECK_SEC if stop_watch else _POLL_SEC
+
+    sizes: dict[Path, int] = {}
+    had_partial = False
+    try:
+        while True:
+            wake.clear()
+            partial = any(download_dir.glob("*.crdownload"))
+            candidates = []
+            for f in download_dir.glob("*.ris"):
+                try:
+                    st = f.stat()
+                except OSError:  # renamed or removed since the glob
+                    continue
+                if min_mtime <= 0 or st.st_mtime >= min_mtime:
+                    candidates.append((st.st_mtime, f, st.st_size))
+
+            wait = interval
+            if candidates and not partial:
+                _, latest, size = max(candidates)
+                # a .crdownload seen last time and gone now means Chrome has
+                # just renamed the finished file
+                if had_partial or str(latest) in renamed or sizes.get(latest) == size:
+                    log.info(
+                        "Download complete: %s (%.2f s, %s)", latest,
+                        time.monotonic() - started, "file events" if stop_watch else "polling",
+                    )
+                    return latest
+                sizes[latest] = size
+                wait = _SETTLE_SEC
+            had_partial = partial
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wake.wait(min(wait, remaining))
+    finally:
+        if stop_watch:
+            stop_watch()
 
     log.warning("Timed out waiting for .ris in %s", download_dir)
     return None
@@ -19,9 +19,13 @@ from typing import Any
 
 import pandas as pd
 
+from .cited_by_cache import CitedByCache, incremental_query
 from .config import ScopusConfig
+from .dedupe import merge_ris_files
 from .login import ensure_logged_in
+from .ris import iter_ris_file
 from .search_export import search_and_export
+from .year_slices import export_year_sliced
 
 log = logging.getLogger(__name__)
 
@@ -94,12 +98,30 @@ def download_cited_by(
     config: ScopusConfig,
     output_dir: Path | None = None,
     force: bool = False,
+    download_dir: Path | None = None,
+    cache: CitedByCache | None = None,
+    max_age_days: float | None = None,
+    split_over_cap: bool = True,
+    slice_pool=None,
 ) -> dict[str, Any]:
     """
     Download RIS for all papers that cite the given Scopus paper.
 
     Uses REFEID() advanced search so the full Feature 1 pipeline
     (modal handling, select-all, export) is reused unchanged.
+    *download_dir* is the driver's download directory when it differs from
+    *output_dir* (e.g. a :class:`~scopus_automation.driver_pool.DriverPool`
+    worker).
+
+    An existing RIS is kept as is, unless *force* (full re-download) or a
+    *cache* is given and its entry is at least *max_age_days* old: then only
+    papers published since the last fetch are exported and merged into it
+    (see :mod:`scopus_automation.cited_by_cache`).
+
+    More results than ``config.export_cap`` are exported in publication-year
+    slices (see :mod:`scopus_automation.year_slices`), on *slice_pool*'s
+    drivers when given.  With ``split_over_cap=False`` such a paper is
+    returned unexported with ``over_cap=True`` instead.
     """
     if output_dir is None:
         output_dir = config.cited_by_output_dir()
@@ -108,15 +130,22 @@ def download_cited_by(
     paper_id = _extract_paper_id(paper_link)
     dest_ris  = output_dir / f"{paper_id}_cited_by.ris"
 
-    if dest_ris.exists() and not force:
+    entry = None
+    if cache is not None and dest_ris.exists() and not force:
+        entry = cache.entry_for(paper_id, dest_ris)
+    incremental = (
+        entry is not None and max_age_days is not None and entry.age_days() >= max_age_days
+    )
+
+    if dest_ris.exists() and not force and not incremental:
         log.info("Already downloaded: %s — skipping.", dest_ris)
         return {
             "paper_id": paper_id,
             "cited_by_downloaded": True,
-            "cited_by_downloaded_at": datetime.fromtimestamp(
+            "cited_by_downloaded_at": entry.fetched_at if entry else datetime.fromtimestamp(
                 dest_ris.stat().st_mtime).isoformat(),
             "cited_by_ris_file": str(dest_ris),
-            "cited_by_result_count": -1,
+            "cited_by_result_count": entry.result_count if entry else -1,
             "cited_by_error": "",
             "skipped": True,
         }
@@ -124,12 +153,47 @@ def download_cited_by(
     # REFEID query finds all papers that reference this EID
     eid   = f"2-s2.0-{paper_id}"
     query = f"REFEID({eid})"
+    if incremental:
+        query = incremental_query(query, entry)
+        log.info("Paper %s last fetched %s (%.0f days ago) — incremental refresh.",
+                 paper_id, entry.fetched_at, entry.age_days())
     log.info("Cited-by query for paper %s: %s", paper_id, query)
     print(f"\n  [cited-by] Paper {paper_id}")
     print(f"  Query: {query}")
 
     try:
-        meta = search_and_export(driver, query, config, output_dir=output_dir)
+        meta = search_and_export(
+            driver, query, config, output_dir=output_dir, download_dir=download_dir,
+            max_results=config.export_cap,
+        )
+
+        if meta.get("over_cap"):
+            if not split_over_cap:
+                return {
+                    "paper_id": paper_id,
+                    "cited_by_downloaded": False,
+                    "cited_by_downloaded_at": "",
+                    "cited_by_ris_file": "",
+                    "cited_by_result_count": meta["result_count"],
+                    "cited_by_error": meta["error"],
+                    "skipped": False,
+                    "over_cap": True,
+                }
+            sliced = output_dir / f"{paper_id}_cited_by.sliced.ris"
+            total, n_slices = export_year_sliced(
+                query, config, sliced, driver=driver, download_dir=download_dir, pool=slice_pool,
+            )
+            print(f"  {meta['result_count']} results exported in {n_slices} year slices "
+                  f"-> {total} records")
+            meta["ris_file"] = str(sliced) if total else None
+            meta["error"] = "" if total else "No records exported from year slices"
+
+        if incremental and meta.get("error") == "No results":
+            # nothing published since the last fetch: the cached RIS is current
+            total = entry.result_count if entry.result_count >= 0 else _count_entries(dest_ris)
+            cache.record(paper_id, total, dest_ris, mode="incremental")
+            log.info("Paper %s: no new citing papers (%d cached).", paper_id, total)
+            return _downloaded(paper_id, dest_ris, total, new=0)
 
         if meta.get("error") or not meta.get("ris_file"):
             err = meta.get("error", "No RIS file produced")
@@ -144,23 +208,25 @@ def download_cited_by(
                 "skipped": False,
             }
 
-        # Rename from the query-slug name to our expected name
         downloaded = Path(meta["ris_file"])
-        if downloaded.resolve() != dest_ris.resolve():
-            if dest_ris.exists():
-                dest_ris.unlink()
-            downloaded.rename(dest_ris)
-            log.info("Saved -> %s", dest_ris)
+        if incremental:
+            # keep the cached records first, then append the new ones
+            delta = output_dir / f"{paper_id}_cited_by.delta.ris"
+            _move(downloaded, delta)
+            total, dupes = merge_ris_files([dest_ris, delta], dest_ris)
+            delta.unlink()
+            new = meta.get("result_count", 0) - dupes
+            log.info("Paper %s: merged %d new citing paper(s) -> %d total.",
+                     paper_id, new, total)
+            cache.record(paper_id, total, dest_ris, mode="incremental")
+            return _downloaded(paper_id, dest_ris, total, new=new)
 
-        return {
-            "paper_id": paper_id,
-            "cited_by_downloaded": True,
-            "cited_by_downloaded_at": datetime.now().isoformat(),
-            "cited_by_ris_file": str(dest_ris),
-            "cited_by_result_count": meta.get("result_count", 0),
-            "cited_by_error": "",
-            "skipped": False,
-        }
+        # Rename from the query-slug name to our expected name
+        _move(downloaded, dest_ris)
+        total = meta.get("result_count", 0)
+        if cache is not None:
+            cache.record(paper_id, total, dest_ris, mode="full")
+        return _downloaded(paper_id, dest_ris, total)
 
     except Exception as exc:
         log.error("Error processing paper %s: %s", paper_id, exc)
@@ -175,6 +241,33 @@ def download_cited_by(
         }
 
 
+def _downloaded(paper_id: str, ris_file: Path, count: int, new: int | None = None) -> dict[str, Any]:
+    result = {
+        "paper_id": paper_id,
+        "cited_by_downloaded": True,
+        "cited_by_downloaded_at": datetime.now().isoformat(),
+        "cited_by_ris_file": str(ris_file),
+        "cited_by_result_count": count,
+        "cited_by_error": "",
+        "skipped": False,
+    }
+    if new is not None:
+        result["cited_by_new"] = new  # incremental refresh only
+    return result
+
+
+def _move(src: Path, dest: Path) -> None:
+    if src.resolve() != dest.resolve():
+        if dest.exists():
+            dest.unlink()
+        src.rename(dest)
+        log.info("Saved -> %s", dest)
+
+
+def _count_entries(ris_file: Path) -> int:
+    return sum(1 for _ in iter_ris_file(ris_file))
+
+
 # ---------------------------------------------------------------------------
 # Batch processing
 # ---------------------------------------------------------------------------
@@ -186,11 +279,16 @@ def process_csv(
     output_dir: Path | None = None,
     force: bool = False,
     link_column: str = "Link",
+    max_age_days: float | None = None,
 ) -> Path:
     """
     Read parent paper links from a CSV/Excel file, download cited-by RIS for
     each paper, then combine all into  {input_stem}_cite_paper.ris.
 
+    Downloads are recorded in the cited-by cache of *output_dir*; with
+    *max_age_days*, papers fetched longer ago than that are refreshed
+    incrementally instead of skipped.
+
     Returns the path to the combined RIS file.
     A per-paper status CSV is also written next to the input file.
     """
@@ -213,6 +311,8 @@ def process_csv(
     status_path      = input_file.parent / f"{input_file.stem}_cite_status.csv"
     combined_ris_path = input_file.parent / f"{input_file.stem}_cite_paper.ris"
 
+    cache = CitedByCache.in_dir(output_dir)
+
     ensure_logged_in(driver, config)
 
     collected_ris: list[Path] = []
@@ -229,15 +329,16 @@ def process_csv(
             str(row.get("cited_by_downloaded", "")).lower() == "true"
             and str(row.get("cited_by_ris_file", "")).strip()
         )
-        if already_done and not force:
+        existing = Path(str(row.get("cited_by_ris_file", "")))
+        if already_done and not force and not cache.is_stale(paper_id, existing, max_age_days):
             log.info("Row %d (paper %s) already processed — skipping.", idx, paper_id)
-            existing = Path(str(row.get("cited_by_ris_file", "")))
             if existing.exists():
                 collected_ris.append(existing)
             continue
 
         log.info("Processing row %d: paper %s", idx, paper_id)
-        result = download_cited_by(driver, link, config, output_dir, force=force)
+        result = download_cited_by(driver, link, config, output_dir, force=force,
+                                   cache=cache, max_age_days=max_age_days)
 
         df.at[idx, "cited_by_downloaded"]    = result.get("cited_by_downloaded", "")
         df.at[idx, "cited_by_downloaded_at"] = result.get("cited_by_downloaded_at", "")
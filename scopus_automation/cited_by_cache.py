@@ -0,0 +1,129 @@
+"""Cache of cited-by downloads, so refreshes only fetch what is new.
+
+For each parent paper (keyed by its numeric Scopus ID) the cache remembers
+when its cited-by list was last fetched, how many records the RIS holds and
+where the RIS lives.  A cached parent younger than the refresh age is not
+queried at all; an older one is refreshed **incrementally**: the REFEID query
+is restricted to citing papers published since the year of the last fetch,
+
+    REFEID(2-s2.0-85012345678) AND PUBYEAR > 2024
+
+and the result is merged into the cached RIS through
+:func:`~scopus_automation.dedupe.merge_ris_files`.  A citing paper that Scopus
+indexes late with an older publication year is not picked up by an
+incremental refresh; a forced (full) download resets the entry.
+
+The cache is a small JSON file (``cited_by_cache.json`` next to the RIS
+files), rewritten atomically after every update and safe to share between
+:class:`~scopus_automation.driver_pool.DriverPool` workers.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+CACHE_FILENAME = "cited_by_cache.json"
+
+
+@dataclass
+class CitedByEntry:
+    """Last fetch of one parent's cited-by list."""
+
+    fetched_at: str          # ISO timestamp of the last (full or incremental) fetch
+    result_count: int        # records in the cached RIS; -1 if unknown
+    ris_file: str
+    mode: str = "full"       # "full" | "incremental" | "seeded" (from an existing file)
+
+    def age_days(self, now: Optional[datetime] = None) -> float:
+        now = now or datetime.now()
+        return (now - datetime.fromisoformat(self.fetched_at)).total_seconds() / 86400
+
+    def since_year(self) -> int:
+        """Publication year an incremental refresh starts from (inclusive)."""
+        return datetime.fromisoformat(self.fetched_at).year
+
+
+def incremental_query(query: str, entry: CitedByEntry) -> str:
+    """*query* restricted to papers published in or after the last fetch year."""
+    return f"{query} AND PUBYEAR > {entry.since_year() - 1}"
+
+
+class CitedByCache:
+    """JSON-backed map of Scopus paper ID -> :class:`CitedByEntry`."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, CitedByEntry] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = {pid: CitedByEntry(**e) for pid, e in data.items()}
+            except (ValueError, TypeError) as exc:
+                log.warning("Ignoring unreadable cited-by cache %s: %s", self.path, exc)
+        log.debug("Cited-by cache %s: %d entries", self.path, len(self._entries))
+
+    @classmethod
+    def in_dir(cls, directory: str | Path) -> "CitedByCache":
+        return cls(Path(directory) / CACHE_FILENAME)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, paper_id: str) -> Optional[CitedByEntry]:
+        return self._entries.get(str(paper_id))
+
+    def entry_for(self, paper_id: str, ris_file: Path) -> Optional[CitedByEntry]:
+        """Cached entry, or one seeded from *ris_file*'s mtime if it predates the cache."""
+        entry = self.get(paper_id)
+        if entry is None and ris_file.exists():
+            entry = CitedByEntry(
+                fetched_at=datetime.fromtimestamp(ris_file.stat().st_mtime).isoformat(),
+                result_count=-1,
+                ris_file=str(ris_file),
+                mode="seeded",
+            )
+        return entry
+
+    def is_stale(self, paper_id: str, ris_file: Path, max_age_days: Optional[float]) -> bool:
+        """True if *ris_file* exists but was fetched more than *max_age_days* ago."""
+        if max_age_days is None:
+            return False
+        entry = self.entry_for(paper_id, ris_file)
+        return entry is not None and entry.age_days() >= max_age_days
+
+    def record(
+        self,
+        paper_id: str,
+        result_count: int,
+        ris_file: str | Path,
+        mode: str = "full",
+        fetched_at: Optional[str] = None,
+    ) -> CitedByEntry:
+        """Store a fetch and write the cache file."""
+        entry = CitedByEntry(
+            fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
+            result_count=int(result_count),
+            ris_file=str(ris_file),
+            mode=mode,
+        )
+        with self._lock:
+            self._entries[str(paper_id)] = entry
+            self._save_locked()
+        return entry
+
+    def _save_locked(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        data = {pid: asdict(e) for pid, e in sorted(self._entries.items())}
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
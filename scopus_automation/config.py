@@ -24,6 +24,7 @@ class ScopusConfig:
     page_load_timeout_sec: int = 60
     element_wait_sec: int = 30
     headless: bool = False
+    export_cap: int = 20_000  # most records Scopus exports at once; larger cited-by sets are year-sliced
 
     # ------------------------------------------------------------------
     # Derived paths
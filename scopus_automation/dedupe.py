@@ -3,124 +3,63 @@
 from __future__ import annotations
 
 import csv
-import re
-import string
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Iterable, Iterator
 
-from .ris import parse_ris_file, write_ris_file
+from .fingerprint import (
+    normalise_doi,
+    normalise_title,
+    ris_dedup_key,
+    ris_doi,
+    ris_eid,
+    ris_title,
+    ris_year,
+)
+from .ris import _is_gzip, iter_ris_file, parse_ris_file, write_ris_file
+
+log = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
-# Normalisation helpers
+# Normalisation helpers (shared with the pipeline; see .fingerprint)
 # ---------------------------------------------------------------------------
 
-def _normalise_doi(doi: str) -> str:
-    doi = str(doi).strip().lower()
-    doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", doi)
-    return doi
-
-
-def _normalise_title(title: str) -> str:
-    title = str(title).lower()
-    title = title.translate(str.maketrans("", "", string.punctuation))
-    return re.sub(r"\s+", " ", title).strip()
-
-
-def _get_doi(entry: dict) -> str:
-    for tag in ("DO", "doi"):
-        val = entry.get(tag, "")
-        if isinstance(val, list):
-            val = val[0] if val else ""
-        if val:
-            return _normalise_doi(str(val))
-    return ""
-
-
-def _get_eid(entry: dict) -> str:
-    for tag in ("C7", "M3", "AN", "ID", "SN"):  # Scopus EID often in C7 or AN
-        val = entry.get(tag, "")
-        if isinstance(val, list):
-            val = val[0] if val else ""
-        if val and val.startswith("2-s2.0"):
-            return val.strip()
-    # Also check N1 note field for Scopus EID pattern
-    n1 = str(entry.get("N1", ""))
-    m = re.search(r"2-s2\.0-\d+", n1)
-    if m:
-        return m.group(0)
-    return ""
-
-
-def _get_title(entry: dict) -> str:
-    for tag in ("TI", "T1", "title"):
-        val = entry.get(tag, "")
-        if isinstance(val, list):
-            val = " ".join(str(v) for v in val)
-        if val:
-            return _normalise_title(str(val))
-    return ""
-
-
-def _get_year(entry: dict) -> str:
-    for tag in ("PY", "Y1", "year"):
-        val = entry.get(tag, "")
-        if isinstance(val, list):
-            val = val[0] if val else ""
-        val = str(val).strip()
-        m = re.search(r"\d{4}", val)
-        if m:
-            return m.group(0)
-    return ""
-
-
-def _dedup_key(entry: dict) -> tuple[str, str]:
-    """Return (key_type, key_value) using priority order."""
-    doi = _get_doi(entry)
-    if doi:
-        return "doi", doi
-
-    eid = _get_eid(entry)
-    if eid:
-        return "eid", eid
-
-    title = _get_title(entry)
-    year = _get_year(entry)
-    if title:
-        return "title_year", f"{title}|{year}"
-
-    return "unknown", str(entry)
+_normalise_doi = normalise_doi
+_normalise_title = normalise_title
+_get_doi = ris_doi
+_get_eid = ris_eid
+_get_title = ris_title
+_get_year = ris_year
+_dedup_key = ris_dedup_key
 
 
 # ---------------------------------------------------------------------------
 # Main deduplication function
 # ---------------------------------------------------------------------------
 
-def deduplicate(
-    entries: list[dict],
-    source_files: list[str] | None = None,
-) -> tuple[list[dict], list[dict[str, str]]]:
+def iter_deduplicate(
+    entries: Iterable[tuple[dict, str]],
+    report: list[dict[str, str]],
+) -> Iterator[dict]:
     """
-    Remove duplicate RIS entries using priority-based key matching.
+    Stream-deduplicate ``(entry, source_file)`` pairs using priority-based keys.
 
-    Returns:
-        unique_entries: deduplicated list
-        duplicates_report: list of dicts describing each duplicate found
+    Yields each entry whose key has not been seen before, as soon as it
+    arrives, and appends a row to *report* for every duplicate.  Only the key,
+    kept title and source file of each unique entry are retained.
     """
-    seen: dict[str, tuple[int, str]] = {}  # key_value → (entry_index, source_file)
-    unique: list[dict] = []
-    report: list[dict[str, str]] = []
+    seen: dict[str, tuple[str, str]] = {}  # key_value → (kept_title, source_file)
 
-    if source_files is None:
-        source_files = ["unknown"] * len(entries)
-
-    for idx, entry in enumerate(entries):
+    for entry, src in entries:
         key_type, key_value = _dedup_key(entry)
-        src = source_files[idx] if idx < len(source_files) else "unknown"
 
         if key_value in seen:
-            kept_idx, kept_src = seen[key_value]
-            kept_title = _get_title(unique[kept_idx]) or "(unknown)"
+            kept_title, kept_src = seen[key_value]
             dup_title = _get_title(entry) or "(unknown)"
             report.append(
                 {
@@ -133,12 +72,114 @@ def deduplicate(
                 }
             )
         else:
-            seen[key_value] = (len(unique), src)
-            unique.append(entry)
+            seen[key_value] = (_get_title(entry) or "(unknown)", src)
+            yield entry
+
 
+def deduplicate(
+    entries: list[dict],
+    source_files: list[str] | None = None,
+) -> tuple[list[dict], list[dict[str, str]]]:
+    """
+    Remove duplicate RIS entries using priority-based key matching.
+
+    Returns:
+        unique_entries: deduplicated list
+        duplicates_report: list of dicts describing each duplicate found
+    """
+    if source_files is None:
+        source_files = []
+    sources = (
+        source_files[idx] if idx < len(source_files) else "unknown"
+        for idx in range(len(entries))
+    )
+    report: list[dict[str, str]] = []
+    unique = list(iter_deduplicate(zip(entries, sources), report))
     return unique, report
 
 
+# ---------------------------------------------------------------------------
+# File ingestion
+# ---------------------------------------------------------------------------
+
+# Parsed files a worker pool may run ahead of the dedup step, per worker
+_PREFETCH_PER_WORKER = 4
+
+# Number of slowest files named in the summary log line
+_SLOWEST_FILES_LOGGED = 5
+
+
+def _timed_parse(path: Path) -> tuple[list[dict], float]:
+    """Process-pool worker: parse one RIS file, returning (entries, seconds)."""
+    t0 = time.perf_counter()
+    entries = parse_ris_file(path)
+    return entries, time.perf_counter() - t0
+
+
+def _iter_directory_entries(
+    ris_files: list[Path],
+    workers: int = 1,
+) -> Iterator[tuple[dict, str]]:
+    """Yield ``(entry, source_file)`` for every file, in *ris_files* order.
+
+    With ``workers <= 1`` each file is streamed.  With ``workers > 1``
+    files are parsed whole on a process pool while earlier
+    ones are being deduplicated; at most ``workers * 4`` parsed files wait
+    in memory, and results are taken in submission order so the output does
+    not depend on which worker finishes first.  The parse time of each file
+    is logged at DEBUG level, with a summary of the slowest at INFO.
+    """
+    timings: list[tuple[float, str, int]] = []
+
+    def _done(src: str, n: int, seconds: float) -> None:
+        timings.append((seconds, src, n))
+        log.debug("Parsed %s: %d entries in %.3f s", src, n, seconds)
+
+    t0 = time.perf_counter()
+    processes = max(1, min(workers, len(ris_files)))
+    if processes == 1:
+        # stream each file; only the time spent inside the parser is counted
+        clock = time.perf_counter
+        for ris_path in ris_files:
+            src, n, seconds = str(ris_path), 0, 0.0
+            entries = iter_ris_file(ris_path)
+            while True:
+                start = clock()
+                entry = next(entries, None)
+                seconds += clock() - start
+                if entry is None:
+                    break
+                n += 1
+                yield entry, src
+            _done(src, n, seconds)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            pending: deque = deque()
+            files = iter(ris_files)
+            for ris_path in files:
+                pending.append((ris_path, pool.submit(_timed_parse, ris_path)))
+                if len(pending) >= processes * _PREFETCH_PER_WORKER:
+                    break
+            while pending:
+                ris_path, future = pending.popleft()
+                entries, seconds = future.result()
+                next_path = next(files, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(_timed_parse, next_path)))
+                src = str(ris_path)
+                _done(src, len(entries), seconds)
+                for entry in entries:
+                    yield entry, src
+
+    slowest = sorted(timings, reverse=True)[:_SLOWEST_FILES_LOGGED]
+    log.info(
+        "Parsed %d RIS files (%d entries): %.2f s parsing, %.2f s wall on %d "
+        "process(es); slowest: %s",
+        len(timings), sum(n for _, _, n in timings), sum(sec for sec, _, _ in timings),
+        time.perf_counter() - t0, processes, ", ".join(f"{Path(src).name} {sec:.2f} s" for sec, src, _ in slowest),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Directory-level combine
 # ---------------------------------------------------------------------------
@@ -147,10 +188,18 @@ def combine_ris_directory(
     input_dir: str | Path,
     output_file: str | Path,
     report_file: str | Path | None = None,
+    workers: int = 1,
 ) -> tuple[int, int]:
     """
     Recursively find all .ris files under input_dir, parse them,
     deduplicate, write combined output, and optionally write a report.
+    The output is written as entries stream in (gzip for a ``.gz`` suffix).
+
+    With ``workers > 1`` files are parsed on that many processes.  Files are
+    always deduplicated in sorted path order, so the output and report are
+    the same whatever the worker count.  Pool parsing holds whole parsed
+    files in memory rather than streaming them, and for typical Scopus
+    exports it is not faster, so the default is a single process.
 
     Returns (unique_count, duplicate_count).
     """
@@ -161,16 +210,22 @@ def combine_ris_directory(
     if not ris_files:
         raise FileNotFoundError(f"No .ris files found under {input_dir}")
 
-    all_entries: list[dict] = []
-    all_sources: list[str] = []
-
-    for ris_path in ris_files:
-        entries = parse_ris_file(ris_path)
-        all_entries.extend(entries)
-        all_sources.extend([str(ris_path)] * len(entries))
-
-    unique, report = deduplicate(all_entries, all_sources)
-    write_ris_file(unique, output_file)
+    # Files are parsed lazily, deduplicated as entries arrive and each unique
+    # entry is written straight out; nothing is collected.  The output goes
+    # to a temporary sibling first, since it may live inside input_dir (and
+    # an earlier combined file may be one of the inputs).
+    report: list[dict[str, str]] = []
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        unique_count = write_ris_file(
+            iter_deduplicate(_iter_directory_entries(ris_files, workers), report),
+            tmp_file,
+            compress=_is_gzip(output_file),
+        )
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_file, output_file)
 
     if report_file is None:
         report_file = output_file.parent / "duplicates_report.csv"
@@ -190,4 +245,31 @@ def combine_ris_directory(
         writer.writeheader()
         writer.writerows(report)
 
-    return len(unique), len(report)
+    return unique_count, len(report)
+
+
+def merge_ris_files(
+    ris_files: list[Path],
+    output_file: str | Path,
+) -> tuple[int, int]:
+    """
+    Deduplicate the entries of *ris_files*, taken in the given order, into
+    *output_file*; the first copy of a record is kept.  *output_file* may be
+    one of the inputs — it is replaced only once the merge is complete.
+
+    Returns (unique_count, duplicate_count).
+    """
+    output_file = Path(output_file)
+    report: list[dict[str, str]] = []
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        unique_count = write_ris_file(
+            iter_deduplicate(_iter_directory_entries([Path(p) for p in ris_files]), report),
+            tmp_file,
+            compress=_is_gzip(output_file),
+        )
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_file, output_file)
+    return unique_count, len(report)
@@ -0,0 +1,244 @@
+"""Pool of authenticated Chrome drivers for running Scopus queries concurrently.
+
+Every Scopus export is a full navigate / wait / export / download cycle, so a
+long list of cited-by queries is dominated by waiting on the browser.  A
+:class:`DriverPool` runs N Chrome instances side by side, each with
+
+* its own Selenium profile — Chrome refuses to open one profile twice.  Worker
+  0 uses the normal profile; worker *i* uses ``<profile>-worker<i>``, cloned
+  from the normal profile on first use so it carries the saved Scopus session;
+* its own download directory — worker 0 downloads straight into the pool's
+  directory, worker *i* into the sibling ``<dir>.worker<i>``, so concurrent
+  exports can never be mistaken for each other.  Callers pass
+  ``worker.download_dir`` as *download_dir* to
+  :func:`~scopus_automation.cited_by.download_cited_by` and keep the shared
+  directory as *output_dir*, so the finished files land where a serial run
+  puts them.
+
+:meth:`DriverPool.map` hands the items to whichever driver is free and yields
+the results **in input order**, so a caller that consumes them in a plain loop
+sees exactly what the serial loop saw.  With ``size=1`` everything runs in the
+calling thread on the single driver.
+
+    with DriverPool(cfg, download_dir, size=3) as pool:
+        for parent, result in zip(parents, pool.map(query_one, parents)):
+            ...
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from .config import ScopusConfig
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Profile entries not copied when cloning: lock files of a running Chrome and
+# caches that are large and rebuilt on demand
+_PROFILE_CLONE_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "lockfile", "LOCK", "*Cache*", "Crashpad", "ShaderCache",
+)
+
+
+@dataclass
+class PoolWorker:
+    """One Chrome instance of a :class:`DriverPool` and its running totals."""
+
+    index: int
+    driver: Any
+    download_dir: Path
+    owned: bool = True        # built (and so quit) by the pool
+    tasks: int = 0
+    errors: int = 0
+    busy_sec: float = 0.0
+
+    def status_row(self) -> dict[str, Any]:
+        return {
+            "worker": self.index,
+            "download_dir": str(self.download_dir),
+            "tasks": self.tasks,
+            "errors": self.errors,
+            "busy_sec": round(self.busy_sec, 1),
+        }
+
+
+def worker_profile_dir(index: int, base: str | Path | None = None) -> Path:
+    """Selenium profile for pool worker *index*, cloned from *base* if missing."""
+    from .browser import SELENIUM_PROFILE_DIR
+
+    base = Path(base or SELENIUM_PROFILE_DIR)
+    if index == 0:
+        return base
+    profile = base.with_name(f"{base.name}-worker{index}")
+    if not profile.exists() and base.exists():
+        log.info("Cloning Selenium profile %s -> %s", base, profile)
+        shutil.copytree(base, profile, ignore=_PROFILE_CLONE_IGNORE)
+    return profile
+
+
+def worker_download_dir(download_dir: Path, index: int) -> Path:
+    """Download directory of pool worker *index* (worker 0 uses *download_dir*)."""
+    if index == 0:
+        return download_dir
+    return download_dir.with_name(f"{download_dir.name}.worker{index}")
+
+
+def _default_factory(config: ScopusConfig, download_dir: Path, index: int):
+    from .browser import build_driver, set_download_dir
+    from .login import ensure_logged_in
+
+    driver = build_driver(config, download_dir=download_dir,
+                          profile_dir=worker_profile_dir(index))
+    set_download_dir(driver, download_dir)
+    # log in now, one window at a time, rather than from inside a worker thread
+    ensure_logged_in(driver, config)
+    return driver
+
+
+class DriverPool:
+    """N Chrome drivers sharing a queue of Scopus tasks.
+
+    Parameters
+    ----------
+    config:
+        Scopus settings used to build every driver.
+    download_dir:
+        Directory the finished downloads belong in; worker 0 downloads here.
+    size:
+        Number of concurrent Chrome instances (the concurrency limit).
+    primary:
+        An already running driver to use as worker 0 instead of building
+        one.  It is pointed at *download_dir* but not quit by :meth:`close`.
+    driver_factory:
+        ``factory(config, download_dir, index) -> driver``; defaults to
+        :func:`~scopus_automation.browser.build_driver` with a per-worker
+        profile, followed by a login check.
+    """
+
+    def __init__(
+        self,
+        config: ScopusConfig,
+        download_dir: Path,
+        size: int = 1,
+        primary: Any = None,
+        driver_factory: Optional[Callable[[ScopusConfig, Path, int], Any]] = None,
+    ) -> None:
+        self.config = config
+        self.download_dir = Path(download_dir)
+        self.size = max(1, int(size))
+        self._primary = primary
+        self._factory = driver_factory or _default_factory
+        self.workers: list[PoolWorker] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "DriverPool":
+        """Build the drivers, one after another (logins may prompt)."""
+        for i in range(len(self.workers), self.size):
+            ddir = worker_download_dir(self.download_dir, i)
+            ddir.mkdir(parents=True, exist_ok=True)
+            if i == 0 and self._primary is not None:
+                worker = PoolWorker(0, self._primary, ddir, owned=False)
+                self._point_at(worker)
+            else:
+                worker = PoolWorker(i, self._factory(self.config, ddir, i), ddir)
+            self.workers.append(worker)
+        if self.size > 1:
+            log.info("Driver pool ready: %d Chrome instances.", self.size)
+        return self
+
+    def close(self) -> None:
+        """Quit the drivers the pool built and log per-worker totals."""
+        for worker in self.workers:
+            if self.size > 1:
+                log.info(
+                    "Driver pool worker %d: %d task(s), %d error(s), %.1f s busy.",
+                    worker.index, worker.tasks, worker.errors, worker.busy_sec,
+                )
+            if worker.owned:
+                try:
+                    worker.driver.quit()
+                except Exception as exc:
+                    log.warning("Driver pool worker %d did not quit cleanly: %s",
+                                worker.index, exc)
+        self.workers = []
+
+    def __enter__(self) -> "DriverPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def retarget(self, download_dir: Path) -> None:
+        """Move every worker to a new download directory (e.g. per generation)."""
+        self.download_dir = Path(download_dir)
+        for worker in self.workers:
+            worker.download_dir = worker_download_dir(self.download_dir, worker.index)
+            worker.download_dir.mkdir(parents=True, exist_ok=True)
+            self._point_at(worker)
+
+    def _point_at(self, worker: PoolWorker) -> None:
+        from .browser import set_download_dir
+        set_download_dir(worker.driver, worker.download_dir)
+
+    # ------------------------------------------------------------------
+    # Work distribution
+    # ------------------------------------------------------------------
+
+    def status_rows(self) -> list[dict[str, Any]]:
+        """One row per worker: tasks run, errors raised, seconds busy."""
+        return [w.status_row() for w in self.workers]
+
+    def map(self, fn: Callable[[PoolWorker, T], R], items: Iterable[T]) -> Iterator[R]:
+        """Run ``fn(worker, item)`` for every item; yield results in input order.
+
+        Each call gets a worker no other call is using.  An exception raised
+        by *fn* is re-raised when its result is reached, after earlier
+        results have been yielded.
+        """
+        if not self.workers:
+            self.start()
+        if self.size == 1:
+            worker = self.workers[0]
+            for item in items:
+                yield self._run(worker, fn, item)
+            return
+
+        idle: queue.Queue[PoolWorker] = queue.Queue()
+        for worker in self.workers:
+            idle.put(worker)
+
+        def _task(item: T) -> R:
+            worker = idle.get()
+            try:
+                return self._run(worker, fn, item)
+            finally:
+                idle.put(worker)
+
+        with ThreadPoolExecutor(max_workers=self.size,
+                                thread_name_prefix="scopus-driver") as executor:
+            yield from executor.map(_task, items)
+
+    @staticmethod
+    def _run(worker: PoolWorker, fn: Callable[[PoolWorker, T], R], item: T) -> R:
+        t0 = time.perf_counter()
+        try:
+            return fn(worker, item)
+        except Exception:
+            worker.errors += 1
+            raise
+        finally:
+            worker.tasks += 1
+            worker.busy_sec += time.perf_counter() - t0
@@ -0,0 +1,276 @@
+"""Shared normalisation and dedup fingerprints for references and RIS entries.
+
+Every dedup entry point — the pipeline master list and dedup engine
+(``pipeline.master_list`` / ``pipeline.dedup_engine``), RIS directory
+combining (:mod:`scopus_automation.dedupe`), RIS set comparison
+(:func:`scopus_automation.ris.compare_ris_sets`) and the cited-by master list
+filter in ``apm.scopus.fetch_cited_by_latest`` — normalises DOIs, titles and
+years through this module, so they all agree on what counts as the same paper.
+
+Regexes and the punctuation translation table are compiled once at import.
+Title and DOI normalisation are memoised: the same title is normalised for
+both the title+year and the title+author rule, and the same citing paper
+recurs across many cited-by exports.  The ``*_many`` functions are batch
+versions for lists of values or entries.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from functools import lru_cache
+from typing import Any, Iterable
+
+
+# ---------------------------------------------------------------------------
+# Compiled patterns
+# ---------------------------------------------------------------------------
+
+PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+DOI_PREFIX_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+WHITESPACE_RE = re.compile(r"\s+")
+YEAR_RE = re.compile(r"\d{4}")
+EID_RE = re.compile(r"2-s2\.0-\d+")
+ISBN_STRIP_RE = re.compile(r"[\s\-]")
+
+# Memo size for title/DOI normalisation (entries, not bytes)
+_CACHE_SIZE = 1 << 16
+
+# Dedup rule names, in priority order; rule_fingerprints() returns one
+# fingerprint per rule in this order
+RULE_NAMES = (
+    "doi",
+    "eid",
+    "scopus_id",
+    "pmid",
+    "isbn",
+    "title_year",
+    "title_author",
+)
+
+
+# ---------------------------------------------------------------------------
+# Scalar normalisation
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalise_doi(doi: str) -> str:
+    return DOI_PREFIX_RE.sub("", doi.strip().lower())
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalise_title(title: str) -> str:
+    return WHITESPACE_RE.sub(" ", title.lower().translate(PUNCT_TABLE)).strip()
+
+
+def normalise_doi(doi: Any) -> str:
+    """Lower-case DOI without surrounding space or a ``doi.org`` URL prefix."""
+    return _normalise_doi(str(doi))
+
+
+def normalise_title(title: Any) -> str:
+    """Lower-case title without punctuation, whitespace runs collapsed."""
+    return _normalise_title(str(title))
+
+
+def extract_year(value: Any) -> str:
+    """The first four-digit run in *value*, or ""."""
+    m = YEAR_RE.search(str(value))
+    return m.group(0) if m else ""
+
+
+def extract_eid(value: Any) -> str:
+    """The first ``2-s2.0-<digits>`` Scopus EID in *value*, or ""."""
+    m = EID_RE.search(str(value))
+    return m.group(0) if m else ""
+
+
+def author_key(author: Any) -> str:
+    """Normalised last name of an ``"Last, First"`` author string."""
+    return normalise_title(str(author).split(",")[0].strip())
+
+
+# ---------------------------------------------------------------------------
+# Reference fingerprints (one per dedup rule)
+# ---------------------------------------------------------------------------
+
+def fp_doi(doi: Any) -> str:
+    d = normalise_doi(doi)
+    return f"doi:{d}" if d else ""
+
+
+def fp_eid(eid: Any) -> str:
+    e = str(eid).strip()
+    return f"eid:{e}" if e and "2-s2.0" in e else ""
+
+
+def fp_scopus_id(sid: Any) -> str:
+    s = str(sid).strip()
+    return f"scopus_id:{s}" if s and s.isdigit() else ""
+
+
+def fp_pmid(pmid: Any) -> str:
+    p = str(pmid).strip()
+    return f"pmid:{p}" if p and p.isdigit() else ""
+
+
+def fp_isbn(isbn: Any) -> str:
+    i = ISBN_STRIP_RE.sub("", str(isbn)).strip()
+    return f"isbn:{i}" if i else ""
+
+
+def fp_title_year(title: Any, year: Any) -> str:
+    t = normalise_title(title)
+    return f"title_year:{t}|{extract_year(year)}" if t else ""
+
+
+def fp_title_author(title: Any, author: Any) -> str:
+    t = normalise_title(title)
+    if not t:
+        return ""
+    a = author_key(author)
+    return f"title_author:{t}|{a}" if a else ""
+
+
+def rule_fingerprints(
+    doi: Any = "",
+    eid: Any = "",
+    scopus_id: Any = "",
+    pmid: Any = "",
+    isbn: Any = "",
+    title: Any = "",
+    year: Any = "",
+    first_author: Any = "",
+) -> tuple[str, ...]:
+    """One fingerprint per rule in :data:`RULE_NAMES`; "" where a rule does not apply."""
+    t = normalise_title(title)
+    a = author_key(first_author) if t else ""
+    return (
+        fp_doi(doi),
+        fp_eid(eid),
+        fp_scopus_id(scopus_id),
+        fp_pmid(pmid),
+        fp_isbn(isbn),
+        f"title_year:{t}|{extract_year(year)}" if t else "",
+        f"title_author:{t}|{a}" if a else "",
+    )
+
+
+def rule_fingerprints_many(keys: Iterable[tuple[Any, ...]]) -> list[tuple[str, ...]]:
+    """:func:`rule_fingerprints` for each positional argument tuple in *keys*."""
+    fn = rule_fingerprints
+    return [fn(*key) for key in keys]
+
+
+# ---------------------------------------------------------------------------
+# RIS entry fields
+# ---------------------------------------------------------------------------
+
+def _first_value(entry: dict, tags: tuple[str, ...]) -> str:
+    for tag in tags:
+        val = entry.get(tag, "")
+        if isinstance(val, list):
+            val = val[0] if val else ""
+        if val:
+            return str(val)
+    return ""
+
+
+def ris_doi(entry: dict) -> str:
+    """Normalised DOI of a RIS entry (``DO`` tag), or ""."""
+    val = _first_value(entry, ("DO", "doi"))
+    return normalise_doi(val) if val else ""
+
+
+def ris_eid(entry: dict) -> str:
+    """Scopus EID of a RIS entry, from C7/M3/AN/ID/SN or the N1 note, or ""."""
+    for tag in ("C7", "M3", "AN", "ID", "SN"):  # Scopus EID often in C7 or AN
+        val = entry.get(tag, "")
+        if isinstance(val, list):
+            val = val[0] if val else ""
+        if val and val.startswith("2-s2.0"):
+            return val.strip()
+    # Also check N1 note field for Scopus EID pattern
+    return extract_eid(entry.get("N1", ""))
+
+
+def ris_title(entry: dict) -> str:
+    """Normalised title of a RIS entry (TI, else T1), or ""."""
+    for tag in ("TI", "T1", "title"):
+        val = entry.get(tag, "")
+        if isinstance(val, list):
+            val = " ".join(str(v) for v in val)
+        if val:
+            return normalise_title(val)
+    return ""
+
+
+def ris_year(entry: dict) -> str:
+    """Four-digit publication year of a RIS entry (PY, else Y1), or ""."""
+    for tag in ("PY", "Y1", "year"):
+        val = entry.get(tag, "")
+        if isinstance(val, list):
+            val = val[0] if val else ""
+        year = extract_year(str(val).strip())
+        if year:
+            return year
+    return ""
+
+
+def ris_dedup_key(entry: dict) -> tuple[str, str]:
+    """``(key_type, key_value)`` of a RIS entry, priority DOI > EID > title+year."""
+    doi = ris_doi(entry)
+    if doi:
+        return "doi", doi
+
+    eid = ris_eid(entry)
+    if eid:
+        return "eid", eid
+
+    title = ris_title(entry)
+    if title:
+        return "title_year", f"{title}|{ris_year(entry)}"
+
+    return "unknown", str(entry)
+
+
+def ris_dedup_keys(entries: Iterable[dict]) -> list[tuple[str, str]]:
+    """:func:`ris_dedup_key` for every entry."""
+    return [ris_dedup_key(e) for e in entries]
+
+
+def ris_fingerprint(entry: dict) -> str:
+    """Master-list style fingerprint of a RIS entry: ``doi:`` else ``title_year:``.
+
+    Matches :func:`rule_fingerprints` for the DOI and title+year rules, so RIS
+    entries can be checked against fingerprints of a Zotero CSV export.
+    """
+    doi = ris_doi(entry)
+    if doi:
+        return "doi:" + doi
+    title = ris_title(entry)
+    if title:
+        return f"title_year:{title}|{ris_year(entry)}"
+    return "unknown:" + str(entry)
+
+
+def ris_fingerprints_many(entries: Iterable[dict]) -> list[str]:
+    """:func:`ris_fingerprint` for every entry."""
+    return [ris_fingerprint(e) for e in entries]
+
+
+# ---------------------------------------------------------------------------
+# Batch normalisation
+# ---------------------------------------------------------------------------
+
+def normalise_dois(dois: Iterable[Any]) -> list[str]:
+    """:func:`normalise_doi` for every value."""
+    fn = _normalise_doi
+    return [fn(str(d)) for d in dois]
+
+
+def normalise_titles(titles: Iterable[Any]) -> list[str]:
+    """:func:`normalise_title` for every value."""
+    fn = _normalise_title
+    return [fn(str(t)) for t in titles]
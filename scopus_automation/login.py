@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import logging
 
+from . import waits
+from .waits import wait_until
+
 log = logging.getLogger(__name__)
 
 SCOPUS_HOME = "https://www.scopus.com"
@@ -37,11 +40,8 @@ def ensure_logged_in(driver, config) -> bool:
     except Exception as exc:
         log.warning("Could not load Scopus: %s", exc)
 
-    # Short wait for page JS to settle
-    import time
-    time.sleep(3)
-
-    if _is_logged_in(driver):
+    # Wait for the page JS to render the signed-in home page (or give up and prompt)
+    if wait_until(lambda: _is_logged_in(driver), waits.WAITS.login_sec):
         log.info("Already logged in — skipping login prompt.")
         print("\n[OK] Scopus session active — proceeding.\n")
         return True
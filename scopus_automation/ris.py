@@ -8,40 +8,61 @@ break all downstream tag lookups.
 
 from __future__ import annotations
 
+import gzip
 import re
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from .fingerprint import ris_doi, ris_title
+
+
+_BUFFER_SIZE = 1 << 16
+
+
+def _is_gzip(path: Path, compress: Optional[bool] = None) -> bool:
+    """*compress* if given, else whether *path* ends in ``.gz``."""
+    return path.suffix.lower() == ".gz" if compress is None else compress
+
+
+def _open_text(path: Path, mode: str, compress: Optional[bool] = None) -> IO[str]:
+    """Open a (possibly gzip-compressed) UTF-8 RIS file in text mode."""
+    if _is_gzip(path, compress):
+        return gzip.open(path, mode + "t", encoding="utf-8", errors="replace")
+    return open(path, mode, encoding="utf-8", errors="replace", buffering=_BUFFER_SIZE)
 
 
 # ---------------------------------------------------------------------------
 # Parser
 # ---------------------------------------------------------------------------
 
-def _parse_ris_manual(text: str) -> list[dict[str, Any]]:
-    """
-    Parse RIS text and return list of entry dicts with uppercase tag keys.
+# Tag lines look like:  "TY  - value"  or  "AU  -value"
+_TAG_RE = re.compile(r"^([A-Z][A-Z0-9]{1,3})\s{0,2}-\s{0,2}(.*)$")
+
+
+def _flatten(current: dict[str, list[str]]) -> dict[str, Any]:
+    """Flatten single-element lists to plain strings."""
+    return {k: (v[0] if len(v) == 1 else v) for k, v in current.items()}
+
+
+def _iter_ris_lines(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Yield entry dicts (uppercase tag keys) from an iterable of RIS lines.
+
     Multi-valued tags (AU, KW, AD, …) are stored as lists.
     """
-    entries: list[dict[str, Any]] = []
+    match = _TAG_RE.match
     current: dict[str, list[str]] = {}
 
-    for raw_line in text.splitlines():
+    for raw_line in lines:
         line = raw_line.rstrip()
         if not line:
             continue
 
-        # Tag lines look like:  "TY  - value"  or  "AU  -value"
-        m = re.match(r"^([A-Z][A-Z0-9]{1,3})\s{0,2}-\s{0,2}(.*)$", line)
+        m = match(line)
         if m:
             tag, value = m.group(1), m.group(2).strip()
             if tag == "ER":
                 if current:
-                    # Flatten single-element lists to plain strings
-                    flat: dict[str, Any] = {
-                        k: (v[0] if len(v) == 1 else v)
-                        for k, v in current.items()
-                    }
-                    entries.append(flat)
+                    yield _flatten(current)
                     current = {}
             else:
                 current.setdefault(tag, []).append(value)
@@ -50,72 +71,127 @@ def _parse_ris_manual(text: str) -> list[dict[str, Any]]:
 
     # Handle file without trailing ER
     if current:
-        flat = {k: (v[0] if len(v) == 1 else v) for k, v in current.items()}
-        entries.append(flat)
+        yield _flatten(current)
+
+
+def _parse_ris_manual(text: str) -> list[dict[str, Any]]:
+    """
+    Parse RIS text and return list of entry dicts with uppercase tag keys.
+    Multi-valued tags (AU, KW, AD, …) are stored as lists.
+    """
+    return list(_iter_ris_lines(text.splitlines()))
 
-    return entries
+
+def iter_ris_file(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Lazily yield the entries of a RIS file (uppercase tags).
+
+    The file is read line by line through a buffered reader, so memory use
+    does not grow with the size of the export — only the entry being parsed
+    is held.  The file stays open until the iterator is exhausted or closed.
+    A ``.gz`` suffix is read through gzip.
+    """
+    with _open_text(Path(path), "r") as fh:
+        # str.splitlines() per physical line keeps the exact line boundaries
+        # of parse_ris_file's former read_text().splitlines() (e.g. U+2028)
+        yield from _iter_ris_lines(part for line in fh for part in line.splitlines())
 
 
 def parse_ris_file(path: str | Path) -> list[dict[str, Any]]:
     """Parse a RIS file and return a list of entry dicts (uppercase tags)."""
-    text = Path(path).read_text(encoding="utf-8", errors="replace")
-    return _parse_ris_manual(text)
+    return list(iter_ris_file(path))
 
 
 # ---------------------------------------------------------------------------
 # Writer
 # ---------------------------------------------------------------------------
 
-def write_ris_file(entries: list[dict[str, Any]], path: str | Path) -> None:
-    """Write RIS entries to a file using uppercase tag format."""
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+class RISWriter:
+    """Write RIS entries one at a time to a buffered file handle.
+
+    Output is byte-for-byte what joining all entries into one string would
+    give, but only one entry is formatted at a time.  With
+    ``skip_empty=True`` scalar tags with an empty value are omitted.
+    *compress* selects gzip output; by default a ``.gz`` suffix does.
+
+    Use as a context manager, or call :meth:`close`::
 
-    lines: list[str] = []
-    for entry in entries:
+        with RISWriter(path) as writer:
+            writer.write_all(entries)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compress: Optional[bool] = None,
+        skip_empty: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._skip_empty = skip_empty
+        self._fh = _open_text(self.path, "w", compress)
+
+    def write(self, entry: dict[str, Any]) -> None:
+        lines = ["\n"] if self.count else []  # blank line between entries
         for tag, value in entry.items():
             if isinstance(value, list):
-                for v in value:
-                    lines.append(f"{tag}  - {v}")
-            else:
-                lines.append(f"{tag}  - {value}")
-        lines.append("ER  - ")
-        lines.append("")
-
-    path.write_text("\n".join(lines), encoding="utf-8")
+                lines.extend(f"{tag}  - {v}\n" for v in value)
+            elif value or not self._skip_empty:
+                lines.append(f"{tag}  - {value}\n")
+        lines.append("ER  - \n")
+        self._fh.write("".join(lines))
+        self.count += 1
+
+    def write_all(self, entries: Iterable[dict[str, Any]]) -> int:
+        """Write every entry from *entries* (consumed lazily); returns the count."""
+        for entry in entries:
+            self.write(entry)
+        return self.count
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "RISWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_ris_file(
+    entries: Iterable[dict[str, Any]],
+    path: str | Path,
+    compress: Optional[bool] = None,
+) -> int:
+    """Write RIS entries to a file using uppercase tag format.
+
+    *entries* may be any iterable (e.g. a generator); it is written as it is
+    consumed.  A ``.gz`` suffix, or ``compress=True``, writes gzip.  Returns
+    the number of entries written.
+    """
+    with RISWriter(path, compress=compress) as writer:
+        return writer.write_all(entries)
 
 
 # ---------------------------------------------------------------------------
 # Comparison helpers
 # ---------------------------------------------------------------------------
 
-def _doi_from_entry(entry: dict) -> str | None:
-    doi = entry.get("DO") or ""
-    doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", str(doi).strip().lower())
-    return doi if doi else None
-
-
-def _title_from_entry(entry: dict) -> str:
-    title = entry.get("TI") or entry.get("T1") or ""
-    if isinstance(title, list):
-        title = " ".join(title)
-    return str(title).strip().lower()
-
-
 def compare_ris_sets(
     expected: list[dict], actual: list[dict]
 ) -> tuple[list[dict], list[dict], list[dict]]:
     """
-    Compare two RIS entry sets by DOI (preferred) or normalised title.
+    Compare two RIS entry sets by DOI (preferred) or normalised title,
+    normalised as in deduplication (see :mod:`.fingerprint`).
 
     Returns (matched_expected, missing_from_actual, extra_in_actual).
     """
 
     def keyfn(e: dict) -> str:
-        doi = _doi_from_entry(e)
+        doi = ris_doi(e)
         if doi:
             return f"doi:{doi}"
-        return f"title:{_title_from_entry(e)}"
+        return f"title:{ris_title(e)}"
 
     expected_keys = {keyfn(e): e for e in expected}
     actual_keys = {keyfn(e): e for e in actual}
@@ -5,6 +5,7 @@ from __future__ import annotations
 import csv
 import logging
 import re
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -22,9 +23,11 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 
+from . import waits
 from .browser import wait_for_download, rename_download
 from .login import ensure_logged_in
 from .config import ScopusConfig
+from .waits import StepTimer, format_step_timings, total_step_timings, wait_until
 
 log = logging.getLogger(__name__)
 
@@ -42,8 +45,8 @@ def _safe_click(driver, element) -> None:
     try:
         element.click()
     except ElementClickInterceptedException:
+        # a JS click does not depend on the element having scrolled into view
         driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.4)
         driver.execute_script("arguments[0].click();", element)
 
 
@@ -68,16 +71,12 @@ def _log_page_state(driver, label: str) -> None:
         log.debug("Could not read page state: %s", exc)
 
 
-def _wait_for_page_ready(driver, timeout: int = 15) -> None:
+def _wait_for_page_ready(driver, timeout: float | None = None) -> bool:
     """Wait until document.readyState == 'complete'."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            if driver.execute_script("return document.readyState") == "complete":
-                return
-        except Exception:
-            pass
-        time.sleep(0.5)
+    return bool(wait_until(
+        lambda: driver.execute_script("return document.readyState") == "complete",
+        waits.WAITS.page_ready_sec if timeout is None else timeout,
+    ))
 
 
 def _log_visible_text(driver) -> None:
@@ -169,14 +168,12 @@ def _navigate_to_advanced_search(driver, config: ScopusConfig) -> bool:
             log.warning("Navigation error for %s: %s", url, exc)
             continue
 
-        # Wait for JS rendering
-        _wait_for_page_ready(driver, timeout=15)
-        time.sleep(2)
+        # Wait for JS rendering: the SPA draws the form after readyState
+        _wait_for_page_ready(driver)
+        field = wait_until(lambda: _find_field_via_js(driver), waits.WAITS.search_form_sec)
         _log_page_state(driver, "after-nav")
         _log_visible_text(driver)
 
-        # Try with JS first (most reliable for SPAs)
-        field = _find_field_via_js(driver)
         if field:
             log.info("Advanced search form found via JS.")
             return True
@@ -227,6 +224,16 @@ def _find_field_via_js(driver):
         return None
 
 
+def _field_text(driver, field) -> str:
+    """Current text of a textarea/input (value) or contenteditable div (innerText)."""
+    text = driver.execute_script(
+        "var el = arguments[0];"
+        "return (el.value !== undefined && el.value !== null) ? el.value : el.innerText;",
+        field,
+    )
+    return " ".join(str(text or "").split())
+
+
 def _enter_query(driver, query: str) -> None:
     """Fill the advanced search field (textarea or contenteditable div) with the query."""
     field = _find_field_via_js(driver) or _find_first(driver, _SEARCH_FIELD_SELECTORS, timeout=10)
@@ -241,10 +248,13 @@ def _enter_query(driver, query: str) -> None:
     if tag in ("input", "textarea"):
         # Standard input: JS click to bypass label overlap, then send_keys
         driver.execute_script("arguments[0].focus();", field)
-        time.sleep(0.2)
+        wait_until(
+            lambda: driver.execute_script("return document.activeElement === arguments[0];", field),
+            waits.WAITS.field_sec,
+        )
         field.send_keys(Keys.CONTROL + "a")
         field.send_keys(Keys.DELETE)
-        time.sleep(0.1)
+        wait_until(lambda: _field_text(driver, field) == "", waits.WAITS.field_sec)
         field.send_keys(query)
     else:
         # contenteditable div (Scopus 2024+): use execCommand so framework events fire
@@ -257,23 +267,34 @@ def _enter_query(driver, query: str) -> None:
             document.execCommand('delete', false, null);
             document.execCommand('insertText', false, q);
         """, field, query)
-        time.sleep(0.2)
 
+    # the framework re-renders the field; wait until it shows the whole query
+    expected = " ".join(query.split())
+    if not wait_until(lambda: _field_text(driver, field) == expected, waits.WAITS.field_sec):
+        log.debug("Search field text did not match the query within %.1fs.",
+                  waits.WAITS.field_sec)
     log.info("Query entered: %s", query[:80])
 
 
 def _submit_search(driver) -> None:
+    """Submit the search and wait until the browser has left the search form."""
+    form_url = _current_url(driver)
     btn = _find_first(driver, _SEARCH_BTN_SELECTORS, timeout=10)
     if btn is None:
         # Try pressing Enter in the search field
         field = _find_first(driver, _SEARCH_FIELD_SELECTORS, timeout=5)
-        if field:
-            field.send_keys(Keys.ENTER)
-            log.info("Submitted search via Enter key.")
-            return
-        raise RuntimeError("Could not find search submit button.")
-    _safe_click(driver, btn)
-    log.info("Search submitted.")
+        if field is None:
+            raise RuntimeError("Could not find search submit button.")
+        field.send_keys(Keys.ENTER)
+        log.info("Submitted search via Enter key.")
+    else:
+        _safe_click(driver, btn)
+        log.info("Search submitted.")
+
+    if not wait_until(lambda: _current_url(driver) not in (form_url, "unknown"),
+                      waits.WAITS.submit_sec):
+        log.warning("Still on %s %.0fs after submit.", form_url, waits.WAITS.submit_sec)
+    _wait_for_page_ready(driver)
 
 
 # ---------------------------------------------------------------------------
@@ -286,6 +307,10 @@ _RESULT_COUNT_PATTERNS = [
     r"About\s+([\d,]+)",
 ]
 
+# A results page that says so ends the wait at once instead of after the timeout
+_NO_RESULTS_RE = re.compile(r"\bno (?:documents|results) (?:were )?found|\b0 (?:documents|results)\b",
+                            re.IGNORECASE)
+
 _SELECT_ALL_SELECTORS = [
     (By.CSS_SELECTOR, "[data-testid='select-all-results']"),
     (By.CSS_SELECTOR, "input[aria-label*='Select all' i]"),
@@ -297,11 +322,13 @@ _SELECT_ALL_SELECTORS = [
 
 
 def _get_result_count(driver) -> int:
-    text = ""
     try:
-        text = driver.page_source
+        return _parse_result_count(driver.page_source)
     except Exception:
         return 0
+
+
+def _parse_result_count(text: str) -> int:
     for pat in _RESULT_COUNT_PATTERNS:
         m = re.search(pat, text, re.IGNORECASE)
         if m:
@@ -314,19 +341,35 @@ def _get_result_count(driver) -> int:
     return 0
 
 
-def _wait_for_results(driver, timeout: int = 60) -> int:
+def _results_state(driver) -> int | None:
+    """Result count once the page shows one, -1 for an empty result page, else None."""
+    text = driver.page_source
+    count = _parse_result_count(text)
+    if count:
+        return count
+    if _NO_RESULTS_RE.search(text):
+        return -1
+    return None
+
+
+def _wait_for_results(driver, timeout: float | None = None) -> int:
     """Wait until results page loads and return the count."""
     log.info("Waiting for search results...")
     print("  Waiting for search results to load...")
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        _log_page_state(driver, "results-check")
-        count = _get_result_count(driver)
-        if count > 0:
-            log.info("Found %d results.", count)
-            print(f"  Found {count} results.")
-            return count
-        time.sleep(2)
+    _log_page_state(driver, "results-check")
+    count = wait_until(
+        lambda: _results_state(driver),
+        waits.WAITS.results_sec if timeout is None else timeout,
+        poll=waits.WAITS.results_poll_sec,
+    )
+    if count == -1:
+        log.info("Scopus reports no results.")
+        return 0
+    if count:
+        log.info("Found %d results.", count)
+        print(f"  Found {count} results.")
+        return count
+    _log_page_state(driver, "results-timeout")
     count = _get_result_count(driver)
     log.warning("Result count after timeout: %d", count)
     return count
@@ -359,10 +402,9 @@ def _select_all_documents(driver) -> bool:
             return False
         driver.execute_script("arguments[0].click();", el)
 
-    time.sleep(1)
-
-    # Secondary "Select all N documents" banner (appears after checking the header checkbox)
-    secondary = driver.execute_script("""
+    # Secondary "Select all N documents" banner (appears after checking the header
+    # checkbox on some result pages); clicked as soon as it shows up
+    secondary = wait_until(lambda: driver.execute_script("""
         var btns = document.querySelectorAll('button, a');
         for (var i = 0; i < btns.length; i++) {
             var t = btns[i].textContent.trim().toLowerCase();
@@ -371,7 +413,7 @@ def _select_all_documents(driver) -> bool:
             }
         }
         return false;
-    """)
+    """), waits.WAITS.select_banner_sec)
     if secondary:
         log.info("Clicked secondary 'Select all documents' banner.")
     return True
@@ -389,12 +431,9 @@ _EXPORT_BTN_SELECTORS = [
 ]
 
 
-def _wait_for_export_dialog(driver, timeout: int = 20):
+def _wait_for_export_dialog(driver, timeout: float = 20):
     """Wait until the real export dialog (not the loading spinner) is visible."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            el = driver.execute_script("""
+    return wait_until(lambda: driver.execute_script("""
                 // Skip the loading overlay (#loadingModal)
                 var all = document.querySelectorAll('[role="dialog"]');
                 for (var i = 0; i < all.length; i++) {
@@ -418,13 +457,7 @@ def _wait_for_export_dialog(driver, timeout: int = 20):
                     if (el && el.offsetParent !== null) return el;
                 }
                 return null;
-            """)
-            if el:
-                return el
-        except Exception:
-            pass
-        time.sleep(0.5)
-    return None
+            """), timeout)
 
 
 def _dump_dialog_html(driver) -> None:
@@ -554,12 +587,9 @@ def _js_click_export_confirm(driver) -> bool:
         return False
 
 
-def _wait_for_dropdown(driver, timeout: int = 8) -> bool:
+def _wait_for_dropdown(driver, timeout: float | None = None) -> bool:
     """Wait until the Export dropdown menu is visible (has visible menuitem buttons)."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            visible = driver.execute_script("""
+    return bool(wait_until(lambda: driver.execute_script("""
                 // Scopus uses <button role="menuitem"> in its export dropdown
                 var els = document.querySelectorAll('[role="menuitem"]');
                 for (var i = 0; i < els.length; i++) {
@@ -571,13 +601,7 @@ def _wait_for_dropdown(driver, timeout: int = 8) -> bool:
                 var ris = document.querySelector('[data-testid="export-to-ris"]');
                 if (ris && ris.offsetParent !== null) return true;
                 return false;
-            """)
-            if visible:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.3)
-    return False
+            """), waits.WAITS.dropdown_sec if timeout is None else timeout))
 
 
 def _find_export_modal(driver):
@@ -619,19 +643,40 @@ def _find_export_modal(driver):
         return None
 
 
-def _wait_for_export_modal(driver, timeout: int = 10) -> bool:
-    """Wait for the RIS export confirmation modal that Scopus shows after format selection."""
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            if _find_export_modal(driver) is not None:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.4)
+def _download_started(download_dir: Path, since: float) -> bool:
+    """True once Chrome has created a download (partial or finished) after *since*."""
+    for pattern in ("*.crdownload", "*.ris"):
+        for f in download_dir.glob(pattern):
+            try:
+                if f.stat().st_mtime >= since:
+                    return True
+            except OSError:
+                continue
     return False
 
 
+def _wait_for_export_modal(
+    driver,
+    timeout: float | None = None,
+    download_dir: Path | None = None,
+    since: float = 0,
+) -> bool:
+    """Wait for the RIS export confirmation modal that Scopus shows after format selection.
+
+    With *download_dir* the wait also ends (returning False) as soon as a
+    download newer than *since* appears there: Scopus skipped the modal.
+    """
+    def _state():
+        if _find_export_modal(driver) is not None:
+            return "modal"
+        if download_dir is not None and _download_started(download_dir, since):
+            return "download"
+        return None
+
+    state = wait_until(_state, waits.WAITS.modal_sec if timeout is None else timeout)
+    return state == "modal"
+
+
 def _find_modal_export_button(driver):
     """
     Return the Export/Download button element inside the Scopus export modal.
@@ -864,12 +909,15 @@ def _click_export_modal_button(driver) -> bool:
         return False
 
 
-def _perform_export(driver) -> None:
+def _perform_export(driver, download_dir: Path | None = None, since: float = 0) -> None:
     """
     Scopus 2024 export flow:
       1. Click "Export ^" button  →  dropdown appears
       2. Click the "RIS" menu item (data-testid="export-to-ris")  →  download starts
     Uses ActionChains so React event handlers fire correctly.
+
+    *download_dir* / *since* let the wait for the confirmation modal stop as
+    soon as the download has started without one.
     """
     log.info("Opening export dropdown...")
     print("  Opening export dropdown...")
@@ -885,12 +933,12 @@ def _perform_export(driver) -> None:
     ActionChains(driver).move_to_element(btn).click().perform()
 
     # Wait for dropdown to be visible
-    appeared = _wait_for_dropdown(driver, timeout=8)
+    appeared = _wait_for_dropdown(driver)
     if appeared:
         log.info("Export dropdown visible.")
     else:
-        log.warning("Dropdown not detected within 8s — proceeding anyway.")
-    time.sleep(0.5)
+        log.warning("Dropdown not detected within %.0fs — proceeding anyway.",
+                    waits.WAITS.dropdown_sec)
 
     # Diagnostics
     _save_screenshot(driver, "export_dropdown")
@@ -922,8 +970,7 @@ def _perform_export(driver) -> None:
     print("  RIS clicked — checking for confirmation modal...")
 
     # Scopus may show a confirmation modal before the download starts
-    time.sleep(2)
-    modal_appeared = _wait_for_export_modal(driver, timeout=10)
+    modal_appeared = _wait_for_export_modal(driver, download_dir=download_dir, since=since)
     if modal_appeared:
         log.info("Export confirmation modal appeared.")
         print("  Export modal detected — enabling Abstract option...")
@@ -933,14 +980,17 @@ def _perform_export(driver) -> None:
         selected = _select_abstract_in_modal(driver)
         if selected:
             print("  Abstract option enabled.")
-            time.sleep(0.5)
         else:
             log.warning("Abstract option not found in modal — exporting without abstract.")
             print("  Warning: Abstract option not found — proceeding without it.")
 
         # Use the JS-based finder that follows the exact DOM path the user identified:
         # Modal-module__HdKbm > section > Modal-module__V53QT > div > div > span[2] > ... > button
-        export_btn_el = _find_modal_export_button(driver)
+        # and wait for the button to be enabled after the checkbox re-render
+        export_btn_el = wait_until(
+            lambda: _enabled_or_none(_find_modal_export_button(driver)),
+            waits.WAITS.modal_button_sec,
+        )
         if export_btn_el is not None:
             log.info("Export modal button found — clicking via ActionChains.")
             print("  Export button found — clicking...")
@@ -956,6 +1006,13 @@ def _perform_export(driver) -> None:
     print("  Waiting for download...")
 
 
+def _enabled_or_none(element):
+    """*element* if it is present and enabled, else None (for :func:`wait_until`)."""
+    if element is not None and element.is_enabled():
+        return element
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Top-level: search + export
 # ---------------------------------------------------------------------------
@@ -966,30 +1023,69 @@ def search_and_export(
     config: ScopusConfig,
     output_dir: Path | None = None,
     index_csv: Path | None = None,
+    download_dir: Path | None = None,
+    max_results: int | None = None,
 ) -> dict[str, Any]:
-    """Run an advanced search and export all results as RIS. Returns metadata dict."""
+    """Run an advanced search and export all results as RIS. Returns metadata dict.
+
+    *download_dir* is where Chrome saves the export (default: *output_dir*);
+    the RIS file is then moved into *output_dir*.
+
+    With *max_results*, a search finding more results than that is not
+    exported: the metadata has ``over_cap=True`` and the result count (see
+    :mod:`scopus_automation.year_slices`).
+
+    ``meta["step_timings"]`` holds the seconds spent in each step (login,
+    navigate, query, submit, results, select, export, download); they are
+    also logged per query.
+    """
     if output_dir is None:
         output_dir = config.search_output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
+    if download_dir is None:
+        download_dir = output_dir
+
+    timer = StepTimer()
+    try:
+        return _search_and_export(driver, query, config, output_dir, index_csv,
+                                  download_dir, max_results, timer)
+    finally:
+        log.info("Step timings for %r: %s", query[:80], timer.summary())
 
-    ensure_logged_in(driver, config)
+
+def _search_and_export(
+    driver,
+    query: str,
+    config: ScopusConfig,
+    output_dir: Path,
+    index_csv: Path | None,
+    download_dir: Path,
+    max_results: int | None,
+    timer: StepTimer,
+) -> dict[str, Any]:
+    with timer.step("login"):
+        ensure_logged_in(driver, config)
 
     # --- Navigate to advanced search ---
-    found = _navigate_to_advanced_search(driver, config)
+    with timer.step("navigate"):
+        found = _navigate_to_advanced_search(driver, config)
     if not found:
-        return {"query": query, "error": "Could not find advanced search form", "ris_file": None}
+        return {"query": query, "error": "Could not find advanced search form", "ris_file": None,
+                "step_timings": timer.as_dict()}
 
     # --- Enter query ---
     _log_page_state(driver, "before-query")
-    _enter_query(driver, query)
+    with timer.step("query"):
+        _enter_query(driver, query)
 
     # --- Submit ---
-    _submit_search(driver)
-    time.sleep(3)
+    with timer.step("submit"):
+        _submit_search(driver)
     _log_page_state(driver, "after-submit")
 
     # --- Wait for results ---
-    result_count = _wait_for_results(driver, timeout=60)
+    with timer.step("results"):
+        result_count = _wait_for_results(driver)
     search_url = _current_url(driver)
 
     if result_count == 0:
@@ -999,19 +1095,38 @@ def search_and_export(
             "search_url": search_url, "ris_file": None,
             "downloaded_at": datetime.now().isoformat(),
             "error": "No results",
+            "step_timings": timer.as_dict(),
+        }
+
+    if max_results is not None and result_count > max_results:
+        log.warning("%d results for %s exceed the export cap of %d — not exported.",
+                    result_count, query, max_results)
+        return {
+            "query": query, "result_count": result_count,
+            "search_url": search_url, "ris_file": None,
+            "downloaded_at": datetime.now().isoformat(),
+            "error": f"Over export cap ({result_count} > {max_results})",
+            "over_cap": True,
+            "step_timings": timer.as_dict(),
         }
 
     # --- Select all ---
-    _select_all_documents(driver)
+    with timer.step("select"):
+        _select_all_documents(driver)
 
     # --- Export ---
+    export_started = time.monotonic()
     export_start_mtime = time.time() - 1  # 1s buffer for clock skew
-    _perform_export(driver)
+    with timer.step("export"):
+        _perform_export(driver, download_dir=download_dir, since=export_start_mtime)
 
     # --- Wait for download (only files newer than export start) ---
     log.info("Waiting for download (up to %ds)...", config.download_timeout_sec)
     print(f"  Waiting for download (up to {config.download_timeout_sec}s)...")
-    ris_raw = wait_for_download(output_dir, config.download_timeout_sec, min_mtime=export_start_mtime)
+    with timer.step("download"):
+        ris_raw = wait_for_download(download_dir, config.download_timeout_sec,
+                                    min_mtime=export_start_mtime)
+    download_sec = time.monotonic() - export_started
     if ris_raw is None:
         raise RuntimeError(
             f"Download timed out after {config.download_timeout_sec}s. "
@@ -1027,6 +1142,8 @@ def search_and_export(
         "search_url": search_url,
         "downloaded_at": datetime.now().isoformat(),
         "ris_file": str(ris_dest),
+        "download_sec": round(download_sec, 2),  # export click -> file on disk
+        "step_timings": timer.as_dict(),
     }
 
     if index_csv is None:
@@ -1037,14 +1154,19 @@ def search_and_export(
     return meta
 
 
+# Serialises index appends from concurrent driver-pool workers
+_INDEX_LOCK = threading.Lock()
+
+
 def _append_to_index(index_csv: Path, meta: dict) -> None:
     fields = ["query", "result_count", "search_url", "downloaded_at", "ris_file"]
-    write_header = not index_csv.exists()
-    with open(index_csv, "a", newline="", encoding="utf-8") as fh:
-        w = csv.DictWriter(fh, fieldnames=fields)
-        if write_header:
-            w.writeheader()
-        w.writerow({k: meta.get(k, "") for k in fields})
+    with _INDEX_LOCK:
+        write_header = not index_csv.exists()
+        with open(index_csv, "a", newline="", encoding="utf-8") as fh:
+            w = csv.DictWriter(fh, fieldnames=fields)
+            if write_header:
+                w.writeheader()
+            w.writerow({k: meta.get(k, "") for k in fields})
 
 
 # ---------------------------------------------------------------------------
@@ -1071,4 +1193,8 @@ def search_from_file(
         except Exception as exc:
             log.error("Failed: %s — %s", q, exc)
             results.append({"query": q, "error": str(exc)})
+    totals = total_step_timings(results)
+    if totals:
+        log.info("Batch step timings (%d queries): %s", len(results),
+                 format_step_timings(totals))
     return results
@@ -0,0 +1,119 @@
+"""Timing profile, condition waits and per-step timers for the Scopus UI flows.
+
+Every wait in the search/export flow is a condition poll: it returns as soon
+as the page is in the expected state and gives up after the step's timeout in
+:data:`WAITS`.  Tune the timeouts (or the poll interval) in one place by
+replacing the profile:
+
+    from scopus_automation import waits
+    waits.WAITS = waits.WaitProfile(poll_sec=0.1, results_sec=120)
+
+:class:`StepTimer` records where each query's seconds go; ``search_and_export``
+returns its totals as ``meta["step_timings"]``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class WaitProfile:
+    """Poll interval and upper bounds (seconds) for each wait in the Scopus flow.
+
+    The timeouts only matter when a condition never comes true; a page that
+    is ready returns after at most one poll interval.
+    """
+
+    poll_sec: float = 0.1           # DOM re-check interval
+    page_ready_sec: float = 15      # document.readyState == 'complete'
+    search_form_sec: float = 10     # advanced-search field rendered
+    field_sec: float = 2            # focus / clear / typed text visible in the field
+    submit_sec: float = 10          # URL leaves the search form after submit
+    results_sec: float = 60         # result count shown on the results page
+    results_poll_sec: float = 0.5   # page_source is large; re-read it less often
+    select_banner_sec: float = 1.0  # secondary "Select all N documents" banner
+    dropdown_sec: float = 8         # export dropdown menu items visible
+    modal_sec: float = 12           # export confirmation modal (or download starts)
+    modal_button_sec: float = 3     # modal Export button present and enabled
+    login_sec: float = 3            # signed-in Scopus home page rendered
+
+
+#: The profile every wait in :mod:`scopus_automation` reads at call time.
+WAITS = WaitProfile()
+
+
+def wait_until(
+    condition: Callable[[], Optional[T]],
+    timeout: float,
+    poll: Optional[float] = None,
+) -> Optional[T]:
+    """Call *condition* until it returns something truthy; return that value.
+
+    Exceptions raised by *condition* (stale elements, a page mid-navigation)
+    count as "not yet".  Returns None once *timeout* seconds have passed; the
+    condition is always evaluated at least once.
+    """
+    interval = WAITS.poll_sec if poll is None else poll
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            value = condition()
+        except Exception:
+            value = None
+        if value:
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(interval, remaining))
+
+
+class StepTimer:
+    """Accumulate wall-clock seconds per named step.
+
+        timer = StepTimer()
+        with timer.step("navigate"):
+            ...
+        timer.as_dict()   # {"navigate": 2.31}
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - t0
+
+    def as_dict(self) -> dict[str, float]:
+        return {name: round(sec, 2) for name, sec in self.seconds.items()}
+
+    def summary(self) -> str:
+        return format_step_timings(self.seconds)
+
+
+def format_step_timings(timings: dict[str, float]) -> str:
+    """``"navigate 2.3 s, results 4.1 s, ... (total 9.8 s)"``."""
+    parts = [f"{name} {sec:.1f} s" for name, sec in timings.items()]
+    return f"{', '.join(parts)} (total {sum(timings.values()):.1f} s)"
+
+
+def total_step_timings(rows: Iterable[dict]) -> dict[str, float]:
+    """Sum the ``step_timings`` of many query results, in first-seen step order."""
+    totals: dict[str, float] = {}
+    for row in rows:
+        for name, sec in (row.get("step_timings") or {}).items():
+            totals[name] = totals.get(name, 0.0) + sec
+    return {name: round(sec, 2) for name, sec in totals.items()}
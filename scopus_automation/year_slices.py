@@ -0,0 +1,157 @@
+"""Export searches larger than the Scopus export cap as publication-year slices.
+
+Scopus exports at most ``config.export_cap`` records at once.  A query with
+more results is restricted to ranges of publication years,
+
+    REFEID(2-s2.0-85012345678) AND PUBYEAR < 2006
+    REFEID(2-s2.0-85012345678) AND PUBYEAR > 2005 AND PUBYEAR < 2017
+    ...
+
+bisecting any range that is still over the cap, until every slice fits (a
+single year over the cap is exported anyway, truncated, with a warning).
+The slices are merged through :func:`~scopus_automation.dedupe.merge_ris_files`,
+so a record exported by two slices is kept once.
+
+Slices of the same bisection round are independent searches; given a
+:class:`~scopus_automation.driver_pool.DriverPool` they run on all its drivers
+at once, otherwise one after another on a single driver.  Finished slice
+files are kept in ``<stem>.slices/`` until the merge, so an interrupted run
+does not export them again.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import ScopusConfig
+from .dedupe import merge_ris_files
+from .search_export import search_and_export
+
+log = logging.getLogger(__name__)
+
+# Lower end of the first bisection; earlier years stay in the open-ended first slice
+_EARLIEST_YEAR = 1950
+
+
+@dataclass(frozen=True)
+class YearSlice:
+    """Publication years *start*..*end* inclusive; None leaves that end open."""
+
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.start or 'min'}-{self.end or 'max'}"
+
+    def query(self, query: str) -> str:
+        clauses = [query]
+        if self.start is not None:
+            clauses.append(f"PUBYEAR > {self.start - 1}")
+        if self.end is not None:
+            clauses.append(f"PUBYEAR < {self.end + 1}")
+        return " AND ".join(clauses)
+
+    def _bounds(self) -> tuple[int, int]:
+        lo = self.start if self.start is not None else _EARLIEST_YEAR
+        hi = self.end if self.end is not None else datetime.now().year + 1
+        return lo, hi
+
+    def can_split(self) -> bool:
+        lo, hi = self._bounds()
+        return lo < hi
+
+    def split(self) -> tuple["YearSlice", "YearSlice"]:
+        lo, hi = self._bounds()
+        mid = (lo + hi) // 2
+        return YearSlice(self.start, mid), YearSlice(mid + 1, self.end)
+
+
+def _export_slice(
+    driver,
+    query: str,
+    piece: YearSlice,
+    config: ScopusConfig,
+    slices_dir: Path,
+    download_dir: Optional[Path],
+) -> dict[str, Any]:
+    """Export one slice to ``slices_dir/<label>.ris``, or report it over the cap."""
+    dest = slices_dir / f"{piece.label}.ris"
+    if dest.exists():
+        log.info("Slice %s already exported: %s", piece.label, dest)
+        return {"ris_file": str(dest), "result_count": -1}
+
+    work_dir = slices_dir / piece.label  # a search's own file name is query-derived
+    meta = search_and_export(
+        driver, piece.query(query), config,
+        output_dir=work_dir, index_csv=slices_dir / "slices_index.csv",
+        download_dir=download_dir or work_dir,
+        max_results=config.export_cap if piece.can_split() else None,
+    )
+    if meta.get("ris_file"):
+        Path(meta["ris_file"]).replace(dest)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        meta["ris_file"] = str(dest)
+        if meta.get("result_count", 0) > config.export_cap:
+            log.warning("Year %s alone has %d results; export truncated to the cap of %d.",
+                        piece.label, meta["result_count"], config.export_cap)
+    return meta
+
+
+def export_year_sliced(
+    query: str,
+    config: ScopusConfig,
+    dest_ris: Path,
+    driver=None,
+    download_dir: Optional[Path] = None,
+    pool=None,
+) -> tuple[int, int]:
+    """Export every result of *query* into *dest_ris*, slicing by publication year.
+
+    Runs on *pool* (a started :class:`~scopus_automation.driver_pool.DriverPool`)
+    when given, else on *driver* with downloads landing in *download_dir*.
+    Returns ``(records written, slices exported)``.  Raises RuntimeError if
+    a slice fails; slices already exported are reused by the next attempt.
+    """
+    slices_dir = dest_ris.with_name(f"{dest_ris.stem}.slices")
+    slices_dir.mkdir(parents=True, exist_ok=True)
+
+    def _run(worker, piece: YearSlice) -> dict[str, Any]:
+        return _export_slice(worker.driver, query, piece, config, slices_dir, worker.download_dir)
+
+    frontier = list(YearSlice().split())
+    exported: list[tuple[YearSlice, Path]] = []
+    while frontier:
+        log.info("Exporting %d year slice(s) of %s: %s", len(frontier), query,
+                 ", ".join(p.label for p in frontier))
+        if pool is not None:
+            metas = list(pool.map(_run, frontier))
+        else:
+            metas = [_export_slice(driver, query, p, config, slices_dir, download_dir)
+                     for p in frontier]
+
+        next_round: list[YearSlice] = []
+        for piece, meta in zip(frontier, metas):
+            if meta.get("over_cap"):
+                next_round.extend(piece.split())
+            elif meta.get("ris_file"):
+                exported.append((piece, Path(meta["ris_file"])))
+            elif meta.get("error") != "No results":
+                raise RuntimeError(f"Year slice {piece.label} of {query} failed: {meta.get('error')}")
+        frontier = next_round
+
+    # merge in year order so the output does not depend on the pool size
+    files = [path for _, path in sorted(exported, key=lambda e: e[0]._bounds())]
+    if files:
+        total, dupes = merge_ris_files(files, dest_ris)
+    else:
+        total, dupes = 0, 0
+    log.info("Merged %d year slice(s) of %s into %s: %d records (%d duplicates dropped).",
+             len(files), query, dest_ris, total, dupes)
+    shutil.rmtree(slices_dir, ignore_errors=True)
+    return total, len(files)
@@ -31,6 +31,9 @@ Usage
   # Override batch size for this run
   python screen_abstracts.py --batch-size 20
 
+  # Screen 3 abstracts at a time in 3 tabs of the same browser
+  python screen_abstracts.py --batch-size 20 --tabs 3
+
   # Re-screen papers that were already completed (e.g. after changing the prompt)
   python screen_abstracts.py --rescreen
 
@@ -121,6 +124,7 @@ def _print_stats(stats: dict, label: str = "Stats") -> None:
 
 def _claim_with_retry(conn, cfg, max_attempts: int = 5):
     from apm.chatgpt_ui.database import claim_rows
+    from apm.chatgpt_ui.export_candidates import claim_filter_sql
 
     for attempt in range(1, max_attempts + 1):
         try:
@@ -130,7 +134,7 @@ def _claim_with_retry(conn, cfg, max_attempts: int = 5):
                 batch_size=cfg.processing.batch_size,
                 max_retries=cfg.processing.max_retries,
                 stale_lock_hours=cfg.processing.stale_lock_hours,
-                keyword_filter=cfg.processing.keyword_filter or None,
+                keyword_filter=claim_filter_sql(cfg.processing),
             )
         except sqlite3.OperationalError as exc:
             if "locked" in str(exc).lower() and attempt < max_attempts:
@@ -148,16 +152,20 @@ def _claim_with_retry(conn, cfg, max_attempts: int = 5):
 # Pipeline steps
 # ---------------------------------------------------------------------------
 
-def step_import(conn, cfg, log) -> int:
+def step_import(conn, cfg, log, force: bool = False, rebuild_candidates: bool = False) -> int:
     from apm.chatgpt_ui.database import import_csv
+    from apm.chatgpt_ui.export_candidates import update_candidate_flags
 
     log.info("=== STEP 1: Import CSV ===")
     if not cfg.master_csv_path.exists():
         log.error("Master CSV not found: %s", cfg.master_csv_path)
         raise FileNotFoundError(cfg.master_csv_path)
 
-    n = import_csv(conn, cfg.master_csv_path)
+    n = import_csv(conn, cfg.master_csv_path, force=force)
     log.info("Import done — %d new rows added.", n)
+    if cfg.processing.keyword_groups:
+        n_flagged = update_candidate_flags(conn, rebuild=rebuild_candidates)
+        log.info("Claiming restricted to %d keyword-group candidates.", n_flagged)
     return n
 
 
@@ -179,14 +187,15 @@ def step_export_candidates(cfg, log) -> int:
 
 
 def step_screen(conn, cfg, log, rescreen: bool = False) -> tuple[int, int]:
-    from apm.chatgpt_ui.processor import process_row, ChatGPTServerError
-    from apm.chatgpt_ui.selenium_client import build_driver, ensure_logged_in
+    from apm.chatgpt_ui.processor import process_row, process_rows_in_tabs, ChatGPTServerError
+    from apm.chatgpt_ui.selenium_client import build_driver, ensure_logged_in, open_chat_tabs
     from apm.chatgpt_ui.database import get_stats, reset_completed
+    from apm.chatgpt_ui.export_candidates import claim_filter_sql
 
     log.info("=== STEP 3: Screen abstracts via ChatGPT ===")
 
     if rescreen:
-        n_reset = reset_completed(conn, keyword_filter=cfg.processing.keyword_filter or None)
+        n_reset = reset_completed(conn, keyword_filter=claim_filter_sql(cfg.processing))
         log.info("--rescreen: reset %d previously completed rows for re-screening.", n_reset)
         if n_reset:
             _delete_json_outputs(cfg, log)
@@ -225,20 +234,26 @@ def step_screen(conn, cfg, log, rescreen: bool = False) -> tuple[int, int]:
         time.sleep(3)
         ensure_logged_in(driver)
 
-        for i, row in enumerate(rows, 1):
-            log.info("  Row %d/%d — %s", i, len(rows), (row["title"] or "")[:70])
-            try:
-                success = process_row(conn, driver, cfg, row, prompt_template)
-            except ChatGPTServerError as exc:
-                log.error("ChatGPT server unreachable — terminating batch early: %s", exc)
-                failed += 1
-                break
-            if success:
-                completed += 1
-            else:
-                failed += 1
-            if i < len(rows):
-                time.sleep(_ROW_PAUSE)
+        if cfg.selenium.tabs > 1:
+            handles = open_chat_tabs(driver, min(cfg.selenium.tabs, len(rows)))
+            completed, failed = process_rows_in_tabs(
+                conn, driver, cfg, rows, prompt_template, handles, send_pause=_ROW_PAUSE,
+            )
+        else:
+            for i, row in enumerate(rows, 1):
+                log.info("  Row %d/%d — %s", i, len(rows), (row["title"] or "")[:70])
+                try:
+                    success = process_row(conn, driver, cfg, row, prompt_template)
+                except ChatGPTServerError as exc:
+                    log.error("ChatGPT server unreachable — terminating batch early: %s", exc)
+                    failed += 1
+                    break
+                if success:
+                    completed += 1
+                else:
+                    failed += 1
+                if i < len(rows):
+                    time.sleep(_ROW_PAUSE)
 
     finally:
         try:
@@ -285,6 +300,16 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Import CSV → DB, export candidates CSV, then exit (no ChatGPT).",
     )
+    parser.add_argument(
+        "--force-import",
+        action="store_true",
+        help="Re-read the CSV even if it is unchanged since the last import.",
+    )
+    parser.add_argument(
+        "--rebuild-candidates",
+        action="store_true",
+        help="Re-match every row against the keyword groups, not just new ones.",
+    )
     parser.add_argument(
         "--export-candidates",
         action="store_true",
@@ -307,6 +332,13 @@ def main(argv: list[str] | None = None) -> int:
         metavar="N",
         help="Override batch_size from config for this run.",
     )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Override selenium.tabs: screen K rows at once in K tabs of one browser.",
+    )
     parser.add_argument(
         "--rescreen",
         action="store_true",
@@ -328,6 +360,8 @@ def main(argv: list[str] | None = None) -> int:
     cfg = load_config(args.config)
     if args.batch_size > 0:
         cfg.processing.batch_size = args.batch_size
+    if args.tabs > 0:
+        cfg.selenium.tabs = args.tabs
 
     log_file = _setup_logging(args.verbose, _LOG_DIR)
     log      = logging.getLogger(__name__)
@@ -340,6 +374,7 @@ def main(argv: list[str] | None = None) -> int:
     log.info("Output dir  : %s", cfg.output_path)
     log.info("Machine ID  : %s", cfg.processing.machine_id)
     log.info("Batch size  : %s", cfg.processing.batch_size)
+    log.info("Tabs        : %s", cfg.selenium.tabs)
     log.info("Log file    : %s", log_file)
 
     # ------------------------------------------------------------------
@@ -362,7 +397,8 @@ def main(argv: list[str] | None = None) -> int:
     conn = open_db(cfg.db_path)
     init_db(conn)
 
-    step_import(conn, cfg, log)
+    step_import(conn, cfg, log, force=args.force_import,
+                rebuild_candidates=args.rebuild_candidates)
     n_candidates = step_export_candidates(cfg, log)
 
     stats = get_stats(conn)
@@ -1,8 +1,25 @@
 """pytest configuration: register custom markers and shared fixtures."""
 
+from pathlib import Path
+
 import pytest
 
 
+class FakeDriver:
+    """Selenium driver stand-in for DriverPool tests — no Chrome required."""
+
+    def __init__(self, name: str = "main") -> None:
+        self.name = name
+        self.quit_called = False
+        self.download_dirs: list[Path] = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.download_dirs.append(Path(params["downloadPath"]))
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
 def pytest_configure(config):
     config.addinivalue_line(
         "markers",
@@ -15,3 +32,22 @@ def test_file_dir(tmp_path_factory):
     """Return the project test_file/ directory."""
     import pathlib
     return pathlib.Path(__file__).parent.parent / "test_file"
+
+
+@pytest.fixture
+def fake_driver():
+    """A FakeDriver standing in for the caller's primary browser."""
+    return FakeDriver("main")
+
+
+@pytest.fixture
+def driver_factory():
+    """DriverPool driver_factory building FakeDrivers; ``.built`` records (index, download_dir)."""
+    built = []
+
+    def _factory(config, download_dir, index):
+        built.append((index, download_dir))
+        return FakeDriver(f"chrome{index}")
+
+    _factory.built = built
+    return _factory
@@ -0,0 +1,192 @@
+"""Unit tests for the ChatGPT-screening SQLite store — no browser required."""
+
+import csv
+import json
+
+import pytest
+
+from apm.chatgpt_ui.database import STATUS_PENDING, import_csv, init_db, open_db
+
+FIELDS = ["Key", "Title", "DOI", "Abstract Note"]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", encoding="utf-8-sig", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _row(n, doi=None, title=None):
+    return {"Key": f"K{n}", "Title": f"Paper {n}" if title is None else title,
+            "DOI": f"10.1/{n}" if doi is None else doi, "Abstract Note": f"Abstract {n}"}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = open_db(tmp_path / "articles.db")
+    init_db(conn)
+    yield conn
+    conn.close()
+
+
+def test_import_streams_in_chunks_and_dedupes(tmp_path, conn):
+    rows = [_row(n) for n in range(7)]
+    rows += [
+        _row(99, doi="10.1/3", title="Duplicate of paper 3"),  # same DOI: first wins
+        {k: "" for k in FIELDS},                                # Excel blank row
+        _row(100, doi="", title=""),                            # no DOI, no title
+        _row(101, doi=""),                                      # hashed by title
+    ]
+    src = tmp_path / "master.csv"
+    _write_csv(src, rows)
+
+    assert import_csv(conn, src, chunk_rows=3) == 8
+    got = conn.execute("SELECT doi, title, abstract, raw_data, status FROM articles ORDER BY id").fetchall()
+    assert [r["title"] for r in got] == [f"Paper {n}" for n in range(7)] + ["Paper 101"]
+    assert {r["status"] for r in got} == {STATUS_PENDING}
+    assert json.loads(got[0]["raw_data"]) == rows[0]
+    assert conn.execute("SELECT COUNT(*) FROM import_stage").fetchone()[0] == 0
+
+    saved = conn.execute("SELECT rows_read, rows_inserted FROM imports").fetchone()
+    assert tuple(saved) == (len(rows), 8)
+
+
+def test_unchanged_csv_is_skipped_and_changed_csv_adds_only_new_rows(tmp_path, conn):
+    src = tmp_path / "master.csv"
+    _write_csv(src, [_row(n) for n in range(3)])
+    assert import_csv(conn, src) == 3
+
+    conn.execute("UPDATE articles SET status = 'Completed'")
+    conn.commit()
+    assert import_csv(conn, src) == 0
+    assert import_csv(conn, src, force=True) == 0  # re-read, but nothing is new
+
+    _write_csv(src, [_row(n) for n in range(5)])
+    assert import_csv(conn, src) == 2
+    statuses = [r[0] for r in conn.execute("SELECT status FROM articles ORDER BY id")]
+    assert statuses == ["Completed"] * 3 + [STATUS_PENDING] * 2
+
+
+def test_unchanged_stat_skips_without_reading_and_touched_file_is_hashed(tmp_path, conn, monkeypatch):
+    import os
+
+    import apm.chatgpt_ui.database as database
+
+    src = tmp_path / "master.csv"
+    _write_csv(src, [_row(n) for n in range(3)])
+    assert import_csv(conn, src) == 3
+    size, mtime_ns = conn.execute("SELECT size, mtime_ns FROM imports").fetchone()
+    assert (size, mtime_ns) == (src.stat().st_size, src.stat().st_mtime_ns)
+
+    real_sha = database._file_sha256
+    monkeypatch.setattr(database, "_file_sha256", lambda path: pytest.fail("file was read"))
+    assert import_csv(conn, src) == 0
+
+    # same bytes, new mtime (e.g. re-synced): hashed once, not parsed, stat refreshed
+    os.utime(src, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    monkeypatch.setattr(database, "_file_sha256", real_sha)
+    monkeypatch.setattr(database, "_importable_rows", lambda *a: pytest.fail("file was parsed"))
+    assert import_csv(conn, src) == 0
+    assert conn.execute("SELECT mtime_ns FROM imports").fetchone()[0] == mtime_ns + 10**9
+
+
+GROUPS = [("EEG", ["eeg", "electroencephalog"]), ("Driving", ["driver", "driving"])]
+
+
+def _add(conn, title, abstract=""):
+    n = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    with conn:
+        conn.execute(
+            "INSERT INTO articles (doi_hash, title, abstract, raw_data) VALUES (?, ?, ?, '{}')",
+            (f"h{n}", title, abstract),
+        )
+
+
+def _matching_titles(conn, groups=GROUPS):
+    from apm.chatgpt_ui.database import keyword_match_sql
+
+    sql = f"SELECT title FROM articles WHERE {keyword_match_sql(groups)} ORDER BY id"
+    return [r[0] for r in conn.execute(sql)]
+
+
+def test_keyword_groups_match_through_fts_index_kept_in_sync(conn):
+    _add(conn, "EEG-based detection of drowsy drivers")
+    _add(conn, "Electroencephalography in simulators", "Participants were driving at night.")
+    _add(conn, "EEG during sleep")                                  # no driving term
+    _add(conn, "Screwdriver torque and eeg artefacts")              # 'driver' only inside a word
+    assert _matching_titles(conn) == ["EEG-based detection of drowsy drivers",
+                                      "Electroencephalography in simulators"]
+
+    with conn:
+        conn.execute("UPDATE articles SET abstract = 'while driving' WHERE title = 'EEG during sleep'")
+        conn.execute("DELETE FROM articles WHERE title LIKE 'Electro%'")
+        conn.execute("UPDATE articles SET status = 'Completed'")    # not an indexed column
+    assert _matching_titles(conn) == ["EEG-based detection of drowsy drivers", "EEG during sleep"]
+
+
+def test_reset_completed_uses_keyword_match_filter(conn):
+    from apm.chatgpt_ui.database import keyword_match_sql, reset_completed
+
+    _add(conn, "Unrelated paper")
+    _add(conn, "Driver's EEG under fatigue")
+    conn.execute("UPDATE articles SET status = 'Completed'")
+    assert reset_completed(conn, keyword_filter=keyword_match_sql(GROUPS)) == 1
+    rows = conn.execute("SELECT title FROM articles WHERE status = 'Yet To Process'").fetchall()
+    assert [r["title"] for r in rows] == ["Driver's EEG under fatigue"]
+
+
+def test_fts_index_is_built_for_existing_articles(tmp_path):
+    old = open_db(tmp_path / "old.db")
+    old.executescript("""
+        CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, doi TEXT, doi_hash TEXT NOT NULL,
+            title TEXT, abstract TEXT, raw_data TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'Yet To Process', machine_id TEXT, locked_at TEXT,
+            processed_at TEXT, output_file TEXT, error_message TEXT,
+            retry_count INTEGER NOT NULL DEFAULT 0);
+        INSERT INTO articles (doi_hash, title, raw_data) VALUES ('a', 'EEG of truck drivers', '{}');
+    """)
+    init_db(old)
+    assert _matching_titles(old) == ["EEG of truck drivers"]
+    old.close()
+
+
+def test_candidate_flags_follow_new_rows_and_changed_groups(conn):
+    from apm.chatgpt_ui.database import claim_rows, refresh_candidates
+
+    _add(conn, "EEG of bus drivers")
+    _add(conn, "Unrelated paper")
+    assert refresh_candidates(conn, GROUPS) == 1
+
+    _add(conn, "Driving with EEG headsets")                         # only new ids are matched
+    assert refresh_candidates(conn, GROUPS) == 2
+    claimed = claim_rows(conn, "m1", batch_size=5, max_retries=3, stale_lock_hours=2,
+                         keyword_filter="is_candidate = 1")
+    assert [r["title"] for r in claimed] == ["EEG of bus drivers", "Driving with EEG headsets"]
+
+    assert refresh_candidates(conn, [("Unrelated", ["unrelated"])]) == 1  # groups edited
+    flagged = [r[0] for r in conn.execute("SELECT title FROM articles WHERE is_candidate = 1")]
+    assert flagged == ["Unrelated paper"]
+
+
+def test_claim_rows_takes_each_claimable_status_in_id_order(conn):
+    from apm.chatgpt_ui.database import claim_rows
+
+    states = [("Completed", None, 0), ("Failed", None, 5), ("Yet To Process", None, 0),
+              ("Already Processing", "2000-01-01T00:00:00", 0),        # stale lock
+              ("Already Processing", "9999-01-01T00:00:00", 0),        # held lock
+              ("Failed", None, 1), ("Yet To Process", None, 0)]
+    for n, (status, locked_at, retries) in enumerate(states):
+        _add(conn, f"Paper {n}")
+        with conn:
+            conn.execute("UPDATE articles SET status = ?, locked_at = ?, retry_count = ? WHERE id = ?",
+                         (status, locked_at, retries, n + 1))
+
+    first = claim_rows(conn, "m1", batch_size=2, max_retries=3, stale_lock_hours=2)
+    rest = claim_rows(conn, "m2", batch_size=5, max_retries=3, stale_lock_hours=2)
+    assert [r["id"] for r in first] == [3, 4]
+    assert [r["id"] for r in rest] == [6, 7]
+    plan = " ".join(r[3] for r in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM articles WHERE status = 'Yet To Process' "
+        "AND is_candidate = 1 ORDER BY id LIMIT 5"))
+    assert "idx_claim" in plan and "TEMP B-TREE" not in plan
@@ -0,0 +1,106 @@
+"""Multi-tab ChatGPT processing — fake tabs and responses, no Chrome required."""
+
+import json
+
+import pytest
+
+import apm.chatgpt_ui.processor as processor
+from apm.chatgpt_ui.config import Config, InputConfig, OutputConfig, ProcessingConfig, SeleniumConfig
+from apm.chatgpt_ui.database import claim_rows, init_db, open_db
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    def __init__(self):
+        self.current_window_handle = "tab1"
+        self.switch_to = FakeSwitch(self)
+
+
+class FakePending:
+    """Answers after a few polls; titles starting with 'empty' never get an answer."""
+
+    in_flight = 0
+    max_in_flight = 0
+    sent: list[str] = []
+
+    def __init__(self, driver, prompt, wait_seconds=120, handle=None):
+        self.title = prompt.split("Title: ")[1].splitlines()[0]
+        self.polls = 3
+        FakePending.sent.append(self.title)
+        FakePending.in_flight += 1
+        FakePending.max_in_flight = max(FakePending.max_in_flight, FakePending.in_flight)
+
+    def poll(self):
+        self.polls -= 1
+        if self.polls:
+            return None
+        FakePending.in_flight -= 1
+        return "" if self.title.startswith("empty") else json.dumps({"title": self.title})
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setattr(processor, "PendingResponse", FakePending)
+    monkeypatch.setattr(processor, "navigate_to_new_chat", lambda driver: None)
+    monkeypatch.setattr(processor, "_RETRY_PAUSE", 0)
+    monkeypatch.setattr(processor, "_POLL_PAUSE", 0)
+    FakePending.in_flight = FakePending.max_in_flight = 0
+    FakePending.sent = []
+
+    cfg = Config(
+        project_root=str(tmp_path),
+        input=InputConfig(master_file="master.csv", prompt_file="prompt.txt"),
+        output=OutputConfig(json_output_folder="out"),
+        processing=ProcessingConfig(machine_id="m1"),
+        selenium=SeleniumConfig(per_row_retries=2),
+    )
+    conn = open_db(tmp_path / "articles.db")
+    init_db(conn)
+
+    def claim(titles):
+        with conn:
+            conn.executemany(
+                "INSERT INTO articles (doi_hash, title, raw_data) VALUES (?, ?, '{}')",
+                [(f"h{i}", t) for i, t in enumerate(titles)],
+            )
+        return claim_rows(conn, "m1", batch_size=len(titles), max_retries=3, stale_lock_hours=2)
+
+    yield conn, cfg, claim
+    conn.close()
+
+
+def _statuses(conn):
+    return dict(conn.execute("SELECT title, status FROM articles").fetchall())
+
+
+def test_rows_are_spread_over_tabs_and_all_completed(setup):
+    conn, cfg, claim = setup
+    rows = claim([f"Paper {i}" for i in range(7)])
+
+    done = processor.process_rows_in_tabs(conn, FakeDriver(), cfg, rows, "Screen:", ["t1", "t2", "t3"])
+
+    assert done == (7, 0)
+    assert FakePending.max_in_flight == 3
+    assert FakePending.sent == [f"Paper {i}" for i in range(7)]
+    assert set(_statuses(conn).values()) == {"Completed"}
+    saved = json.loads((cfg.output_path / "h4.json").read_text(encoding="utf-8"))
+    assert saved["chatgpt_response"]["parsed_json"] == {"title": "Paper 4"}
+
+
+def test_exhausted_row_stops_new_rows_but_finishes_those_underway(setup):
+    conn, cfg, claim = setup
+    rows = claim(["empty response", "Paper 1", "Paper 2", "Paper 3"])
+
+    done = processor.process_rows_in_tabs(conn, FakeDriver(), cfg, rows, "Screen:", ["t1", "t2"])
+
+    assert done == (2, 1)
+    assert FakePending.sent.count("empty response") == 2
+    assert _statuses(conn) == {"empty response": "Failed", "Paper 1": "Completed",
+                               "Paper 2": "Completed", "Paper 3": "Already Processing"}
@@ -0,0 +1,168 @@
+"""Citation-discovery runs against a fake Scopus (checkpoints, background ingest) — no Chrome required."""
+
+import csv
+import json
+
+import pytest
+
+import scopus_automation.cited_by as cited_by
+import scopus_automation.driver_pool as driver_pool
+from pipeline.checkpoint import CHECKPOINT_FILENAME, RunCheckpoint
+from pipeline.citation_discovery import run_citation_discovery
+from pipeline.config import PipelineConfig
+from scopus_automation.ris import parse_ris_file, write_ris_file
+
+PARENT_IDS = [f"8500000000{i}" for i in range(1, 6)]
+
+
+def test_checkpoint_flushes_every_n_and_reloads(tmp_path):
+    cp = RunCheckpoint(tmp_path, every=2, interval_sec=3600)
+    cp.record("1", {"cited_by_ris_file": "a.ris"})
+    assert not cp.path.exists()
+    cp.record("2", {"cited_by_ris_file": "b.ris"})
+    assert len(cp.path.read_text().splitlines()) == 2
+
+    cp.record("3", {"cited_by_ris_file": "c.ris"})
+    cp.flush()
+    with cp.path.open("a") as fh:
+        fh.write('{"scopus_id": "4", "resu')  # crash mid-write
+
+    again = RunCheckpoint(tmp_path)
+    assert again.load() == 3
+    assert again.get("3") == {"cited_by_ris_file": "c.ris"}
+    again.remove()
+    assert not again.path.exists()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, driver_factory):
+    """Five parents in a Zotero CSV; Scopus returns two citing papers per parent."""
+    parents = tmp_path / "parents.csv"
+    with parents.open("w", newline="", encoding="utf-8") as fh:
+        w = csv.DictWriter(fh, fieldnames=["Key", "Title", "Publication Year", "Url"])
+        w.writeheader()
+        for n, pid in enumerate(PARENT_IDS):
+            w.writerow({"Key": f"K{n}", "Title": f"Parent paper {n}", "Publication Year": "2015",
+                        "Url": f"https://www.scopus.com/pages/publications/{pid}"})
+
+    calls = []
+    crash_at = {"paper": None}
+
+    def _download_cited_by(driver, paper_link, config, output_dir=None, **kwargs):
+        pid = paper_link.rsplit("/", 1)[-1]
+        if pid == crash_at["paper"]:
+            raise KeyboardInterrupt  # the run dies mid-loop
+        calls.append(pid)
+        ris = output_dir / f"{pid}_cited_by.ris"
+        write_ris_file([{"TY": "JOUR", "TI": f"Citing {pid} {k}", "PY": "2020",
+                         "DO": f"10.9/{pid}.{k}"} for k in range(2)], ris)
+        return {"paper_id": pid, "cited_by_downloaded": True, "cited_by_ris_file": str(ris),
+                "cited_by_result_count": 2, "cited_by_error": "", "skipped": False}
+
+    monkeypatch.setattr(cited_by, "download_cited_by", _download_cited_by)
+    monkeypatch.setattr(driver_pool, "_default_factory", driver_factory)
+
+    cfg = PipelineConfig()
+    cfg.input.csv_path = str(parents)
+    cfg.master_list.path = str(tmp_path / "master.csv")
+    cfg.output.directory = str(tmp_path / "out")
+    cfg.scopus_config_path = str(tmp_path / "scopus_config.json")
+    cfg.run.checkpoint_every = 1
+    return cfg, calls, crash_at
+
+
+def test_crashed_run_resumes_without_requerying(tmp_path, project):
+    cfg, calls, crash_at = project
+
+    crash_at["paper"] = PARENT_IDS[3]
+    with pytest.raises(KeyboardInterrupt):
+        run_citation_discovery(cfg, base_dir=tmp_path)
+    checkpoint = tmp_path / "out" / CHECKPOINT_FILENAME
+    assert [json.loads(l)["scopus_id"] for l in checkpoint.read_text().splitlines()] == PARENT_IDS[:3]
+
+    crash_at["paper"] = None
+    summary = run_citation_discovery(cfg, base_dir=tmp_path)
+
+    assert calls == PARENT_IDS  # parents 1-3 were queried once, by the crashed run
+    assert summary.new_references_exported == 2 * len(PARENT_IDS)
+    exported = parse_ris_file(summary.ris_output_path)
+    assert {e["TI"] for e in exported} == {f"Citing {p} {k}" for p in PARENT_IDS for k in range(2)}
+    assert not checkpoint.exists()
+
+
+def test_resume_false_discards_checkpoint(tmp_path, project):
+    cfg, calls, crash_at = project
+    crash_at["paper"] = PARENT_IDS[2]
+    with pytest.raises(KeyboardInterrupt):
+        run_citation_discovery(cfg, base_dir=tmp_path)
+
+    crash_at["paper"] = None
+    cfg.run.resume = False
+    run_citation_discovery(cfg, base_dir=tmp_path)
+    assert calls == PARENT_IDS[:2] + PARENT_IDS
+
+
+def test_unreadable_ris_fails_the_run_after_the_scopus_loop(tmp_path, project, monkeypatch):
+    cfg, calls, _ = project
+    real = cited_by.download_cited_by
+
+    def _corrupt_second(driver, paper_link, config, output_dir=None, **kwargs):
+        result = real(driver, paper_link, config, output_dir, **kwargs)
+        if paper_link.endswith(PARENT_IDS[1]):
+            result["cited_by_ris_file"] = str(tmp_path)  # a directory: cannot be parsed
+        return result
+
+    monkeypatch.setattr(cited_by, "download_cited_by", _corrupt_second)
+    with pytest.raises(OSError):
+        run_citation_discovery(cfg, base_dir=tmp_path)
+    assert calls == PARENT_IDS  # the background parse error did not stop the queries
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_over_cap_parent_keeps_query_order_and_merge_result(tmp_path, project, monkeypatch, workers):
+    import pandas as pd
+
+    cfg, _, _ = project
+    sliced = []
+
+    def _download(driver, paper_link, config, output_dir=None, split_over_cap=True, **kwargs):
+        pid = paper_link.rsplit("/", 1)[-1]
+        capped = pid == PARENT_IDS[1] and cap["on"]
+        if capped and not split_over_cap:
+            return {"paper_id": pid, "cited_by_downloaded": False, "cited_by_ris_file": "",
+                    "cited_by_result_count": 9000, "cited_by_error": "Over export cap",
+                    "skipped": False, "over_cap": True}
+        if capped:
+            sliced.append(pid)
+        ris = output_dir / f"{pid}_cited_by.ris"
+        # every parent is also cited by one shared paper: the first parent to
+        # reach the merge is the one recorded on its master-list row
+        write_ris_file([{"TY": "JOUR", "TI": f"Citing {pid}", "PY": "2020", "DO": f"10.9/{pid}"},
+                        {"TY": "JOUR", "TI": "Shared citing paper", "PY": "2021", "DO": "10.9/shared"}],
+                       ris)
+        return {"paper_id": pid, "cited_by_downloaded": True, "cited_by_ris_file": str(ris),
+                "cited_by_result_count": 2, "cited_by_error": "", "skipped": False}
+
+    monkeypatch.setattr(cited_by, "download_cited_by", _download)
+    cfg.run.scopus_workers = workers
+    cap = {"on": False}
+
+    def _run(name):
+        cfg.master_list.path = str(tmp_path / f"{name}.csv")
+        cfg.output.directory = str(tmp_path / name)
+        cfg.run.checkpoint_every = 100  # keep the checkpoint to read it back
+        run_citation_discovery(cfg, base_dir=tmp_path)
+        master = pd.read_csv(tmp_path / f"{name}.csv", dtype=str, encoding="utf-8-sig")
+        master = master.apply(lambda col: col.str.replace(f"/{name}/", "/run/", regex=False))
+        status = pd.read_csv(next((tmp_path / name).glob("*status*.csv")), dtype=str)
+        # child record ids are random; everything else must match
+        return master.drop(columns=["record_id", "children_last_run_at", "date_added_to_master"],
+                           errors="ignore"), status["record_id"].tolist()
+
+    expected_master, expected_order = _run("uncapped")
+    cap["on"] = True
+    master, order = _run("capped")
+
+    assert sliced == [PARENT_IDS[1]]
+    assert order == expected_order == [f"K{n}" for n in range(len(PARENT_IDS))]
+    pd.testing.assert_frame_equal(master, expected_master)
@@ -0,0 +1,115 @@
+"""Unit tests for cited-by caching and incremental refresh — no Chrome required."""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import scopus_automation.cited_by as cited_by
+from scopus_automation.cited_by_cache import CitedByCache, CitedByEntry, incremental_query
+from scopus_automation.config import ScopusConfig
+from scopus_automation.ris import parse_ris_file, write_ris_file
+
+LINK = "https://www.scopus.com/pages/publications/85000000001"
+
+
+def _entry(n: int, year: int = 2020) -> dict:
+    return {"TY": "JOUR", "TI": f"Citing paper {n}", "PY": str(year), "DO": f"10.1/c{n}"}
+
+
+@pytest.fixture
+def fake_scopus(monkeypatch):
+    """search_and_export stand-in: exports the configured entries for any query."""
+    calls = []
+
+    def _search_and_export(driver, query, config, output_dir=None, **kwargs):
+        calls.append(query)
+        entries = fake_scopus.entries
+        if not entries:
+            return {"query": query, "result_count": 0, "ris_file": None, "error": "No results"}
+        ris = output_dir / "refeid_export.ris"
+        write_ris_file(entries, ris)
+        return {"query": query, "result_count": len(entries), "ris_file": str(ris)}
+
+    fake_scopus = _search_and_export
+    fake_scopus.calls = calls
+    fake_scopus.entries = []
+    monkeypatch.setattr(cited_by, "search_and_export", _search_and_export)
+    return fake_scopus
+
+
+def _age(cache: CitedByCache, paper_id: str, days: float) -> None:
+    entry = cache.get(paper_id)
+    cache.record(paper_id, entry.result_count, entry.ris_file, entry.mode,
+                 fetched_at=(datetime.now() - timedelta(days=days)).isoformat())
+
+
+def test_incremental_query_restricts_to_last_fetch_year():
+    entry = CitedByEntry("2024-03-05T10:00:00", 12, "x.ris")
+    assert incremental_query("REFEID(2-s2.0-1)", entry) == "REFEID(2-s2.0-1) AND PUBYEAR > 2023"
+
+
+def test_fresh_cache_skips_stale_cache_merges_new_citations(tmp_path, fake_scopus):
+    cfg = ScopusConfig()
+    cache = CitedByCache.in_dir(tmp_path)
+
+    fake_scopus.entries = [_entry(1), _entry(2)]
+    first = cited_by.download_cited_by(None, LINK, cfg, tmp_path, cache=cache, max_age_days=30)
+    assert first["cited_by_result_count"] == 2
+    assert fake_scopus.calls == ["REFEID(2-s2.0-85000000001)"]
+
+    # younger than max_age_days: not queried
+    again = cited_by.download_cited_by(None, LINK, cfg, tmp_path, cache=cache, max_age_days=30)
+    assert again["skipped"] and again["cited_by_result_count"] == 2
+    assert len(fake_scopus.calls) == 1
+
+    # stale: PUBYEAR-restricted query, new record merged, overlap dropped
+    _age(cache, "85000000001", 40)
+    fake_scopus.entries = [_entry(2), _entry(3, 2025)]
+    refreshed = cited_by.download_cited_by(None, LINK, cfg, tmp_path, cache=cache, max_age_days=30)
+    assert "AND PUBYEAR >" in fake_scopus.calls[-1]
+    assert refreshed["cited_by_result_count"] == 3
+    assert refreshed["cited_by_new"] == 1
+    titles = [e["TI"] for e in parse_ris_file(tmp_path / "85000000001_cited_by.ris")]
+    assert titles == ["Citing paper 1", "Citing paper 2", "Citing paper 3"]
+    assert not list(tmp_path.glob("*.delta.ris"))
+
+    saved = json.loads((tmp_path / "cited_by_cache.json").read_text())
+    assert saved["85000000001"]["result_count"] == 3
+    assert saved["85000000001"]["mode"] == "incremental"
+
+
+def test_stale_refresh_with_no_new_results_keeps_cached_ris(tmp_path, fake_scopus):
+    cfg = ScopusConfig()
+    ris = tmp_path / "85000000001_cited_by.ris"
+    write_ris_file([_entry(1), _entry(2)], ris)
+    old = time.time() - 90 * 86400
+    os.utime(ris, (old, old))  # downloaded before the cache existed
+
+    cache = CitedByCache.in_dir(tmp_path)
+    assert cache.is_stale("85000000001", ris, 30)
+    result = cited_by.download_cited_by(None, LINK, cfg, tmp_path, cache=cache, max_age_days=30)
+
+    assert result["cited_by_downloaded"] and result["cited_by_new"] == 0
+    assert result["cited_by_result_count"] == 2
+    assert len(parse_ris_file(ris)) == 2
+    assert not CitedByCache.in_dir(tmp_path).is_stale("85000000001", ris, 30)
+
+
+def test_force_downloads_in_full(tmp_path, fake_scopus):
+    cfg = ScopusConfig()
+    cache = CitedByCache.in_dir(tmp_path)
+    fake_scopus.entries = [_entry(1)]
+    cited_by.download_cited_by(None, LINK, cfg, tmp_path, cache=cache)
+    _age(cache, "85000000001", 400)
+
+    fake_scopus.entries = [_entry(5)]
+    result = cited_by.download_cited_by(None, LINK, cfg, tmp_path, force=True,
+                                        cache=cache, max_age_days=30)
+    assert "PUBYEAR" not in fake_scopus.calls[-1]
+    assert result["cited_by_result_count"] == 1
+    assert cache.get("85000000001").mode == "full"
+    assert [e["TI"] for e in parse_ris_file(Path(result["cited_by_ris_file"]))] == ["Citing paper 5"]
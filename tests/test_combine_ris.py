@@ -8,6 +8,7 @@ import pytest
 from scopus_automation.ris import _parse_ris_manual
 from scopus_automation.dedupe import (
     deduplicate,
+    iter_deduplicate,
     combine_ris_directory,
     _normalise_doi,
     _normalise_title,
@@ -173,6 +174,55 @@ def test_combine_ris_directory(tmp_path):
     assert report.exists()
 
 
+def test_iter_deduplicate_streams_unique_entries():
+    entries = _parse_ris_manual(SAMPLE_RIS_1) + _parse_ris_manual(SAMPLE_RIS_2)
+    sources = ["a.ris"] * 1 + ["b.ris"] * (len(entries) - 1)
+    report: list[dict] = []
+    stream = iter_deduplicate(zip(entries, sources), report)
+    assert next(stream) is entries[0]
+    assert report == []
+    unique = [entries[0], *stream]
+    assert (unique, report) == deduplicate(entries, sources)
+    assert report[0]["kept_source_file"] == "a.ris"
+
+
+def test_combine_ris_output_inside_input_dir(tmp_path):
+    from scopus_automation.ris import parse_ris_file
+
+    (tmp_path / "a.ris").write_text(SAMPLE_RIS_1, encoding="utf-8")
+    (tmp_path / "b.ris").write_text(SAMPLE_RIS_2, encoding="utf-8")
+    out = tmp_path / "combined.ris"
+    assert combine_ris_directory(tmp_path, out) == (2, 1)
+    # a second run re-reads the earlier combined file as one of its inputs
+    assert combine_ris_directory(tmp_path, out)[0] == 2
+    assert len(parse_ris_file(out)) == 2
+    assert not (tmp_path / "combined.ris.tmp").exists()
+
+
+def test_combine_ris_parallel_matches_serial(tmp_path, caplog):
+    import logging
+    from scopus_automation.ris import write_ris_file
+
+    src = tmp_path / "in"
+    for i in range(12):
+        # every file repeats the previous file's DOI, so keep order matters
+        write_ris_file([
+            {"TY": "JOUR", "TI": f"Paper {i}", "DO": f"10.1/{i}", "PY": "2024"},
+            {"TY": "JOUR", "TI": f"Repeat {i}", "DO": f"10.1/{max(i - 1, 0)}", "PY": "2024"},
+        ], src / f"parent_{i:02d}" / "cited_by.ris")
+
+    serial = tmp_path / "serial"
+    assert combine_ris_directory(src, serial / "c.ris") == (12, 12)
+    parallel = tmp_path / "parallel"
+    with caplog.at_level(logging.DEBUG, logger="scopus_automation.dedupe"):
+        assert combine_ris_directory(src, parallel / "c.ris", workers=3) == (12, 12)
+
+    for name in ("c.ris", "duplicates_report.csv"):
+        assert (parallel / name).read_bytes() == (serial / name).read_bytes()
+    assert sum("Parsed " in m and "entries in" in m for m in caplog.messages) == 12
+    assert any("slowest:" in m and "on 3 process(es)" in m for m in caplog.messages)
+
+
 def test_combine_ris_no_files_raises(tmp_path):
     empty = tmp_path / "empty"
     empty.mkdir()
@@ -0,0 +1,203 @@
+"""Unit tests for the pipeline dedup engine — no Scopus login required."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pipeline.dedup_engine import StreamingDeduplicator, deduplicate_references
+from pipeline.fuzzy_title import TitleLSH, jaccard, shingles
+from pipeline.master_list import MasterList
+from pipeline.models import Reference, _norm_title
+
+
+MASTER_TITLES = [
+    "Driver drowsiness detection using EEG spectral features",
+    "A deep convolutional network for mental fatigue classification",
+    "Vigilance decrement in long haul truck drivers",
+    "Editorial",
+]
+
+
+@pytest.fixture
+def master_list(tmp_path: Path) -> MasterList:
+    path = tmp_path / "master.csv"
+    pd.DataFrame({
+        "Title": MASTER_TITLES,
+        "Publication Year": ["2020", "2021", "2019", "2022"],
+        "Author": ["Lee, A.", "Kim, B.", "Ng, C.", "Roe, D."],
+        "DOI": ["10.1/a", "10.1/b", "", ""],
+    }).to_csv(path, index=False, encoding="utf-8-sig")
+    return MasterList.load(path, index_sidecar=False)
+
+
+# ---------------------------------------------------------------------------
+# Title LSH index
+# ---------------------------------------------------------------------------
+
+def test_lsh_query_matches_exact_jaccard():
+    titles = [_norm_title(t) for t in MASTER_TITLES]
+    index = TitleLSH()
+    index.add_many(enumerate(titles))
+
+    query = _norm_title("Driver drowsiness detection using EEG spectral feature")
+    hit = index.query(query)
+    assert hit is not None
+    assert hit[0] == 0
+    assert hit[1] == pytest.approx(jaccard(shingles(query), shingles(titles[0])))
+
+
+def test_lsh_ignores_short_and_dissimilar_titles():
+    index = TitleLSH()
+    index.add_many(enumerate(_norm_title(t) for t in MASTER_TITLES))
+    assert index.query("editorial") is None
+    assert index.query(_norm_title("Sleep staging with wearable photoplethysmography")) is None
+
+
+def test_lsh_bulk_and_incremental_adds_agree():
+    titles = [_norm_title(t) for t in MASTER_TITLES]
+    bulk, single = TitleLSH(), TitleLSH()
+    bulk.add_many(enumerate(titles))
+    for i, t in enumerate(titles):
+        single.add(i, t)
+    query = _norm_title("A deep convolutional network for mental-fatigue classifications")
+    assert bulk.query(query) == single.query(query)
+    assert bulk.query(query)[0] == 1
+
+
+# ---------------------------------------------------------------------------
+# Rule 8: fuzzy titles
+# ---------------------------------------------------------------------------
+
+def test_fuzzy_rule_off_by_default(master_list):
+    ref = Reference(title="Driver drowsiness detection using EEG spectral feature", year="2024")
+    assert deduplicate_references([ref], master_list).new_count == 1
+
+
+def test_fuzzy_rule_matches_master_list(master_list):
+    refs = [
+        Reference(title="Driver drowsiness detection using EEG spectral feature", year="2024"),
+        Reference(title="A Deep Convolutional Network for Mental–Fatigue Classification", year="2023"),
+        Reference(title="Something completely different about sleep apnoea", year="2023"),
+    ]
+    result = deduplicate_references(refs, master_list, fuzzy_titles=True)
+
+    assert [r.title for r in result.new_references] == [refs[2].title]
+    assert [d["matched_rule"] for d in result.duplicates] == ["fuzzy_title", "fuzzy_title"]
+    assert all(d["duplicate_of"] == "master_list" for d in result.duplicates)
+    first = result.duplicates[0]
+    assert first["matched_fingerprint"] == f"fuzzy_title:{_norm_title(MASTER_TITLES[0])}"
+    assert 0.8 <= float(first["similarity"]) < 1.0
+
+
+def test_fuzzy_rule_within_batch(master_list):
+    refs = [
+        Reference(title="Heart rate variability markers of cognitive workload", year="2024"),
+        Reference(title="Heart rate variability marker of cognitive workload", year="2025"),
+    ]
+    result = deduplicate_references(refs, master_list, fuzzy_titles=True)
+    assert result.new_count == 1
+    assert result.duplicates[0]["duplicate_of"] == "batch[0]"
+
+
+def test_exact_rules_take_priority_and_threshold_applies(master_list):
+    refs = [
+        Reference(title="Unrelated title that is long enough", doi="10.1/a"),
+        Reference(title="Vigilance decrement in long haul truck drivers: a field study", year="2024"),
+    ]
+    result = deduplicate_references(refs, master_list, fuzzy_titles=True, fuzzy_threshold=0.95)
+    assert result.duplicates[0]["matched_rule"] == "doi"
+    assert result.duplicates[0]["similarity"] == ""
+    assert result.new_count == 1
+
+    lenient = deduplicate_references(refs[1:], master_list, fuzzy_titles=True, fuzzy_threshold=0.6)
+    assert lenient.duplicates[0]["matched_rule"] == "fuzzy_title"
+
+
+def test_title_index_follows_master_list_additions(master_list):
+    master_list._get_title_index()
+    master_list.bulk_add_or_update([
+        Reference(title="Heart rate variability markers of cognitive workload", year="2024"),
+    ])
+    ref = Reference(title="Heart rate variability marker of cognitive workload", year="2025")
+    result = deduplicate_references([ref], master_list, fuzzy_titles=True)
+    assert result.duplicates[0]["duplicate_of"] == "master_list"
+
+
+# ---------------------------------------------------------------------------
+# Parallel fingerprinting
+# ---------------------------------------------------------------------------
+
+def _batch(n: int) -> list[Reference]:
+    refs = []
+    for i in range(n):
+        # every third ref repeats an earlier DOI, every fifth an earlier title
+        doi = f"10.9/{i // 3}" if i % 3 == 0 else ""
+        title = f"Batch paper about EEG fatigue number {i // 5 if i % 5 == 0 else i}"
+        refs.append(Reference(
+            record_id=f"R{i}", title=title, year="2024", doi=doi, authors=["Lee, A."],
+        ))
+    refs.append(Reference(record_id="R-last", title=MASTER_TITLES[0], year="2020", doi="10.1/a"))
+    return refs
+
+
+@pytest.mark.parametrize("fuzzy", [False, True])
+def test_parallel_matches_serial(master_list, fuzzy):
+    # fresh references for each run so the pool cannot reuse memoised fingerprints
+    serial = deduplicate_references(_batch(120), master_list, fuzzy_titles=fuzzy)
+    refs = _batch(120)
+    parallel = deduplicate_references(
+        refs, master_list, fuzzy_titles=fuzzy, workers=2, chunk_size=25,
+    )
+    assert parallel.new_references == serial.new_references
+    assert parallel.duplicates == serial.duplicates
+    assert serial.duplicate_count > 0
+    assert all(ref._fingerprints is not None for ref in refs)
+
+
+@pytest.mark.parametrize("fuzzy", [False, True])
+def test_streaming_batches_match_one_shot(master_list, fuzzy):
+    whole = deduplicate_references(_batch(120), master_list, fuzzy_titles=fuzzy)
+    refs = _batch(120)
+    stream = StreamingDeduplicator(master_list, fuzzy_titles=fuzzy)
+    for start in range(0, len(refs), 17):  # one batch per "parent"
+        stream.add(refs[start:start + 17])
+    result = stream.finish()
+
+    assert result.new_references == whole.new_references
+    assert result.duplicates == whole.duplicates
+    assert (result.total_input, result.new_count) == (whole.total_input, whole.new_count)
+
+
+# ---------------------------------------------------------------------------
+# Memoised reference fingerprints
+# ---------------------------------------------------------------------------
+
+def test_fingerprints_memoised_until_identity_changes(monkeypatch):
+    import pipeline.master_list as ml_mod
+
+    calls = []
+    real = ml_mod._key_fingerprints
+    monkeypatch.setattr(ml_mod, "_key_fingerprints", lambda key: calls.append(key) or real(key))
+
+    ref = Reference(title="Some Title", year="2020", doi="10.5/x", authors=["Lee, A."])
+    first = ml_mod._reference_fingerprints(ref)
+    assert ml_mod._reference_fingerprints(ref) is first
+    assert len(calls) == 1
+
+    ref.doi = "10.5/y"
+    assert "doi:10.5/y" in ml_mod._reference_fingerprints(ref)
+    ref.authors[0] = "Kim, B."  # in-place edits invalidate too
+    assert "title_author:some title|kim" in ml_mod._reference_fingerprints(ref)
+    assert len(calls) == 3
+
+
+def test_lookups_reuse_memoised_fingerprints(master_list, monkeypatch):
+    import pipeline.master_list as ml_mod
+
+    ref = Reference(title="Another title", doi="10.1/b")
+    deduplicate_references([ref], master_list)
+    monkeypatch.setattr(ml_mod, "_key_fingerprints", lambda key: pytest.fail("recomputed"))
+    assert master_list.find_row_index(ref) == 1
+    assert master_list.is_duplicate(ref) == (True, "doi:10.1/b")
+    master_list.mark_parent_processed(ref, 1, 0, "2026-01-01T00:00:00")
@@ -0,0 +1,96 @@
+"""Unit tests for the Scopus driver pool — fake drivers, no Chrome required."""
+
+import random
+import threading
+import time
+
+import pytest
+
+import scopus_automation.browser as browser_mod
+from scopus_automation.driver_pool import DriverPool, worker_download_dir
+
+
+def _query(worker, item):
+    """Stand-in for download_cited_by: slow, variable, touches its download dir."""
+    time.sleep(random.uniform(0, 0.02))
+    (worker.download_dir / f"{item}.ris").write_text(worker.driver.name)
+    return (item, worker.index, threading.current_thread().name)
+
+
+def test_worker_download_dirs(tmp_path):
+    assert worker_download_dir(tmp_path / "raw", 0) == tmp_path / "raw"
+    assert worker_download_dir(tmp_path / "raw", 2) == tmp_path / "raw.worker2"
+
+
+def test_results_in_input_order_across_workers(tmp_path, driver_factory):
+    items = list(range(40))
+    with DriverPool(None, tmp_path / "raw", size=4, driver_factory=driver_factory) as pool:
+        results = list(pool.map(_query, items))
+        rows = pool.status_rows()
+
+    assert [r[0] for r in results] == items
+    assert {r[1] for r in results} == {0, 1, 2, 3}
+    assert sorted(i for i, _ in driver_factory.built) == [0, 1, 2, 3]
+    assert len({d for _, d in driver_factory.built}) == 4
+    # every file landed in the download dir of the worker that ran it
+    for item, index, _ in results:
+        assert (worker_download_dir(tmp_path / "raw", index) / f"{item}.ris").exists()
+    assert sum(r["tasks"] for r in rows) == 40
+    assert all(r["errors"] == 0 for r in rows)
+
+
+def test_single_driver_runs_in_calling_thread(tmp_path, fake_driver):
+    primary = fake_driver
+    pool = DriverPool(None, tmp_path / "raw", primary=primary).start()
+    results = list(pool.map(_query, ["a", "b"]))
+    pool.close()
+
+    assert [r[2] for r in results] == [threading.current_thread().name] * 2
+    assert primary.download_dirs == [(tmp_path / "raw").resolve()]
+    assert not primary.quit_called  # the caller owns the primary driver
+
+
+def test_errors_counted_and_reraised_in_order(tmp_path, driver_factory):
+    seen = []
+
+    def _fail_on_3(worker, item):
+        if item == 3:
+            raise RuntimeError("boom")
+        return item
+
+    pool = DriverPool(None, tmp_path / "raw", size=2, driver_factory=driver_factory).start()
+    with pytest.raises(RuntimeError, match="boom"):
+        for r in pool.map(_fail_on_3, range(6)):
+            seen.append(r)
+    assert seen == [0, 1, 2]
+    assert sum(r["errors"] for r in pool.status_rows()) == 1
+    drivers = [w.driver for w in pool.workers]
+    pool.close()
+    assert all(d.quit_called for d in drivers)
+
+
+def test_retarget_moves_every_worker(tmp_path, driver_factory, fake_driver):
+    primary = fake_driver
+    pool = DriverPool(None, tmp_path / "gen1", size=2, primary=primary,
+                      driver_factory=driver_factory).start()
+    pool.retarget(tmp_path / "gen2")
+    assert [w.download_dir for w in pool.workers] == [tmp_path / "gen2", tmp_path / "gen2.worker1"]
+    assert primary.download_dirs[-1] == (tmp_path / "gen2").resolve()
+    assert driver_factory.built == [(1, tmp_path / "gen1.worker1")]
+    pool.close()
+
+
+def test_worker_profiles_are_cloned(tmp_path, monkeypatch):
+    from scopus_automation.driver_pool import worker_profile_dir
+
+    base = tmp_path / "chrome-profile"
+    (base / "Default").mkdir(parents=True)
+    (base / "Default" / "Cookies").write_text("session")
+    (base / "SingletonLock").write_text("")
+    monkeypatch.setattr(browser_mod, "SELENIUM_PROFILE_DIR", str(base))
+
+    assert worker_profile_dir(0) == base
+    clone = worker_profile_dir(2)
+    assert clone == tmp_path / "chrome-profile-worker2"
+    assert (clone / "Default" / "Cookies").read_text() == "session"
+    assert not (clone / "SingletonLock").exists()
@@ -0,0 +1,106 @@
+"""Unit tests for the shared normalisation/fingerprint module — no Scopus login required."""
+
+import pandas as pd
+
+from pipeline.master_list import _frame_fingerprint_columns, _key_fingerprints
+from pipeline.models import Reference
+from scopus_automation.fingerprint import (
+    RULE_NAMES,
+    normalise_doi,
+    normalise_dois,
+    normalise_title,
+    normalise_titles,
+    ris_dedup_key,
+    ris_dedup_keys,
+    ris_fingerprint,
+    ris_fingerprints_many,
+    rule_fingerprints,
+    rule_fingerprints_many,
+)
+from scopus_automation.ris import compare_ris_sets
+
+
+ENTRY = {
+    "TY": "JOUR",
+    "TI": "EEG-based  Fatigue Detection: A Study!",
+    "AU": ["Lee, Alice", "Kim, Bo"],
+    "PY": "2024///",
+    "DO": "https://doi.org/10.1111/ABC.1",
+    "N1": "Export Date: 1 Jan 2025; Scopus EID 2-s2.0-85012345678",
+}
+
+
+def test_scalar_normalisation():
+    assert normalise_doi(" http://dx.doi.org/10.1/X ") == "10.1/x"
+    assert normalise_title("  EEG-based\tFatigue,  Detection!") == "eegbased fatigue detection"
+
+
+def test_rule_fingerprints_order_and_blanks():
+    fps = rule_fingerprints(
+        doi="10.1/A", eid="2-s2.0-1", scopus_id="1", pmid="x", isbn="978-0 1",
+        title="A Title", year="c. 2020", first_author="O'Neil, P.",
+    )
+    assert len(fps) == len(RULE_NAMES)
+    assert fps == (
+        "doi:10.1/a", "eid:2-s2.0-1", "scopus_id:1", "", "isbn:97801",
+        "title_year:a title|2020", "title_author:a title|oneil",
+    )
+    assert rule_fingerprints() == ("",) * len(RULE_NAMES)
+
+
+def test_batch_apis_match_scalar():
+    titles = ["A: b", "A: b", "C  d", ""]
+    assert normalise_titles(titles) == [normalise_title(t) for t in titles]
+    assert normalise_dois(["DOI.org", " 10.1/A"]) == [normalise_doi(d) for d in ["DOI.org", " 10.1/A"]]
+    entries = [ENTRY, {"TI": "Only a title", "PY": "2020"}, {"TY": "JOUR"}]
+    assert ris_dedup_keys(entries) == [ris_dedup_key(e) for e in entries]
+    assert ris_fingerprints_many(entries) == [ris_fingerprint(e) for e in entries]
+    keys = [("10.1/a", "", "", "", "", "T", "2020", "Lee, A.")] * 2
+    assert rule_fingerprints_many(keys) == [rule_fingerprints(*k) for k in keys]
+
+
+def test_entry_points_agree_on_a_ris_entry():
+    ref = Reference.from_ris_entry(ENTRY)
+    ref_fps = _key_fingerprints(ref.identity_key())
+    assert ris_dedup_key(ENTRY) == ("doi", "10.1111/abc.1")
+    assert ris_fingerprint(ENTRY) == ref_fps[0] == "doi:10.1111/abc.1"
+    assert ref_fps[1] == "eid:2-s2.0-85012345678"
+
+    no_doi = {k: v for k, v in ENTRY.items() if k not in ("DO", "N1")}
+    ref = Reference.from_ris_entry(no_doi)
+    assert ris_fingerprint(no_doi) == _key_fingerprints(ref.identity_key())[5]
+    assert ris_dedup_key(no_doi) == ("title_year", "eegbased fatigue detection a study|2024")
+
+
+def test_frame_builders_match_scalar_rules():
+    rows = {
+        "DOI": ["https://doi.org/10.1/A", "", None],
+        "scopus_eid": ["2-s2.0-9", "x", ""],
+        "scopus_id": ["9", "9a", ""],
+        "pmid": ["", "123", ""],
+        "ISBN": ["978-1 2", "", ""],
+        "Title": ["EEG: Study", "Another   paper", ""],
+        "Publication Year": ["2020", "n.d.", "2021"],
+        "Author": ["O'Neil, P.; Lee, A.", "", "Kim, B."],
+    }
+    df = pd.DataFrame(rows, dtype=object)
+    columns = _frame_fingerprint_columns(df)
+    for i in range(len(df)):
+        expected = rule_fingerprints(*(
+            "" if df.at[i, c] is None else df.at[i, c]
+            for c in ["DOI", "scopus_eid", "scopus_id", "pmid", "ISBN",
+                      "Title", "Publication Year", "Author"]
+        ))
+        assert tuple(col.iat[i] for col in columns) == expected
+
+
+def test_compare_ris_sets_uses_shared_title_normalisation():
+    expected = [{"TI": "EEG-based fatigue detection"}, {"DO": "10.1/X"}]
+    actual = [{"TI": "EEG based  fatigue detection."}, {"DO": "https://doi.org/10.1/x"}]
+    matched, missing, extra = compare_ris_sets(expected, actual)
+    assert len(matched) == 1
+    assert len(missing) == len(extra) == 1  # "eegbased" vs "eeg based"
+
+    actual[0]["TI"] = "EEG-based, fatigue detection"
+    matched, missing, extra = compare_ris_sets(expected, actual)
+    assert len(matched) == 2 and not missing and not extra
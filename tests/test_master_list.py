@@ -0,0 +1,458 @@
+"""Unit tests for the pipeline master list — no Scopus login required."""
+
+import pandas as pd
+import pytest
+
+from pipeline.master_list import (
+    MasterList,
+    _frame_fingerprints,
+    _row_fingerprints,
+)
+from pipeline.models import Reference
+
+
+ROWS = [
+    {
+        "Title": "EEG-based Fatigue Detection: A Study!",
+        "Publication Year": "2024",
+        "Author": "Smith, John; Doe, Anne",
+        "DOI": "https://doi.org/10.1111/ALPHA.001",
+        "ISBN": "978-3-16 148410-0",
+        "scopus_eid": "2-s2.0-111",
+        "scopus_id": "111",
+        "pmid": "123456",
+    },
+    {
+        "Title": "Driver   drowsiness — a review",
+        "Publication Year": "2021-05-01",
+        "Author": "O'Brien, K.",
+        "DOI": "",
+        "scopus_id": "not-a-number",
+    },
+    {
+        # Same DOI as row 0 (first occurrence must win)
+        "Title": "Duplicate of alpha",
+        "DOI": "10.1111/alpha.001",
+    },
+    {
+        # Entirely empty row contributes nothing
+        "Title": None,
+        "DOI": None,
+    },
+]
+
+
+def _rowwise_cache(df: pd.DataFrame) -> dict[str, int]:
+    cache: dict[str, int] = {}
+    for idx, row in df.iterrows():
+        for fp in _row_fingerprints(row):
+            cache.setdefault(fp, int(idx))
+    return cache
+
+
+# ---------------------------------------------------------------------------
+# Vectorised fingerprint builder
+# ---------------------------------------------------------------------------
+
+def test_frame_fingerprints_match_rowwise():
+    df = pd.DataFrame(ROWS)
+    assert _frame_fingerprints(df) == _rowwise_cache(df)
+
+
+def test_frame_fingerprints_first_row_wins():
+    cache = _frame_fingerprints(pd.DataFrame(ROWS))
+    assert cache["doi:10.1111/alpha.001"] == 0
+
+
+def test_frame_fingerprints_skip_missing_values():
+    cache = _frame_fingerprints(pd.DataFrame(ROWS))
+    assert not any(fp.endswith(":nan") for fp in cache)
+    assert "scopus_id:not-a-number" not in cache
+
+
+def test_frame_fingerprints_missing_columns():
+    df = pd.DataFrame([{"Title": "Only a title", "Publication Year": "2020"}])
+    assert _frame_fingerprints(df) == {"title_year:only a title|2020": 0}
+
+
+def test_frame_fingerprints_empty_frame():
+    assert _frame_fingerprints(pd.DataFrame()) == {}
+
+
+# ---------------------------------------------------------------------------
+# MasterList lookups
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def master_csv(tmp_path):
+    path = tmp_path / "master.csv"
+    pd.DataFrame(ROWS).to_csv(path, index=False, encoding="utf-8-sig")
+    return path
+
+
+def test_load_and_find_by_doi(master_csv):
+    ml = MasterList.load(master_csv)
+    ref = Reference(title="Something else", doi="10.1111/alpha.001")
+    assert ml.find_row_index(ref) == 0
+
+
+def test_find_by_title_author(master_csv):
+    ml = MasterList.load(master_csv)
+    ref = Reference(title="Driver drowsiness — a review", authors=["O'Brien, K."])
+    assert ml.find_row_index(ref) == 1
+
+
+def test_add_or_update_extends_cache(master_csv):
+    ml = MasterList.load(master_csv)
+    ref = Reference(title="Brand new paper", year="2025", doi="10.5555/new")
+    assert ml.find_row_index(ref) is None
+    idx = ml.add_or_update(ref)
+    assert idx == len(ROWS)
+    assert ml.find_row_index(ref) == idx
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint index sidecar
+# ---------------------------------------------------------------------------
+
+def test_save_writes_sidecar(master_csv):
+    from pipeline.fingerprint_store import sidecar_path
+
+    ml = MasterList.load(master_csv)
+    ml.save()
+    assert sidecar_path(master_csv).exists()
+
+
+def test_unchanged_csv_loads_index_from_sidecar(master_csv, monkeypatch):
+    import pipeline.master_list as master_list_mod
+
+    ml = MasterList.load(master_csv)
+    expected = dict(ml._get_cache())
+    ml.save()
+
+    def _fail(df):
+        raise AssertionError("index should come from the sidecar")
+
+    monkeypatch.setattr(master_list_mod, "_frame_fingerprints", _fail)
+    reloaded = MasterList.load(master_csv)
+    assert reloaded._get_cache() == expected
+
+
+def test_sidecar_updated_incrementally_on_save(master_csv):
+    ml = MasterList.load(master_csv)
+    ml.save()
+
+    ml = MasterList.load(master_csv)
+    ref = Reference(title="Brand new paper", year="2025", doi="10.5555/new")
+    idx = ml.add_or_update(ref)
+    assert ml._fp_pending and "doi:10.5555/new" in ml._fp_pending
+    ml.save()
+    assert ml._fp_pending == {}
+
+    reloaded = MasterList.load(master_csv)
+    assert reloaded._index_store_current
+    assert reloaded.find_row_index(ref) == idx
+    cache = reloaded._get_cache()
+    for fp, i in _frame_fingerprints(reloaded._df).items():
+        assert cache[fp] == i
+
+
+def test_changed_csv_invalidates_sidecar(master_csv):
+    ml = MasterList.load(master_csv)
+    ml.save()
+
+    df = pd.read_csv(master_csv, dtype=str, encoding="utf-8-sig")
+    df.loc[len(df)] = {"Title": "Edited outside the pipeline", "DOI": "10.7777/ext"}
+    df.to_csv(master_csv, index=False, encoding="utf-8-sig")
+
+    reloaded = MasterList.load(master_csv)
+    assert not reloaded._index_store_current
+    ref = Reference(title="x", doi="10.7777/ext")
+    assert reloaded.find_row_index(ref) == len(ROWS)
+
+
+def test_index_sidecar_disabled(master_csv):
+    from pipeline.fingerprint_store import sidecar_path
+
+    ml = MasterList.load(master_csv, index_sidecar=False)
+    ml.save()
+    assert not sidecar_path(master_csv).exists()
+
+
+# ---------------------------------------------------------------------------
+# Columnar (Parquet / Feather) backend
+# ---------------------------------------------------------------------------
+
+FULL_ROW = dict(ROWS[0], **{"Abstract Note": "Long abstract text.", "Publisher": "ACME"})
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def columnar_master(request, tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "master.csv"
+    pd.DataFrame([FULL_ROW, ROWS[1]]).to_csv(csv_path, index=False, encoding="utf-8-sig")
+    path = tmp_path / f"master.{request.param}"
+    MasterList.load(csv_path).export(path)
+    return path
+
+
+def test_columnar_backend_without_pyarrow_says_what_to_install(tmp_path, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    ml = MasterList.load(tmp_path / "master.parquet", index_sidecar=False)
+    ml.add_or_update(Reference(title="Only", doi="10.5555/only"))
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        ml.save()
+
+
+def test_columnar_loads_only_core_columns(columnar_master):
+    ml = MasterList.load(columnar_master)
+    assert "Title" in ml._df.columns
+    assert "Abstract Note" not in ml._df.columns
+    assert "Abstract Note" in ml._deferred
+    ref = Reference(title="x", doi="10.1111/alpha.001")
+    assert ml.find_row_index(ref) == 0
+
+
+def test_columnar_save_round_trip_keeps_deferred_columns(columnar_master):
+    ml = MasterList.load(columnar_master)
+    ml.mark_parent_processed(
+        Reference(title="x", doi="10.1111/alpha.001"),
+        result_count=3, exported_count=1, timestamp="2026-01-01T00:00:00",
+    )
+    ml.add_or_update(Reference(title="New paper", year="2025", doi="10.5555/new"))
+    ml.save()
+
+    reloaded = MasterList.load(columnar_master)
+    full = reloaded._full_frame()
+    assert len(full) == 3
+    assert full.at[0, "Abstract Note"] == "Long abstract text."
+    assert full.at[0, "Publisher"] == "ACME"
+    assert full.at[0, "has_been_processed_for_children"] == "True"
+    assert full.at[2, "DOI"] == "10.5555/new"
+
+
+def test_columnar_update_does_not_clobber_deferred_column(columnar_master):
+    ml = MasterList.load(columnar_master)
+    ref = Reference(title="x", doi="10.1111/alpha.001", abstract="Scopus abstract")
+    ml.add_or_update(ref)
+    assert ml._df.at[0, "Abstract Note"] == "Long abstract text."
+
+
+def test_columnar_export_zotero_csv(columnar_master, tmp_path):
+    ml = MasterList.load(columnar_master)
+    out = ml.export(tmp_path / "zotero.csv")
+    df = pd.read_csv(out, dtype=str, encoding="utf-8-sig")
+    assert list(df.columns[:3]) == list(pd.DataFrame([FULL_ROW]).columns[:3])
+    assert df.at[0, "Abstract Note"] == "Long abstract text."
+    assert ml._path == columnar_master
+
+
+# ---------------------------------------------------------------------------
+# Bulk add / update
+# ---------------------------------------------------------------------------
+
+def _bulk_refs():
+    return [
+        # Matches master row 0 by DOI
+        Reference(record_id="r1", title="Alpha", doi="10.1111/alpha.001", query="q1"),
+        Reference(record_id="r2", title="New One", year="2025", doi="10.5555/one",
+                  authors=["Lee, A."]),
+        Reference(record_id="r3", title="New Two", year="2024", scopus_id="999"),
+        # Matches r2 within the batch; fills its empty abstract
+        Reference(record_id="r4", title="New One", year="2025", abstract="Filled in."),
+    ]
+
+
+def test_bulk_matches_sequential(master_csv):
+    seq = MasterList.load(master_csv, index_sidecar=False)
+    for ref in _bulk_refs():
+        seq.add_or_update(ref)
+
+    bulk = MasterList.load(master_csv, index_sidecar=False)
+    added, updated = bulk.bulk_add_or_update(_bulk_refs())
+
+    assert (added, updated) == (2, 2)
+    assert bulk.row_count == seq.row_count == len(ROWS) + 2
+    pd.testing.assert_frame_equal(
+        bulk._df.astype(str), seq._df[bulk._df.columns].astype(str)
+    )
+    assert bulk._get_cache() == seq._get_cache()
+
+
+@pytest.mark.parametrize("known", [False, True], ids=["new", "existing"])
+def test_bulk_matches_sequential_through_merged_identifiers(master_csv, known):
+    # A, then A plus a DOI, then a reference that only shares that DOI
+    chain = [
+        Reference(title="Chained Paper", year="2025", authors=["Zed, Q."]),
+        Reference(title="Chained Paper", year="2025", doi="10.7777/chain"),
+        Reference(title="Retitled in another export", doi="10.7777/chain"),
+    ]
+    seq = MasterList.load(master_csv, index_sidecar=False)
+    bulk = MasterList.load(master_csv, index_sidecar=False)
+    if known:
+        seq.add_or_update(chain[0])
+        bulk.add_or_update(chain[0])
+    for ref in chain:
+        seq.add_or_update(ref)
+
+    added, updated = bulk.bulk_add_or_update(chain)
+
+    assert bulk.row_count == seq.row_count == len(ROWS) + 1
+    assert (added, updated) == ((0, 3) if known else (1, 2))
+    pd.testing.assert_frame_equal(
+        bulk._df.astype(str), seq._df[bulk._df.columns].astype(str)
+    )
+    assert bulk._get_cache() == seq._get_cache()
+
+
+def test_bulk_new_rows_are_findable(master_csv):
+    ml = MasterList.load(master_csv)
+    ml.bulk_add_or_update(_bulk_refs())
+    assert ml.find_row_index(Reference(title="x", scopus_id="999")) == len(ROWS) + 1
+    assert ml._df.at[len(ROWS), "Abstract Note"] == "Filled in."
+
+
+def test_bulk_empty(master_csv):
+    ml = MasterList.load(master_csv)
+    assert ml.bulk_add_or_update([]) == (0, 0)
+    assert ml.row_count == len(ROWS)
+
+
+# ---------------------------------------------------------------------------
+# Append-only journal
+# ---------------------------------------------------------------------------
+
+def _journal_session(path):
+    ml = MasterList.load(path, journal=True)
+    ml.add_or_update(Reference(record_id="K1", title="Alpha", doi="10.1111/alpha.001"))
+    ml.mark_parent_processed(
+        Reference(title="x", doi="10.1111/alpha.001"),
+        result_count=7, exported_count=2, timestamp="2026-01-01T00:00:00",
+    )
+    ml.bulk_add_or_update([
+        Reference(record_id="N1", title="New One", year="2025", doi="10.5555/one"),
+        Reference(record_id="N2", title="New Two", year="2024", scopus_id="999"),
+    ])
+    return ml
+
+
+def test_journal_save_leaves_base_file_untouched(master_csv):
+    from pipeline.master_journal import journal_path
+
+    before = master_csv.read_bytes()
+    ml = _journal_session(master_csv)
+    ml.save()
+    assert master_csv.read_bytes() == before
+    lines = journal_path(master_csv).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3  # one update (row 0) + two additions
+
+
+def test_journal_update_keyed_by_record_id(master_csv):
+    import json
+    from pipeline.master_journal import journal_path
+
+    _journal_session(master_csv).save()
+    first = json.loads(journal_path(master_csv).read_text(encoding="utf-8").splitlines()[0])
+    assert first["op"] == "update"
+    # record_id was blank on disk, so the update is keyed by row position
+    assert first["row"] == 0
+    assert first["values"]["record_id"] == "K1"
+
+    ml = MasterList.load(master_csv, journal=True)
+    ml.mark_exported(Reference(title="x", doi="10.1111/alpha.001"))
+    ml.save()
+    last = json.loads(journal_path(master_csv).read_text(encoding="utf-8").splitlines()[-1])
+    assert last == {"op": "update", "record_id": "K1", "values": {"already_exported": "True"}}
+
+
+def test_journal_replay_matches_full_rewrite(master_csv, tmp_path):
+    plain = tmp_path / "plain.csv"
+    plain.write_bytes(master_csv.read_bytes())
+    _journal_session(master_csv).save()
+    ml_plain = _journal_session(plain)
+    ml_plain._journal_enabled = False
+    ml_plain.save()
+
+    replayed = MasterList.load(master_csv, journal=True)
+    rewritten = MasterList.load(plain)
+    assert replayed.row_count == rewritten.row_count == len(ROWS) + 2
+    # blank cells come back as "" or NaN depending on the path; compare as text
+    pd.testing.assert_frame_equal(
+        replayed._df.fillna("").astype(str),
+        rewritten._df[replayed._df.columns].fillna("").astype(str),
+    )
+
+
+def test_journal_accumulates_across_saves(master_csv):
+    _journal_session(master_csv).save()
+    ml = MasterList.load(master_csv, journal=True)
+    ml.add_or_update(Reference(record_id="N3", title="Third", year="2023", doi="10.5555/three"))
+    ml.save()
+
+    ml = MasterList.load(master_csv, journal=True)
+    assert ml.row_count == len(ROWS) + 3
+    assert ml.find_row_index(Reference(title="x", doi="10.5555/three")) == len(ROWS) + 2
+    assert ml.get_parent_processed_status(Reference(title="x", doi="10.1111/alpha.001"))
+
+
+def test_compact_folds_journal_into_base(master_csv):
+    from pipeline.master_journal import journal_path
+
+    _journal_session(master_csv).save()
+    ml = MasterList.load(master_csv, journal=True)
+    ml.compact()
+    assert not journal_path(master_csv).exists()
+
+    df = pd.read_csv(master_csv, dtype=str, encoding="utf-8-sig")
+    assert len(df) == len(ROWS) + 2
+    assert df.at[0, "children_result_count"] == "7"
+
+
+def test_journal_auto_compacts(master_csv):
+    from pipeline.master_journal import journal_path
+
+    ml = MasterList.load(master_csv, journal=True, journal_max_entries=2)
+    ml.bulk_add_or_update([
+        Reference(title=f"Paper {i}", year="2025", doi=f"10.5555/{i}") for i in range(3)
+    ])
+    ml.save()
+    assert not journal_path(master_csv).exists()
+    assert len(pd.read_csv(master_csv, dtype=str, encoding="utf-8-sig")) == len(ROWS) + 3
+
+
+def test_journal_keeps_sidecar_current(master_csv):
+    _journal_session(master_csv).save()
+    ml = MasterList.load(master_csv, journal=True)
+    assert ml._index_store_current
+    cache = ml._get_cache()
+    for fp, idx in _frame_fingerprints(ml._df).items():
+        assert cache[fp] == idx
+
+
+def test_journal_save_hashes_only_the_journal(master_csv, monkeypatch):
+    import pipeline.fingerprint_store as fingerprint_store
+    from pipeline.master_journal import journal_path
+
+    _journal_session(master_csv).save()
+    hashed = []
+    real_sha = fingerprint_store.file_sha256
+    monkeypatch.setattr(fingerprint_store, "file_sha256",
+                        lambda path: hashed.append(path.name) or real_sha(path))
+
+    ml = MasterList.load(master_csv, journal=True)
+    ml.add_or_update(Reference(title="Later", year="2025", doi="10.5555/later"))
+    ml.save()
+    assert hashed == [journal_path(master_csv).name]  # the master list is not re-read
+    assert MasterList.load(master_csv, journal=True)._index_store_current
+
+
+def test_reuse_existing_false_rewrites_base(master_csv):
+    from pipeline.master_journal import journal_path
+
+    ml = MasterList.load(master_csv, reuse_existing=False, journal=True)
+    ml.add_or_update(Reference(title="Only", doi="10.5555/only"))
+    ml.save()
+    assert not journal_path(master_csv).exists()
+    assert len(pd.read_csv(master_csv, dtype=str, encoding="utf-8-sig")) == 1
@@ -6,6 +6,8 @@ from pathlib import Path
 import pytest
 
 from scopus_automation.ris import (
+    RISWriter,
+    iter_ris_file,
     parse_ris_file,
     write_ris_file,
     compare_ris_sets,
@@ -96,6 +98,25 @@ def test_parse_real_test_file():
         assert "TY" in e or "type_of_reference" in e
 
 
+def test_iter_ris_file_is_lazy(tmp_path):
+    ris_file = tmp_path / "sample.ris"
+    ris_file.write_text(SAMPLE_RIS, encoding="utf-8")
+    it = iter_ris_file(ris_file)
+    assert iter(it) is it
+    first = next(it)
+    assert first["TI"] == "A study of EEG fatigue detection"
+    assert [e["TY"] for e in it] == ["CONF"]
+
+
+def test_iter_ris_file_matches_text_parser(tmp_path):
+    # CRLF line endings, a U+2028 inside a field, and no trailing ER
+    text = SAMPLE_RIS + "TY  - JOUR\nAB  - first\u2028second\nTI  - Unterminated\n"
+    ris_file = tmp_path / "sample.ris"
+    ris_file.write_bytes(text.replace("\n", "\r\n").encode("utf-8"))
+    assert list(iter_ris_file(ris_file)) == _parse_ris_manual(text)
+    assert parse_ris_file(ris_file) == _parse_ris_manual(text)
+
+
 # ---------------------------------------------------------------------------
 # write_ris_file tests
 # ---------------------------------------------------------------------------
@@ -118,6 +139,58 @@ def test_write_preserves_doi(tmp_path):
     assert any("10.1234" in str(d) for d in dois)
 
 
+def test_write_format_is_unchanged(tmp_path):
+    out = tmp_path / "out.ris"
+    write_ris_file([{"TY": "JOUR", "AU": ["A", "B"], "AB": ""}, {"TY": "BOOK"}], out)
+    assert out.read_text(encoding="utf-8") == (
+        "TY  - JOUR\nAU  - A\nAU  - B\nAB  - \nER  - \n\nTY  - BOOK\nER  - \n"
+    )
+
+
+def test_write_streams_generator_and_gzip(tmp_path):
+    import gzip
+
+    entries = _parse_ris_manual(SAMPLE_RIS)
+    out = tmp_path / "out.ris.gz"
+    assert write_ris_file((e for e in entries), out) == len(entries)
+    with gzip.open(out, "rt", encoding="utf-8") as fh:
+        assert fh.read().startswith("TY  - JOUR\n")
+    assert list(iter_ris_file(out)) == entries
+
+
+def test_writer_skip_empty(tmp_path):
+    out = tmp_path / "out.ris"
+    with RISWriter(out, skip_empty=True) as writer:
+        writer.write({"TY": "JOUR", "DO": "", "TI": "T"})
+    assert writer.count == 1
+    assert out.read_text(encoding="utf-8") == "TY  - JOUR\nTI  - T\nER  - \n"
+
+
+def test_export_to_ris_streams_references(tmp_path):
+    from pipeline.models import Reference
+    from pipeline.ris_exporter import export_to_ris
+
+    refs = (Reference(title=f"Paper {i}", year="2024", doi=f"10.1/{i}") for i in range(3))
+    out = tmp_path / "export.ris.gz"
+    export_to_ris(refs, out)
+    assert [e["DO"] for e in iter_ris_file(out)] == ["10.1/0", "10.1/1", "10.1/2"]
+
+
+def test_reference_keeps_ris_entry_packed_and_exports_it_whole(tmp_path):
+    import pickle
+
+    from pipeline.models import PackedRaw, Reference
+    from pipeline.ris_exporter import _reference_to_ris_entry
+
+    entry = _parse_ris_manual(SAMPLE_RIS)[0]
+    ref = Reference.from_ris_entry(entry, source_file="x.ris")
+    assert isinstance(ref._raw, PackedRaw) and not hasattr(ref, "__dict__")
+    assert ref.raw_entry() == entry and list(ref.raw_entry()) == list(entry)
+    assert _reference_to_ris_entry(ref) == entry
+    # survives the trip to a process-pool worker
+    assert pickle.loads(pickle.dumps(ref)).raw_entry() == entry
+
+
 # ---------------------------------------------------------------------------
 # compare_ris_sets tests
 # ---------------------------------------------------------------------------
@@ -118,6 +118,79 @@ class TestSearchRisFixture:
             )
 
 
+class TestWaitForDownload:
+    """Download completion detection against a simulated Chrome download."""
+
+    @staticmethod
+    def _later(delay, fn):
+        import threading
+        t = threading.Timer(delay, fn)
+        t.start()
+        return t
+
+    def test_resolves_on_crdownload_rename(self, tmp_path):
+        import time
+        from scopus_automation.browser import wait_for_download
+
+        partial = tmp_path / "scopus_export.ris.crdownload"
+        partial.write_text("TY  - JOUR\n")
+        self._later(0.3, lambda: partial.rename(tmp_path / "scopus_export.ris"))
+
+        t0 = time.monotonic()
+        got = wait_for_download(tmp_path, timeout_sec=5, min_mtime=time.time() - 1)
+        assert got == tmp_path / "scopus_export.ris"
+        assert time.monotonic() - t0 < 0.9  # well under the old 1 s poll step
+
+    def test_waits_for_stable_size(self, tmp_path):
+        import time
+        from scopus_automation.browser import wait_for_download
+
+        target = tmp_path / "direct.ris"
+
+        def _grow():
+            with target.open("a") as fh:
+                for _ in range(6):
+                    fh.write("TI  - x\n")
+                    fh.flush()
+                    time.sleep(0.1)
+
+        writer = self._later(0, _grow)
+        got = wait_for_download(tmp_path, timeout_sec=5)
+        size_on_return = got.stat().st_size  # before the writer is joined
+        writer.join()
+        assert got == target
+        assert size_on_return == len("TI  - x\n") * 6
+
+    def test_old_files_ignored_until_timeout(self, tmp_path):
+        import os
+        import time
+        from scopus_automation.browser import wait_for_download
+
+        old = tmp_path / "previous.ris"
+        old.write_text("TY  - JOUR\n")
+        os.utime(old, (time.time() - 60, time.time() - 60))
+        assert wait_for_download(tmp_path, timeout_sec=0.5, min_mtime=time.time() - 1) is None
+
+    def test_file_events_wake_the_wait(self, tmp_path, monkeypatch):
+        import time
+        import scopus_automation.browser as browser
+
+        def _fake_watch(download_dir, wake, renamed):
+            def _chrome_finishes():
+                final = download_dir / "evented.ris"
+                final.write_text("TY  - JOUR\n")
+                renamed.add(str(final))
+                wake.set()
+            timer = self._later(0.2, _chrome_finishes)
+            return timer.cancel
+
+        monkeypatch.setattr(browser, "_watch_directory", _fake_watch)
+        t0 = time.monotonic()
+        assert browser.wait_for_download(tmp_path, timeout_sec=5) == tmp_path / "evented.ris"
+        # woken by the event, not by the 1 s safety-net re-check
+        assert time.monotonic() - t0 < 0.8
+
+
 # ===========================================================================
 # Feature 2 — cited_by helpers
 # ===========================================================================
@@ -0,0 +1,97 @@
+"""Unit tests for the condition waits and step timers — fake drivers, no Chrome required."""
+
+import time
+
+import pytest
+
+import scopus_automation.search_export as se
+from scopus_automation import waits
+from scopus_automation.waits import StepTimer, WaitProfile, total_step_timings, wait_until
+
+
+@pytest.fixture(autouse=True)
+def fast_profile(monkeypatch):
+    monkeypatch.setattr(waits, "WAITS", WaitProfile(
+        poll_sec=0.01, results_poll_sec=0.01, results_sec=0.5, modal_sec=0.5,
+    ))
+
+
+def test_wait_until_returns_as_soon_as_condition_holds():
+    ready_at = time.monotonic() + 0.05
+    t0 = time.monotonic()
+    assert wait_until(lambda: time.monotonic() >= ready_at and "ok", timeout=5) == "ok"
+    assert time.monotonic() - t0 < 1
+
+
+def test_wait_until_treats_errors_as_not_ready_and_times_out():
+    calls = []
+
+    def _flaky():
+        calls.append(1)
+        raise RuntimeError("stale element")
+
+    assert wait_until(_flaky, timeout=0.05) is None
+    assert len(calls) >= 2
+
+
+def test_step_timer_accumulates_and_totals():
+    timer = StepTimer()
+    for _ in range(2):
+        with timer.step("navigate"):
+            time.sleep(0.01)
+    with pytest.raises(ValueError):
+        with timer.step("export"):
+            raise ValueError
+    assert list(timer.as_dict()) == ["navigate", "export"]
+    assert timer.seconds["navigate"] >= 0.02
+
+    rows = [{"step_timings": {"navigate": 1.0, "results": 2.0}},
+            {"error": "boom"},
+            {"step_timings": {"navigate": 0.5}}]
+    assert total_step_timings(rows) == {"navigate": 1.5, "results": 2.0}
+
+
+class ResultsDriver:
+    """Results page whose count appears after a few reloads of page_source."""
+
+    current_url = "https://www.scopus.com/results/results.uri"
+    title = "Scopus results"
+
+    def __init__(self, polls_until_ready: int) -> None:
+        self.polls = 0
+        self.polls_until_ready = polls_until_ready
+
+    @property
+    def page_source(self) -> str:
+        self.polls += 1
+        return "1,234 documents found" if self.polls > self.polls_until_ready else "Loading"
+
+
+def test_wait_for_results_polls_until_count_shows():
+    driver = ResultsDriver(polls_until_ready=3)
+    assert se._wait_for_results(driver) == 1234
+    assert driver.polls == 4
+
+
+def test_export_modal_wait_ends_when_download_starts(tmp_path, monkeypatch):
+    monkeypatch.setattr(se, "_find_export_modal", lambda driver: None)
+    since = time.time() - 1
+    (tmp_path / "scopus.ris.crdownload").write_text("")
+    t0 = time.monotonic()
+    assert se._wait_for_export_modal(None, download_dir=tmp_path, since=since) is False
+    assert time.monotonic() - t0 < waits.WAITS.modal_sec
+
+
+def test_export_modal_wait_detects_modal(monkeypatch):
+    seen = iter([None, None, object()])
+    monkeypatch.setattr(se, "_find_export_modal", lambda driver: next(seen))
+    assert se._wait_for_export_modal(None) is True
+
+
+def test_wait_for_results_stops_at_empty_result_page():
+    class EmptyResults(ResultsDriver):
+        page_source = "No documents were found for this search"
+
+    t0 = time.monotonic()
+    assert se._wait_for_results(EmptyResults(0)) == 0
+    assert time.monotonic() - t0 < waits.WAITS.results_sec
@@ -0,0 +1,101 @@
+"""Unit tests for year-sliced export of over-cap searches — fake Scopus, no Chrome required."""
+
+import re
+import threading
+
+import pytest
+
+import scopus_automation.cited_by as cited_by
+import scopus_automation.year_slices as year_slices
+from scopus_automation.config import ScopusConfig
+from scopus_automation.driver_pool import DriverPool
+from scopus_automation.ris import parse_ris_file, write_ris_file
+from scopus_automation.year_slices import YearSlice, export_year_sliced
+
+LINK = "https://www.scopus.com/pages/publications/85000000001"
+
+# citing papers per publication year: skewed towards recent years like real citations
+CORPUS = [
+    {"TY": "JOUR", "TI": f"Paper {year}-{n}", "PY": str(year), "DO": f"10.1/{year}.{n}"}
+    for year in range(1975, 2026)
+    for n in range(max(1, (year - 1970) // 3))
+]
+
+
+class FakeScopus:
+    """search_and_export stand-in that applies PUBYEAR clauses and the export cap."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.drivers: set[str] = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, driver, query, config, output_dir=None, index_csv=None,
+                 download_dir=None, max_results=None):
+        with self.lock:
+            self.queries.append(query)
+            self.drivers.add(getattr(driver, "name", "main"))
+        lo = max((int(y) + 1 for y in re.findall(r"PUBYEAR > (\d+)", query)), default=0)
+        hi = min((int(y) - 1 for y in re.findall(r"PUBYEAR < (\d+)", query)), default=9999)
+        hits = [e for e in CORPUS if lo <= int(e["PY"]) <= hi]
+        if not hits:
+            return {"query": query, "result_count": 0, "ris_file": None, "error": "No results"}
+        if max_results is not None and len(hits) > max_results:
+            return {"query": query, "result_count": len(hits), "ris_file": None,
+                    "error": "Over export cap", "over_cap": True}
+        ris = output_dir / "export.ris"
+        write_ris_file(hits[:config.export_cap], ris)
+        return {"query": query, "result_count": len(hits), "ris_file": str(ris)}
+
+
+@pytest.fixture
+def scopus(monkeypatch):
+    fake = FakeScopus()
+    monkeypatch.setattr(year_slices, "search_and_export", fake)
+    monkeypatch.setattr(cited_by, "search_and_export", fake)
+    return fake
+
+
+def test_year_slice_queries_and_split():
+    whole = YearSlice()
+    left, right = whole.split()
+    assert left.start is None and right.end is None and right.start == left.end + 1
+    assert YearSlice(2001, 2003).query("REFEID(x)") == "REFEID(x) AND PUBYEAR > 2000 AND PUBYEAR < 2004"
+    assert not YearSlice(2020, 2020).can_split()
+
+
+def test_over_cap_cited_by_is_exported_in_slices(tmp_path, scopus, fake_driver):
+    cfg = ScopusConfig(export_cap=40)
+    result = cited_by.download_cited_by(fake_driver, LINK, cfg, tmp_path)
+
+    assert result["cited_by_downloaded"], result["cited_by_error"]
+    assert result["cited_by_result_count"] == len(CORPUS)
+    merged = parse_ris_file(tmp_path / "85000000001_cited_by.ris")
+    assert sorted(e["TI"] for e in merged) == sorted(e["TI"] for e in CORPUS)
+    # every exported slice fitted under the cap, and nothing is left behind
+    assert list(tmp_path.iterdir()) == [tmp_path / "85000000001_cited_by.ris"]
+    assert len(scopus.queries) > 3
+
+
+def test_slices_run_on_every_pool_driver_with_same_output(tmp_path, scopus, fake_driver,
+                                                          driver_factory):
+    cfg = ScopusConfig(export_cap=40)
+    serial = tmp_path / "serial.ris"
+    export_year_sliced("REFEID(x)", cfg, serial, driver=fake_driver,
+                       download_dir=tmp_path / "dl")
+
+    scopus.drivers.clear()
+    pooled = tmp_path / "pooled.ris"
+    with DriverPool(cfg, tmp_path / "raw", size=3, driver_factory=driver_factory) as pool:
+        total, n_slices = export_year_sliced("REFEID(x)", cfg, pooled, pool=pool)
+
+    assert total == len(CORPUS) and n_slices > 1
+    assert scopus.drivers == {"chrome0", "chrome1", "chrome2"}
+    assert pooled.read_text() == serial.read_text()
+
+
+def test_under_cap_searches_are_not_sliced(tmp_path, scopus, fake_driver):
+    cfg = ScopusConfig(export_cap=len(CORPUS))
+    result = cited_by.download_cited_by(fake_driver, LINK, cfg, tmp_path)
+    assert result["cited_by_result_count"] == len(CORPUS)
+    assert scopus.queries == ["REFEID(2-s2.0-85000000001)"]
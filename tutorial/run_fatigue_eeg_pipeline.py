@@ -18,6 +18,8 @@ Usage:
   python tutorial/run_fatigue_eeg_pipeline.py --dry-run    # no browser
   python tutorial/run_fatigue_eeg_pipeline.py --force      # re-download all
   python tutorial/run_fatigue_eeg_pipeline.py --max-gen 3  # stop after gen 3
+  python tutorial/run_fatigue_eeg_pipeline.py --dedup-workers 4  # fingerprint on 4 processes
+  python tutorial/run_fatigue_eeg_pipeline.py --browsers 3  # 3 Chrome windows for citation expansion
 """
 
 from __future__ import annotations
@@ -346,7 +348,7 @@ def _fix_scopus_ids(refs: list) -> int:
     for ref in refs:
         if ref.scopus_id:
             continue
-        raw = ref._raw or {}
+        raw = ref.raw_entry()
         ur = ""
         ur_val = raw.get("UR") or raw.get("ur") or ""
         if isinstance(ur_val, list):
@@ -375,7 +377,7 @@ def run_keyword_phase(
 ) -> tuple[list[Reference], list[dict]]:
     """Run all 25 keyword searches. Returns (new_references, per_keyword_status)."""
     from scopus_automation.browser import set_download_dir
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.ris import iter_ris_file
     from scopus_automation.search_export import search_and_export
 
     raw_dir = output_dir / "keyword_raw"
@@ -401,15 +403,14 @@ def run_keyword_phase(
         if resume and not force and ris_path.exists() and ris_path.stat().st_size > 10:
             # Resume: parse existing file without re-querying Scopus
             print(f"\n  [{i:2d}/{len(KEYWORDS)}] RESUME: {slug[:55]}")
-            raw_entries = parse_ris_file(str(ris_path))
             refs = [
                 Reference.from_ris_entry(e, source_file=str(ris_path),
                                          query=keyword, query_keyword=keyword)
-                for e in raw_entries
+                for e in iter_ris_file(ris_path)
             ]
             _fix_scopus_ids(refs)
             all_refs.extend(refs)
-            n = len(raw_entries)
+            n = len(refs)
             print(f"           → {n} results loaded from cache.")
             per_keyword_status.append({
                 "index": i, "slug": slug, "status": "resumed",
@@ -436,11 +437,10 @@ def run_keyword_phase(
             shutil.copy2(downloaded_ris, ris_path)
 
         if ris_path.exists() and ris_path.stat().st_size > 10:
-            raw_entries = parse_ris_file(str(ris_path))
             refs = [
                 Reference.from_ris_entry(e, source_file=str(ris_path),
                                          query=keyword, query_keyword=keyword)
-                for e in raw_entries
+                for e in iter_ris_file(ris_path)
             ]
             _fix_scopus_ids(refs)
             all_refs.extend(refs)
@@ -473,21 +473,28 @@ def run_one_generation(
     gen_num: int,
     output_dir: Path,
     force: bool = False,
+    pool=None,
 ) -> tuple[list[Reference], list[dict], list[dict]]:
     """Forward-citation search for all parents.
 
+    With a started ``DriverPool`` as *pool*, parents are queried on all of
+    its Chrome instances (*driver* is then unused); results are still
+    collected in parent order.
+
     Returns:
       (all_children_raw, per_paper_status, parent_child_relations)
     """
-    from scopus_automation.browser import set_download_dir
     from scopus_automation.cited_by import download_cited_by
-    from scopus_automation.ris import parse_ris_file
+    from scopus_automation.driver_pool import DriverPool
+    from scopus_automation.ris import iter_ris_file
 
     raw_dir = output_dir / f"gen{gen_num}_cited_by_raw"
     raw_dir.mkdir(parents=True, exist_ok=True)
 
     # Redirect Chrome downloads to this generation's raw directory
-    set_download_dir(driver, raw_dir)
+    if pool is None:
+        pool = DriverPool(scopus_cfg, raw_dir, primary=driver).start()
+    pool.retarget(raw_dir)
     scopus_cfg.output_dir = str(raw_dir)
 
     all_children: list[Reference] = []
@@ -505,25 +512,29 @@ def run_one_generation(
         print(f"  Skipped (no Scopus ID): {len(no_id)}")
     print(f"{'=' * 60}")
 
-    for i, parent in enumerate(queryable, 1):
-        url = f"https://www.scopus.com/pages/publications/{parent.scopus_id}"
-        print(f"\n  [{i:3d}/{len(queryable)}] {parent.title[:65]}")
-        print(f"          EID: {parent.scopus_eid or '—'}")
-
+    def _query_parent(worker, parent: Reference) -> dict:
         result = download_cited_by(
-            driver=driver,
-            paper_link=url,
+            driver=worker.driver,
+            paper_link=f"https://www.scopus.com/pages/publications/{parent.scopus_id}",
             config=scopus_cfg,
             output_dir=raw_dir,
             force=force,
+            download_dir=worker.download_dir,
         )
+        if result.get("cited_by_error"):
+            worker.errors += 1
+        return result
+
+    results = pool.map(_query_parent, queryable)
+    for i, (parent, result) in enumerate(zip(queryable, results), 1):
+        print(f"\n  [{i:3d}/{len(queryable)}] {parent.title[:65]}")
+        print(f"          EID: {parent.scopus_eid or '—'}")
 
         n = result.get("cited_by_result_count", 0)
         ris_path = result.get("cited_by_ris_file", "")
         err = result.get("cited_by_error", "")
 
         if ris_path and Path(ris_path).exists():
-            raw_entries = parse_ris_file(ris_path)
             children = [
                 Reference.from_ris_entry(
                     e,
@@ -531,7 +542,7 @@ def run_one_generation(
                     parent=parent,
                     query=f"REFEID({parent.scopus_eid})",
                 )
-                for e in raw_entries
+                for e in iter_ris_file(ris_path)
             ]
             _fix_scopus_ids(children)
             all_children.extend(children)
@@ -710,6 +721,12 @@ def main() -> None:
                         help="Re-download all Scopus queries (no resume)")
     parser.add_argument("--max-gen", type=int, default=5,
                         help="Maximum generations of citation expansion (default 5)")
+    parser.add_argument("--dedup-workers", type=int, default=1,
+                        help="Processes used to fingerprint large dedup batches "
+                             "(default 1 = single process)")
+    parser.add_argument("--browsers", type=int, default=1,
+                        help="Chrome instances querying cited-by in parallel "
+                             "(default 1; extra ones use cloned Selenium profiles)")
     parser.add_argument("--verbose", action="store_true",
                         help="Enable DEBUG logging")
     args = parser.parse_args()
@@ -757,6 +774,10 @@ def main() -> None:
     driver = build_driver(scopus_cfg, download_dir=initial_dl_dir)
     set_download_dir(driver, initial_dl_dir)
 
+    # Extra Chrome instances for citation expansion are opened on first use
+    from scopus_automation.driver_pool import DriverPool
+    pool = DriverPool(scopus_cfg, initial_dl_dir, size=args.browsers, primary=driver)
+
     # ── Tracking state ──────────────────────────────────────────────────────
     all_new_refs: list[Reference] = []          # all new refs across all gens
     all_parent_child: list[dict] = []           # all parent-child relations
@@ -779,7 +800,7 @@ def main() -> None:
 
         # Deduplicate Gen 0 against master list
         print(f"\nDeduplicating Gen 0 ({len(kw_raw_refs)} records)...")
-        dedup0 = deduplicate_references(kw_raw_refs, ml)
+        dedup0 = deduplicate_references(kw_raw_refs, ml, workers=args.dedup_workers)
         gen0_new = dedup0.new_references
         print(f"  New (not in Zotero/master): {dedup0.new_count}")
         print(f"  Duplicates removed:         {dedup0.duplicate_count}")
@@ -790,7 +811,8 @@ def main() -> None:
             # First run: add Gen 0 to master list and write CSV
             for ref in gen0_new:
                 ref.reference_role = "child"
-                ml.add_or_update(ref)
+            ml.bulk_add_or_update(gen0_new)
+            for ref in gen0_new:
                 ml.mark_exported(ref)
             ml.save()
             for ref in gen0_new:
@@ -847,6 +869,7 @@ def main() -> None:
                 driver, scopus_cfg, ml,
                 current_gen_papers, gen_num, OUTPUT_DIR,
                 force=args.force,
+                pool=pool.start(),
             )
 
             all_citation_status.extend(cite_status)
@@ -864,13 +887,13 @@ def main() -> None:
 
             # Deduplicate against master list
             print(f"  Deduplicating {len(children_raw)} records...")
-            dedup_n = deduplicate_references(children_raw, ml)
+            dedup_n = deduplicate_references(children_raw, ml, workers=args.dedup_workers)
             gen_new = dedup_n.new_references
             print(f"  New: {dedup_n.new_count}   Duplicates: {dedup_n.duplicate_count}")
 
             # Add to master list
+            ml.bulk_add_or_update(gen_new)
             for ref in gen_new:
-                ml.add_or_update(ref)
                 ml.mark_exported(ref)
             ml.save()
 
@@ -908,6 +931,7 @@ def main() -> None:
         errors.append(msg)
     finally:
         try:
+            pool.close()  # quits the extra instances; driver is ours
             driver.quit()
             print("\n  Browser closed.")
         except Exception: